@@ -10,7 +10,7 @@ from pathlib import Path
 from fastapi import Request  # type: ignore[import-untyped]
 
 from time_audit.core.config import ConfigManager
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage, open_configured_storage
 from time_audit.core.tracker import TimeTracker
 
 
@@ -36,14 +36,14 @@ def get_config(request: Request = None) -> ConfigManager:  # type: ignore[assign
     return ConfigManager()
 
 
-def get_storage(request: Request = None) -> StorageManager:  # type: ignore[assignment,misc]
+def get_storage(request: Request = None) -> Storage:  # type: ignore[assignment,misc]
     """Get storage instance.
 
     Args:
         request: FastAPI request object (injected) or None for direct call
 
     Returns:
-        StorageManager instance
+        Storage backend selected by advanced.storage_backend
 
     Note:
         This is a dependency function for FastAPI endpoints.
@@ -52,7 +52,7 @@ def get_storage(request: Request = None) -> StorageManager:  # type: ignore[assi
     """
     config = get_config(request)
     data_dir = Path(config.get("general.data_dir", "~/.time-audit/data")).expanduser()
-    return StorageManager(data_dir)
+    return open_configured_storage(data_dir, config)
 
 
 def get_tracker(request: Request = None) -> TimeTracker:  # type: ignore[assignment,misc]
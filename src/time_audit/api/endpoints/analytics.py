@@ -14,7 +14,7 @@ from time_audit.api.auth import verify_token
 from time_audit.api.dependencies import get_storage
 from time_audit.api.models import ProductivityMetrics, TrendAnalysis, TrendData
 from time_audit.core.models import Entry
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 
 router = APIRouter()
 
@@ -77,7 +77,7 @@ def _filter_entries_by_date(
 @router.get("/productivity", response_model=ProductivityMetrics)
 async def get_productivity_metrics(
     period: str = Query("week", regex="^(today|yesterday|week|month|year)$"),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict = Depends(verify_token),  # type: ignore[type-arg]
 ) -> ProductivityMetrics:
     """Get productivity metrics for a given period.
@@ -171,7 +171,7 @@ async def get_productivity_metrics(
 async def get_trend_analysis(
     metric: str = Query("duration", regex="^(duration|entries|productivity)$"),
     period: str = Query("month", regex="^(week|month|year)$"),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict = Depends(verify_token),  # type: ignore[type-arg]
 ) -> TrendAnalysis:
     """Analyze trends in time tracking data.
@@ -15,14 +15,14 @@ from time_audit.api.models import (
     UpdateCategoryRequest,
 )
 from time_audit.core.models import Category
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[CategoryResponse])
 async def list_categories(
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> list[CategoryResponse]:
     """List all categories.
@@ -51,7 +51,7 @@ async def list_categories(
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get_category(
     category_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> CategoryResponse:
     """Get a specific category by ID.
@@ -82,7 +82,7 @@ async def get_category(
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     request: CreateCategoryRequest,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> CategoryResponse:
     """Create a new category.
@@ -127,7 +127,7 @@ async def create_category(
 async def update_category(
     category_id: str,
     request: UpdateCategoryRequest,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> CategoryResponse:
     """Update an existing category.
@@ -171,7 +171,7 @@ async def update_category(
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> None:
     """Delete a category.
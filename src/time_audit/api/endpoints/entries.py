@@ -19,7 +19,7 @@ from time_audit.api.models import (
     UpdateEntryRequest,
 )
 from time_audit.core.models import Entry
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 from time_audit.core.tracker import TimeTracker
 
 router = APIRouter()
@@ -33,7 +33,7 @@ async def list_entries(
     category: Optional[str] = Query(None, description="Filter by category"),
     from_date: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     to_date: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> list[EntryResponse]:
     """List time entries with pagination and filtering.
@@ -86,7 +86,7 @@ async def list_entries(
 
 @router.get("/current", response_model=Optional[EntryResponse])
 async def get_current_entry(
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> Optional[EntryResponse]:
     """Get currently tracking entry.
@@ -200,7 +200,7 @@ async def stop_tracking(
 @router.get("/{entry_id}", response_model=EntryResponse)
 async def get_entry(
     entry_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> EntryResponse:
     """Get a specific entry by ID.
@@ -231,7 +231,7 @@ async def get_entry(
 @router.post("/", response_model=EntryResponse, status_code=status.HTTP_201_CREATED)
 async def create_entry(
     request: CreateEntryRequest,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> EntryResponse:
     """Create a manual time entry.
@@ -280,7 +280,7 @@ async def create_entry(
 async def update_entry(
     entry_id: str,
     request: UpdateEntryRequest,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> EntryResponse:
     """Update an existing entry.
@@ -337,7 +337,7 @@ async def update_entry(
 @router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_entry(
     entry_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> None:
     """Delete an entry.
@@ -16,7 +16,7 @@ from time_audit.api.models import (
     UpdateProjectRequest,
 )
 from time_audit.core.models import Project
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 
 router = APIRouter()
 
@@ -33,7 +33,7 @@ class ProjectStats(BaseModel):
 
 @router.get("/", response_model=list[ProjectResponse])
 async def list_projects(
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> list[ProjectResponse]:
     """List all projects.
@@ -64,7 +64,7 @@ async def list_projects(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> ProjectResponse:
     """Get a specific project by ID.
@@ -95,7 +95,7 @@ async def get_project(
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     request: CreateProjectRequest,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> ProjectResponse:
     """Create a new project.
@@ -142,7 +142,7 @@ async def create_project(
 async def update_project(
     project_id: str,
     request: UpdateProjectRequest,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> ProjectResponse:
     """Update an existing project.
@@ -190,7 +190,7 @@ async def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> None:
     """Delete a project.
@@ -219,7 +219,7 @@ async def delete_project(
 @router.get("/{project_id}/stats", response_model=ProjectStats)
 async def get_project_stats(
     project_id: str,
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict[str, Any] = Depends(verify_token),
 ) -> ProjectStats:
     """Get statistics for a project.
@@ -21,7 +21,7 @@ from time_audit.api.models import (
     TimelineReportResponse,
 )
 from time_audit.core.models import Entry
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 
 router = APIRouter()
 
@@ -186,7 +186,7 @@ async def get_summary_report(
     to_date: Optional[str] = Query(None, description="End date (ISO format)"),
     project: Optional[str] = Query(None, description="Filter by project"),
     category: Optional[str] = Query(None, description="Filter by category"),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict = Depends(verify_token),  # type: ignore[type-arg]
 ) -> SummaryReportResponse:
     """Get summary report with project and category breakdowns.
@@ -240,7 +240,7 @@ async def get_timeline_report(
     from_date: Optional[str] = Query(None, description="Start date (ISO format)"),
     to_date: Optional[str] = Query(None, description="End date (ISO format)"),
     granularity: str = Query("daily", regex="^(hourly|daily|weekly)$"),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict = Depends(verify_token),  # type: ignore[type-arg]
 ) -> TimelineReportResponse:
     """Get timeline report showing activity over time.
@@ -325,7 +325,7 @@ async def get_breakdown_report(
     period: Optional[str] = Query(None, regex="^(today|yesterday|week|month|year)$"),
     from_date: Optional[str] = Query(None, description="Start date (ISO format)"),
     to_date: Optional[str] = Query(None, description="End date (ISO format)"),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
     _: dict = Depends(verify_token),  # type: ignore[type-arg]
 ) -> BreakdownReportResponse:
     """Get breakdown report by project or category.
@@ -13,7 +13,7 @@ from time_audit import __version__
 from time_audit.api.dependencies import get_config, get_storage
 from time_audit.api.models import HealthResponse, StatusResponse
 from time_audit.core.config import ConfigManager
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 
 router = APIRouter()
 
@@ -50,7 +50,7 @@ async def health_check() -> HealthResponse:
 @router.get("/status", response_model=StatusResponse)
 async def get_status(
     config: ConfigManager = Depends(get_config),
-    storage: StorageManager = Depends(get_storage),
+    storage: Storage = Depends(get_storage),
 ) -> StatusResponse:
     """Get system status.
 
@@ -1,7 +1,7 @@
 """Idle time detection for Time Audit."""
 
 import platform
-import time
+import threading
 from datetime import datetime, timedelta
 from typing import Callable, Optional
 
@@ -28,6 +28,7 @@ class IdleDetector:
         self._is_idle = False
         self._idle_start: Optional[datetime] = None
         self._running = False
+        self._stop_event = threading.Event()
         self._system = platform.system()
 
     def get_idle_time(self) -> int:
@@ -149,6 +150,9 @@ class IdleDetector:
     def start_monitoring(self, check_interval: int = 5) -> None:
         """Start monitoring idle state.
 
+        While the user is active, the next check is scheduled for the earliest
+        moment the threshold could be crossed rather than every check_interval.
+
         Args:
             check_interval: How often to check idle state (seconds)
 
@@ -156,13 +160,14 @@ class IdleDetector:
             This is a blocking call. Run in a separate thread for background monitoring.
         """
         self._running = True
+        self._stop_event.clear()
         while self._running:
-            is_idle = self.check_idle()
+            idle_time = self.get_idle_time()
+            is_idle = idle_time >= self.threshold
 
             if is_idle and not self._is_idle:
                 # Transition to idle
                 self._is_idle = True
-                idle_time = self.get_idle_time()
                 self._idle_start = datetime.now() - timedelta(seconds=idle_time)
                 if self.on_idle:
                     self.on_idle(idle_time)
@@ -174,11 +179,28 @@ class IdleDetector:
                     self.on_active()
                 self._idle_start = None
 
-            time.sleep(check_interval)
+            self._stop_event.wait(self._next_check_delay(idle_time, check_interval))
+
+    def _next_check_delay(self, idle_time: int, check_interval: int) -> float:
+        """Compute how long to sleep before the next idle check.
+
+        Args:
+            idle_time: Seconds since last user input at this check
+            check_interval: Minimum check interval in seconds
+
+        Returns:
+            Seconds until the next check
+        """
+        if self._is_idle:
+            # Return from idle can happen at any moment
+            return check_interval
+        # Input resets the idle clock, so idle cannot start before threshold - idle_time
+        return max(check_interval, self.threshold - idle_time)
 
     def stop_monitoring(self) -> None:
         """Stop monitoring idle state."""
         self._running = False
+        self._stop_event.set()
 
     def get_current_idle_duration(self) -> int:
         """Get current idle duration if idle, else 0.
@@ -2,6 +2,7 @@
 
 import platform
 import subprocess
+import threading
 from typing import Callable, Optional
 
 import psutil  # type: ignore[import-untyped]
@@ -25,6 +26,8 @@ class ProcessDetector:
         self.on_process_change = on_process_change
         self._current_process: Optional[str] = None
         self._running = False
+        self._paused = False
+        self._wake = threading.Event()
         self._system = platform.system()
 
     def get_active_process(self) -> Optional[str]:
@@ -188,20 +191,31 @@ class ProcessDetector:
         Note:
             This is a blocking call. Run in a separate thread for background monitoring.
         """
-        import time
-
         self._running = True
         while self._running:
-            change = self.check_process_change()
-            if change and self.on_process_change:
-                old_process, new_process = change
-                self.on_process_change(old_process, new_process)
+            if not self._paused:
+                change = self.check_process_change()
+                if change and self.on_process_change:
+                    old_process, new_process = change
+                    self.on_process_change(old_process, new_process)
 
-            time.sleep(self.interval)
+            # Paused monitoring sleeps until resumed or stopped
+            self._wake.wait(None if self._paused else self.interval)
+            self._wake.clear()
 
     def stop_monitoring(self) -> None:
         """Stop monitoring process changes."""
         self._running = False
+        self._wake.set()
+
+    def pause(self) -> None:
+        """Stop polling until resume() is called, e.g. while the user is idle."""
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume polling, checking for a process change immediately."""
+        self._paused = False
+        self._wake.set()
 
     @property
     def current_process(self) -> Optional[str]:
@@ -3,17 +3,17 @@
 from typing import Optional
 
 from time_audit.core.models import ProcessRule
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage
 
 
 class RuleEngine:
     """Match processes against rules and manage rule learning."""
 
-    def __init__(self, storage: StorageManager):
+    def __init__(self, storage: Storage):
         """Initialize rule engine.
 
         Args:
-            storage: StorageManager instance for rule persistence
+            storage: Storage instance for rule persistence
         """
         self.storage = storage
         self._rules_cache: Optional[list[ProcessRule]] = None
@@ -181,7 +181,7 @@ def status(verbose: bool) -> None:
 @click.option("--follow", "-f", is_flag=True, help="Follow log output")  # type: ignore[misc]
 def logs(lines: int, follow: bool) -> None:
     """View daemon logs."""
-    from time_audit.daemon.platform import get_log_file_path
+    from time_audit.daemon.platform import get_log_file_path, read_tail
 
     log_file = get_log_file_path()
 
@@ -198,11 +198,8 @@ def logs(lines: int, follow: bool) -> None:
         except KeyboardInterrupt:
             pass
     else:
-        # Show last N lines
-        with open(log_file) as f:
-            all_lines = f.readlines()
-            last_lines = all_lines[-lines:]
-            console.print("".join(last_lines))
+        # Show last N lines (reads only the end of the file)
+        console.print(read_tail(log_file, lines))
 
 
 @daemon.command()  # type: ignore[misc]
@@ -264,8 +261,8 @@ def install() -> None:
         elif platform == Platform.WINDOWS:
             from time_audit.daemon.windows_service import WindowsService
 
-            service = WindowsService()  # type: ignore[assignment]
-            success, message = service.install()
+            with WindowsService() as service:  # type: ignore[assignment]
+                success, message = service.install()
 
             if success:
                 console.print(f"[green]✓[/green] {message}")
@@ -317,8 +314,8 @@ def uninstall() -> None:
         elif platform == Platform.WINDOWS:
             from time_audit.daemon.windows_service import WindowsService
 
-            service = WindowsService()  # type: ignore[assignment]
-            success, message = service.uninstall()
+            with WindowsService() as service:  # type: ignore[assignment]
+                success, message = service.uninstall()
 
             if success:
                 console.print(f"[green]✓[/green] {message}")
@@ -7,7 +7,7 @@ from typing import Optional
 import click  # type: ignore[import-not-found]
 from rich.console import Console  # type: ignore[import-not-found]
 
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage, open_configured_storage
 from time_audit.export_import import (
     ExcelExporter,
     ICalExporter,
@@ -21,6 +21,19 @@ console = Console()
 error_console = Console(stderr=True)
 
 
+def _open_storage(ctx: click.Context) -> Storage:
+    """Open the storage backend the rest of the CLI uses.
+
+    Args:
+        ctx: Click context carrying the global --data-dir option
+
+    Returns:
+        Storage backend selected by advanced.storage_backend
+    """
+    data_dir = ctx.obj.get("data_dir") if ctx.obj else None
+    return open_configured_storage(Path(data_dir) if data_dir else None)
+
+
 @click.group()  # type: ignore[misc]
 def export_import() -> None:
     """Export and import time tracking data."""
@@ -68,7 +81,9 @@ def export_import() -> None:
     default="day",
     help="Group entries in Markdown export (default: day)",
 )
+@click.pass_context  # type: ignore[misc]
 def export_command(
+    ctx: click.Context,
     output_file: str,
     format: Optional[str],
     start_date: Optional[datetime],
@@ -113,17 +128,9 @@ def export_command(
                 )
                 raise SystemExit(1)
 
-        # Load entries
-        storage = StorageManager()
-        all_entries = storage.load_entries()
-
-        # Filter by project/category
-        filtered_entries = all_entries
-        if project:
-            filtered_entries = [e for e in filtered_entries if e.project == project]
-
-        if category:
-            filtered_entries = [e for e in filtered_entries if e.category == category]
+        # Load entries from the configured storage backend, filtered by project/category
+        storage = _open_storage(ctx)
+        filtered_entries = storage.load_entries(project=project, category=category)
 
         if not filtered_entries:
             console.print("[yellow]Warning:[/yellow] No entries match the filters")
@@ -179,7 +186,9 @@ def export_command(
     is_flag=True,
     help="Show what would be imported without actually importing",
 )
+@click.pass_context  # type: ignore[misc]
 def import_command(
+    ctx: click.Context,
     input_file: str,
     format: Optional[str],
     merge: bool,
@@ -257,19 +266,16 @@ def import_command(
                 console.print("Import cancelled")
                 return
 
-        # Perform import
-        storage = StorageManager()
+        # Perform import into the configured storage backend
+        storage = _open_storage(ctx)
+
+        if not merge:
+            existing_count = len(storage.load_entries())
 
+        # Save imported entries in one rewrite, replacing existing ones unless merging
+        storage.save_entries(entries, replace=not merge)
         if not merge:
-            # Clear existing entries
-            existing_entries = storage.load_entries()
-            for entry in existing_entries:
-                storage.delete_entry(str(entry.id))
-            console.print(f"Cleared {len(existing_entries)} existing entries")
-
-        # Save imported entries
-        for entry in entries:
-            storage.save_entry(entry)
+            console.print(f"Cleared {existing_count} existing entries")
 
         action = "imported" if merge else "replaced with"
         console.print(f"[green]✓[/green] Successfully {action} {len(entries)} entries")
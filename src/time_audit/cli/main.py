@@ -15,7 +15,7 @@ from time_audit.cli.api_commands import api
 from time_audit.cli.config_commands import config
 from time_audit.cli.daemon_commands import daemon
 from time_audit.cli.export_import_commands import export_import
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import open_configured_storage
 from time_audit.core.tracker import TimeTracker
 
 console = Console()
@@ -24,8 +24,7 @@ error_console = Console(stderr=True)
 
 def get_tracker(data_dir: Optional[str] = None) -> TimeTracker:
     """Get TimeTracker instance with optional custom data directory."""
-    storage = StorageManager(Path(data_dir) if data_dir else None)
-    return TimeTracker(storage)
+    return TimeTracker(open_configured_storage(Path(data_dir) if data_dir else None))
 
 
 def format_duration(seconds: Optional[int]) -> str:
@@ -60,8 +60,12 @@ class ConfigManager:
         "advanced": {
             "backup_on_start": True,
             "backup_retention_days": 30,
+            "housekeeping_affinity": False,
             "log_level": "INFO",
             "performance_mode": False,
+            # "sqlite" migrates the CSV data once, when no database exists yet;
+            # CSV changes made after switching back are not carried over again
+            "storage_backend": "csv",
         },
         "api": {
             "enabled": False,
@@ -158,11 +162,13 @@ class ConfigManager:
                 "properties": {
                     "backup_on_start": {"type": "boolean"},
                     "backup_retention_days": {"type": "integer", "minimum": 0},
+                    "housekeeping_affinity": {"type": "boolean"},
                     "log_level": {
                         "type": "string",
                         "enum": ["DEBUG", "INFO", "WARNING", "ERROR"],
                     },
                     "performance_mode": {"type": "boolean"},
+                    "storage_backend": {"type": "string", "enum": ["csv", "sqlite"]},
                 },
             },
             "api": {
@@ -234,11 +240,36 @@ class ConfigManager:
             config_path: Path to config file. Defaults to ~/.time-audit/config.yml
         """
         if config_path is None:
-            config_path = Path.home() / ".time-audit" / "config.yml"
+            config_path = self.default_path()
         self.config_path = config_path
         self._config: dict[str, Any] = {}
         self._load_or_create()
 
+    @staticmethod
+    def default_path() -> Path:
+        """Get the default config file location.
+
+        Returns:
+            Path to ~/.time-audit/config.yml
+        """
+        return Path.home() / ".time-audit" / "config.yml"
+
+    @classmethod
+    def load_existing(cls, config_path: Optional[Path] = None) -> Optional["ConfigManager"]:
+        """Load the config file only if it exists, without creating a default one.
+
+        Args:
+            config_path: Path to config file. Defaults to ~/.time-audit/config.yml
+
+        Returns:
+            ConfigManager instance, or None if there is no config file
+        """
+        if config_path is None:
+            config_path = cls.default_path()
+        if not config_path.exists():
+            return None
+        return cls(config_path)
+
     def _load_or_create(self) -> None:
         """Load existing config or create default."""
         if self.config_path.exists():
@@ -1,13 +1,55 @@
 """Core data models for time tracking."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+_DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Spellings written by to_dict through the CSV writer, checked before the general parse
+_BOOL_STRINGS = {"True": True, "False": False}
+
+
+def _parse_bool(value: Any, default: bool) -> bool:
+    """Parse a boolean field from CSV ("True"/"False") or JSON (bool) data.
+
+    Args:
+        value: Raw field value (None or "" when missing)
+        default: Value to use when the field is missing
+
+    Returns:
+        Parsed boolean
+    """
+    parsed = _BOOL_STRINGS.get(value)
+    if parsed is not None:
+        return parsed
+    if value is None or value == "":
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp field, defaulting to now when missing.
+
+    Args:
+        value: Raw field value (None or "" when missing)
+
+    Returns:
+        Parsed datetime
+    """
+    if not value:
+        return datetime.now()
+    return datetime.fromisoformat(value)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Entry:
     """Time tracking entry representing a work session.
 
@@ -110,25 +152,26 @@ class Entry:
             start_time=datetime.fromisoformat(data["start_time"]),
             end_time=datetime.fromisoformat(data["end_time"]) if data["end_time"] else None,
             task_name=data["task_name"],
-            project=data["project"] if data["project"] else None,
-            category=data["category"] if data["category"] else None,
-            tags=[t.strip() for t in data["tags"].split(",") if t.strip()],
-            notes=data["notes"] if data["notes"] else None,
-            active_process=data.get("active_process") if data.get("active_process") else None,
-            active_window=data.get("active_window") if data.get("active_window") else None,
-            idle_time_seconds=(
-                int(data.get("idle_time_seconds", 0)) if data.get("idle_time_seconds") else 0
+            # Interned: these values repeat across thousands of rows
+            project=sys.intern(data["project"]) if data["project"] else None,
+            category=sys.intern(data["category"]) if data["category"] else None,
+            tags=[sys.intern(t.strip()) for t in data["tags"].split(",") if t.strip()],
+            notes=data["notes"] or None,
+            active_process=(
+                sys.intern(data["active_process"]) if data.get("active_process") else None
             ),
-            manual_entry=bool(data.get("manual_entry", False)),
-            edited=bool(data.get("edited", False)),
-            auto_tracked=bool(data.get("auto_tracked", False)),
-            rule_id=data.get("rule_id") if data.get("rule_id") else None,
-            created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get("updated_at", datetime.now().isoformat())),
+            active_window=data.get("active_window") or None,
+            idle_time_seconds=int(data.get("idle_time_seconds") or 0),
+            manual_entry=_parse_bool(data.get("manual_entry"), False),
+            edited=_parse_bool(data.get("edited"), False),
+            auto_tracked=_parse_bool(data.get("auto_tracked"), False),
+            rule_id=data.get("rule_id") or None,
+            created_at=_parse_timestamp(data.get("created_at")),
+            updated_at=_parse_timestamp(data.get("updated_at")),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Project:
     """Project definition for organizing time entries.
 
@@ -175,12 +218,12 @@ class Project:
             client=data["client"] if data["client"] else None,
             hourly_rate=Decimal(data["hourly_rate"]) if data["hourly_rate"] else None,
             budget_hours=Decimal(data["budget_hours"]) if data["budget_hours"] else None,
-            active=bool(data.get("active", True)),
+            active=_parse_bool(data.get("active"), True),
             created_at=datetime.fromisoformat(data["created_at"]),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Category:
     """Category definition for organizing time entries.
 
@@ -216,11 +259,11 @@ class Category:
             name=data["name"],
             color=data["color"] if data["color"] else None,
             parent_category=data["parent_category"] if data["parent_category"] else None,
-            billable=bool(data.get("billable", True)),
+            billable=_parse_bool(data.get("billable"), True),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessRule:
     """Rule for automatic process detection.
 
@@ -293,8 +336,8 @@ class ProcessRule:
             project=data["project"] if data["project"] else None,
             category=data["category"] if data["category"] else None,
             tags=[t.strip() for t in data["tags"].split(",") if t.strip()],
-            enabled=bool(data.get("enabled", True)),
-            learned=bool(data.get("learned", False)),
+            enabled=_parse_bool(data.get("enabled"), True),
+            learned=_parse_bool(data.get("learned"), False),
             confidence=float(data.get("confidence", 1.0)),
             match_count=int(data.get("match_count", 0)),
             created_at=datetime.fromisoformat(data["created_at"]),
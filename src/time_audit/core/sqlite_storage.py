@@ -0,0 +1,592 @@
+"""SQLite storage backend for large datasets."""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from time_audit.core.models import Category, Entry, ProcessRule, Project
+from time_audit.core.storage import (
+    ENTRY_FIELDNAMES,
+    RULE_FIELDNAMES,
+    FsyncPolicy,
+    Storage,
+    StorageManager,
+    _entry_matches,
+)
+
+PROJECT_FIELDNAMES = [
+    "id",
+    "name",
+    "description",
+    "client",
+    "hourly_rate",
+    "budget_hours",
+    "active",
+    "created_at",
+]
+CATEGORY_FIELDNAMES = ["id", "name", "color", "parent_category", "billable"]
+
+# Values are stored as produced by the models' to_dict(), so from_dict() reads them back
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    duration_seconds INTEGER,
+    task_name TEXT NOT NULL,
+    project TEXT,
+    category TEXT,
+    tags TEXT,
+    notes TEXT,
+    active_process TEXT,
+    active_window TEXT,
+    idle_time_seconds INTEGER DEFAULT 0,
+    manual_entry INTEGER DEFAULT 0,
+    edited INTEGER DEFAULT 0,
+    auto_tracked INTEGER DEFAULT 0,
+    rule_id TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_entries_start_time ON entries(start_time);
+CREATE INDEX IF NOT EXISTS idx_entries_project ON entries(project, start_time);
+CREATE INDEX IF NOT EXISTS idx_entries_category ON entries(category, start_time);
+CREATE INDEX IF NOT EXISTS idx_entries_running ON entries(start_time) WHERE end_time IS NULL;
+
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    client TEXT,
+    hourly_rate TEXT,
+    budget_hours TEXT,
+    active INTEGER DEFAULT 1,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS categories (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    color TEXT,
+    parent_category TEXT,
+    billable INTEGER DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS rules (
+    id TEXT PRIMARY KEY,
+    pattern TEXT NOT NULL,
+    task_name TEXT NOT NULL,
+    project TEXT,
+    category TEXT,
+    tags TEXT,
+    enabled INTEGER DEFAULT 1,
+    learned INTEGER DEFAULT 0,
+    confidence REAL DEFAULT 1.0,
+    match_count INTEGER DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+"""
+
+# How often SQLite syncs in WAL mode for each fsync policy
+_SYNCHRONOUS = {"always": "FULL", "group": "NORMAL", "off": "OFF"}
+
+
+def _upsert_sql(table: str, fieldnames: list[str]) -> str:
+    """Build an insert-or-update statement that keeps the row's position.
+
+    Args:
+        table: Table name
+        fieldnames: Columns, the first being the primary key
+
+    Returns:
+        SQL statement with one named parameter per column
+    """
+    columns = ", ".join(fieldnames)
+    values = ", ".join(f":{name}" for name in fieldnames)
+    updates = ", ".join(f"{name} = excluded.{name}" for name in fieldnames[1:])
+    return (
+        f"INSERT INTO {table} ({columns}) VALUES ({values}) "
+        f"ON CONFLICT({fieldnames[0]}) DO UPDATE SET {updates}"
+    )
+
+
+def _entry_row(entry: Entry) -> dict[str, Any]:
+    """Convert an entry to a row, storing a running entry's end_time as NULL.
+
+    Args:
+        entry: Entry to convert
+
+    Returns:
+        Row dictionary
+    """
+    row = entry.to_dict()
+    row["end_time"] = row["end_time"] or None
+    return row
+
+
+class SqliteStorage(Storage):
+    """SQLite storage backend, interchangeable with the CSV StorageManager.
+
+    Entries, projects, categories and rules live in a single WAL-mode database
+    with indexes on id, start_time, project and category, so lookups, range
+    queries and single-row updates don't read or rewrite the whole dataset.
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        fsync_policy: FsyncPolicy = "group",
+        db_name: str = "time_audit.db",
+    ):
+        """Initialize SQLite storage.
+
+        Args:
+            data_dir: Custom data directory. Defaults to ~/.time-audit/data
+            fsync_policy: "always" to sync every commit, "group" to sync at WAL
+                checkpoints, or "off"
+            db_name: Database file name within data_dir
+
+        Raises:
+            ValueError: If fsync_policy is not recognized
+        """
+        if data_dir is None:
+            data_dir = Path.home() / ".time-audit" / "data"
+        if fsync_policy not in _SYNCHRONOUS:
+            raise ValueError(f"Invalid fsync policy: {fsync_policy}")
+
+        self.data_dir = data_dir
+        self.fsync_policy = fsync_policy
+        self.db_file = self.data_dir / db_name
+        self.state_dir = self.data_dir.parent / "state"
+        self.backup_dir = self.data_dir.parent / "backups"
+
+        # Ensure directories exist
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+
+        # Shared by the daemon's threads; access is serialized by _lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={_SYNCHRONOUS[fsync_policy]}")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a single write transaction.
+
+        Yields:
+            Database connection
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Any = ()) -> list[dict[str, Any]]:
+        """Run a read query.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            List of row dictionaries
+        """
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def flush(self) -> None:
+        """Checkpoint the write-ahead log into the database file."""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def backup(self, label: Optional[str] = None) -> Path:
+        """Create a consistent backup of the database.
+
+        Args:
+            label: Optional label for backup. Defaults to timestamp
+
+        Returns:
+            Path to backup directory
+        """
+        if label is None:
+            label = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        backup_path = self.backup_dir / label
+        backup_path.mkdir(parents=True, exist_ok=True)
+
+        target = sqlite3.connect(backup_path / self.db_file.name)
+        try:
+            with self._lock:
+                self._conn.backup(target)
+        finally:
+            target.close()
+
+        return backup_path
+
+    # Entry operations
+
+    def save_entry(self, entry: Entry) -> None:
+        """Save or update an entry.
+
+        Args:
+            entry: Entry to save
+        """
+        self.save_entries([entry])
+
+    def save_entries(self, entries: Iterable[Entry], replace: bool = False) -> None:
+        """Save or update many entries in one transaction.
+
+        Args:
+            entries: Entries to save
+            replace: If True, the saved entries replace all existing ones
+        """
+        updated_at = datetime.now()
+        rows = []
+        for entry in entries:
+            entry.updated_at = updated_at
+            rows.append(_entry_row(entry))
+
+        with self._transaction() as conn:
+            if replace:
+                conn.execute("DELETE FROM entries")
+            conn.executemany(_upsert_sql("entries", ENTRY_FIELDNAMES), rows)
+
+    def load_entries(
+        self,
+        limit: Optional[int] = None,
+        project: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[Entry]:
+        """Load entries, most recent first.
+
+        Args:
+            limit: Maximum number of entries to load (most recent first)
+            project: Only include entries for this project
+            category: Only include entries in this category
+            start_date: Only include entries starting at or after this time
+            end_date: Only include entries starting at or before this time
+
+        Returns:
+            List of Entry objects
+        """
+        sql = "SELECT * FROM entries"
+        conditions = []
+        params: list[Any] = []
+        if project:
+            conditions.append("project = ?")
+            params.append(project)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY start_time DESC"
+
+        if not (start_date or end_date):
+            if limit:
+                sql += " LIMIT ?"
+                params.append(limit)
+            return [Entry.from_dict(row) for row in self._query(sql, params)]
+
+        # Date filters compare datetimes, since ISO strings with mixed UTC offsets
+        # don't sort correctly; stream rows newest first and stop at the limit
+        entries: list[Entry] = []
+        with self._lock:
+            for row in self._conn.execute(sql, params):
+                if _entry_matches(None, None, row["start_time"], None, None, start_date, end_date):
+                    entries.append(Entry.from_dict(dict(row)))
+                    if limit and len(entries) >= limit:
+                        break
+        return entries
+
+    def delete_entry(self, entry_id: str) -> bool:
+        """Delete an entry by ID.
+
+        Args:
+            entry_id: ID of entry to delete
+
+        Returns:
+            True if entry was deleted, False if not found
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM entries WHERE id = ?", (str(entry_id),))
+        return cursor.rowcount > 0
+
+    def get_current_entry(self) -> Optional[Entry]:
+        """Get currently running entry (if any).
+
+        Returns:
+            Current entry or None if no entry is running
+        """
+        rows = self._query(
+            "SELECT * FROM entries WHERE end_time IS NULL ORDER BY start_time DESC LIMIT 1"
+        )
+        return Entry.from_dict(rows[0]) if rows else None
+
+    def get_entry(self, entry_id: str) -> Optional[Entry]:
+        """Get a specific entry by ID.
+
+        Args:
+            entry_id: ID of the entry to retrieve (string or UUID)
+
+        Returns:
+            Entry object or None if not found
+        """
+        rows = self._query("SELECT * FROM entries WHERE id = ?", (str(entry_id),))
+        return Entry.from_dict(rows[0]) if rows else None
+
+    def update_entry(self, entry: Entry) -> None:
+        """Update an existing entry.
+
+        Args:
+            entry: Entry object with updated data
+        """
+        self.save_entry(entry)
+
+    # Project operations
+
+    def save_project(self, project: Project) -> None:
+        """Save or update a project.
+
+        Args:
+            project: Project to save
+        """
+        with self._transaction() as conn:
+            conn.execute(_upsert_sql("projects", PROJECT_FIELDNAMES), project.to_dict())
+
+    def load_projects(self) -> list[Project]:
+        """Load all projects.
+
+        Returns:
+            List of Project objects
+        """
+        return [Project.from_dict(row) for row in self._query("SELECT * FROM projects")]
+
+    def get_project(self, project_id: str) -> Optional[Project]:
+        """Get project by ID.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Project or None if not found
+        """
+        rows = self._query("SELECT * FROM projects WHERE id = ?", (project_id,))
+        return Project.from_dict(rows[0]) if rows else None
+
+    def delete_project(self, project_id: str) -> bool:
+        """Delete a project by ID.
+
+        Args:
+            project_id: ID of project to delete
+
+        Returns:
+            True if project was deleted, False if not found
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+        return cursor.rowcount > 0
+
+    # Category operations
+
+    def save_category(self, category: Category) -> None:
+        """Save or update a category.
+
+        Args:
+            category: Category to save
+        """
+        with self._transaction() as conn:
+            conn.execute(_upsert_sql("categories", CATEGORY_FIELDNAMES), category.to_dict())
+
+    def load_categories(self) -> list[Category]:
+        """Load all categories.
+
+        Returns:
+            List of Category objects
+        """
+        return [Category.from_dict(row) for row in self._query("SELECT * FROM categories")]
+
+    def get_category(self, category_id: str) -> Optional[Category]:
+        """Get category by ID.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Category or None if not found
+        """
+        rows = self._query("SELECT * FROM categories WHERE id = ?", (category_id,))
+        return Category.from_dict(rows[0]) if rows else None
+
+    def delete_category(self, category_id: str) -> bool:
+        """Delete a category by ID.
+
+        Args:
+            category_id: ID of category to delete
+
+        Returns:
+            True if category was deleted, False if not found
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM categories WHERE id = ?", (category_id,))
+        return cursor.rowcount > 0
+
+    # Process rule operations
+
+    def save_rule(self, rule: ProcessRule) -> None:
+        """Save or update a process rule.
+
+        Args:
+            rule: ProcessRule to save
+        """
+        self.save_rules([rule])
+
+    def save_rules(self, rules: Iterable[ProcessRule]) -> None:
+        """Save or update many process rules in one transaction.
+
+        Args:
+            rules: ProcessRules to save
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                _upsert_sql("rules", RULE_FIELDNAMES), [rule.to_dict() for rule in rules]
+            )
+
+    def load_rules(self, enabled_only: bool = False) -> list[ProcessRule]:
+        """Load all process rules.
+
+        Args:
+            enabled_only: If True, only return enabled rules
+
+        Returns:
+            List of ProcessRule objects
+        """
+        sql = "SELECT * FROM rules"
+        if enabled_only:
+            sql += " WHERE enabled"
+        return [ProcessRule.from_dict(row) for row in self._query(sql)]
+
+    def get_rule(self, rule_id: str) -> Optional[ProcessRule]:
+        """Get rule by ID.
+
+        Args:
+            rule_id: Rule ID
+
+        Returns:
+            ProcessRule or None if not found
+        """
+        rows = self._query("SELECT * FROM rules WHERE id = ?", (rule_id,))
+        return ProcessRule.from_dict(rows[0]) if rows else None
+
+    def delete_rule(self, rule_id: str) -> bool:
+        """Delete a process rule.
+
+        Args:
+            rule_id: ID of rule to delete
+
+        Returns:
+            True if rule was deleted, False if not found
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM rules WHERE id = ?", (rule_id,))
+        return cursor.rowcount > 0
+
+
+def _remove_database(db_file: Path) -> None:
+    """Delete a database file along with its WAL and shared-memory files.
+
+    Args:
+        db_file: Database file to delete
+    """
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_file}{suffix}").unlink(missing_ok=True)
+
+
+def migrate_csv_to_sqlite(storage: StorageManager) -> SqliteStorage:
+    """Copy all CSV data into a new SQLite database in the same data directory.
+
+    The CSV files are backed up first and left in place, so switching the
+    backend back to CSV still works (without changes made since). The data is
+    copied into a temporary database that only replaces time_audit.db once the
+    row counts check out, so a failed migration leaves no database behind and
+    is retried on the next open.
+
+    Args:
+        storage: CSV storage to migrate
+
+    Returns:
+        SQLite storage holding the migrated data
+
+    Raises:
+        ValueError: If the migrated row counts don't match the CSV data
+    """
+    storage.backup(label=f"pre-sqlite-{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+
+    entries = storage.load_entries()
+    projects = storage.load_projects()
+    categories = storage.load_categories()
+    rules = storage.load_rules()
+
+    # Start from scratch if an earlier migration was interrupted
+    temp_file = storage.data_dir / "time_audit.db.migrating"
+    _remove_database(temp_file)
+
+    migrated = SqliteStorage(
+        storage.data_dir, fsync_policy=storage.fsync_policy, db_name=temp_file.name
+    )
+    try:
+        with migrated._transaction() as conn:
+            conn.executemany(
+                _upsert_sql("entries", ENTRY_FIELDNAMES), [_entry_row(e) for e in entries]
+            )
+            conn.executemany(
+                _upsert_sql("projects", PROJECT_FIELDNAMES), [p.to_dict() for p in projects]
+            )
+            conn.executemany(
+                _upsert_sql("categories", CATEGORY_FIELDNAMES), [c.to_dict() for c in categories]
+            )
+            conn.executemany(_upsert_sql("rules", RULE_FIELDNAMES), [r.to_dict() for r in rules])
+
+        # Verify data integrity
+        for table, expected in (
+            ("entries", len(entries)),
+            ("projects", len(projects)),
+            ("categories", len(categories)),
+            ("rules", len(rules)),
+        ):
+            count = migrated._query(f"SELECT COUNT(*) AS n FROM {table}")[0]["n"]
+            if count != expected:
+                raise ValueError(f"Migrated {count} {table}, expected {expected}")
+
+        # Fold the WAL back into the file so the rename moves all of the data
+        migrated._conn.execute("PRAGMA journal_mode=DELETE")
+    except BaseException:
+        migrated.close()
+        _remove_database(temp_file)
+        raise
+    migrated.close()
+
+    os.replace(temp_file, storage.data_dir / "time_audit.db")
+    return SqliteStorage(storage.data_dir, fsync_policy=storage.fsync_policy)
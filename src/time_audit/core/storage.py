@@ -1,21 +1,103 @@
 """CSV storage manager with atomic operations and validation."""
 
+import atexit
 import csv
+import heapq
+import io
+import itertools
+import logging
+import mmap
 import os
 import shutil
 import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional, Union
 
+from time_audit.core.config import ConfigManager
 from time_audit.core.models import Category, Entry, ProcessRule, Project
 
+logger = logging.getLogger(__name__)
+
 # Platform-specific imports for file locking
 if sys.platform == "win32":
     pass  # type: ignore[import-not-found]
 else:
     pass  # type: ignore[import-not-found]
 
+# Column order of entries.csv and rules.csv
+ENTRY_FIELDNAMES = [
+    "id",
+    "start_time",
+    "end_time",
+    "duration_seconds",
+    "task_name",
+    "project",
+    "category",
+    "tags",
+    "notes",
+    "active_process",
+    "active_window",
+    "idle_time_seconds",
+    "manual_entry",
+    "edited",
+    "auto_tracked",
+    "rule_id",
+    "created_at",
+    "updated_at",
+]
+RULE_FIELDNAMES = [
+    "id",
+    "pattern",
+    "task_name",
+    "project",
+    "category",
+    "tags",
+    "enabled",
+    "learned",
+    "confidence",
+    "match_count",
+    "created_at",
+]
+
+# Larger reads mean fewer read() calls when parsing big CSV files
+_READ_BUFFER_SIZE = 1 << 20
+
+# Low-cardinality columns whose values are shared across rows while reading
+_DEDUP_COLUMNS = frozenset(
+    {
+        "task_name",
+        "project",
+        "category",
+        "tags",
+        "active_process",
+        "active_window",
+        "idle_time_seconds",
+        "manual_entry",
+        "edited",
+        "auto_tracked",
+        "rule_id",
+        "client",
+        "active",
+        "color",
+        "parent_category",
+        "billable",
+        "enabled",
+        "learned",
+    }
+)
+
+# When written files are fsynced: on every write, in the background, or never
+FsyncPolicy = Literal["always", "group", "off"]
+
 
 def _lock_file(file_obj: Any, exclusive: bool = True) -> None:
     """Lock a file in a cross-platform way.
@@ -56,25 +138,561 @@ def _unlock_file(file_obj: Any) -> None:
         fcntl.flock(file_obj.fileno(), fcntl.LOCK_UN)
 
 
-class StorageManager:
+def _file_signature(file_path: Path) -> Optional[tuple[int, int, int]]:
+    """Get a cheap change-detection signature for a file.
+
+    Args:
+        file_path: File to inspect
+
+    Returns:
+        Tuple of (inode, mtime in ns, size), or None if the file doesn't exist
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file or directory to disk by path.
+
+    Args:
+        path: File or directory to fsync
+    """
+    flags = os.O_RDWR if sys.platform == "win32" else os.O_RDONLY
+    try:
+        fd = os.open(path, flags)
+    except FileNotFoundError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _GroupCommit:
+    """Background flusher that batches fsyncs of recently replaced files.
+
+    Files written under the "group" fsync policy are renamed into place
+    without an fsync and registered here. A daemon thread fsyncs them, and
+    their directories so the renames are durable, an interval after the first
+    pending write; it sleeps while nothing is pending. Pending files are also
+    flushed at interpreter exit.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        """Initialize the flusher.
+
+        Args:
+            interval: Seconds between background flushes
+        """
+        self.interval = interval
+        self._pending: set[Path] = set()
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Set while files are pending, so the flusher only wakes when there is work
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = 0
+        atexit.register(self.flush)
+
+    def add(self, file_path: Path) -> None:
+        """Schedule a file for the next background flush.
+
+        Args:
+            file_path: File that was just written
+        """
+        with self._pending_lock:
+            self._pending.add(file_path)
+            self._wake.set()
+            # Threads don't survive fork, so restart the flusher in a child process
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, name="time-audit-fsync", daemon=True
+                )
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Fsync all pending files and their directories now."""
+        with self._flush_lock:
+            with self._pending_lock:
+                paths, self._pending = self._pending, set()
+                self._wake.clear()
+
+            for path in paths:
+                _fsync_path(path)
+            # Directory fsync records the renames; not supported on Windows
+            if sys.platform != "win32":
+                for directory in {path.parent for path in paths}:
+                    _fsync_path(directory)
+
+    def _run(self) -> None:
+        """Flush pending files, waiting for writes rather than polling."""
+        while True:
+            self._wake.wait()
+            # Let writes arriving within the interval share this flush
+            time.sleep(self.interval)
+            self.flush()
+
+
+_group_commit = _GroupCommit()
+
+
+def _clone_file(src: Path, dst: Path) -> None:
+    """Copy a file, sharing its blocks via a reflink where the filesystem allows.
+
+    Hardlinks are not an option: new rows are appended to the data files in place.
+
+    Args:
+        src: File to copy
+        dst: Destination path
+    """
+    if sys.platform == "linux":
+        import fcntl
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                # FICLONE is only exported by fcntl on Python 3.12+
+                fcntl.ioctl(fdst.fileno(), getattr(fcntl, "FICLONE", 0x40049409), fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # Not supported by this filesystem; fall back to a regular copy
+
+    shutil.copy2(src, dst)
+
+
+def _row_values(rows: Iterable[dict[str, Any]], fieldnames: list[str]) -> Iterator[Sequence[Any]]:
+    """Convert row dicts to positional values for csv.writer.
+
+    Cheaper per row than csv.DictWriter, which checks every row for extra keys.
+
+    Args:
+        rows: Row dictionaries
+        fieldnames: CSV field names
+
+    Yields:
+        Values in fieldnames order; missing columns are written empty
+    """
+    getter = itemgetter(*fieldnames)
+    for row in rows:
+        try:
+            values = getter(row)
+        except KeyError:
+            # Rows read from a file with an older column layout
+            values = tuple(row.get(name, "") for name in fieldnames)
+        yield values if len(fieldnames) > 1 else (values,)
+
+
+def _replace_row(
+    rows: Iterable[dict[str, Any]], row_id: str, replacement: Optional[dict[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    """Stream rows with the row matching row_id replaced or removed.
+
+    Args:
+        rows: Row dictionaries
+        row_id: Id of the row to replace
+        replacement: New row, or None to drop the row
+
+    Yields:
+        Rows in their original order; replacement is added at the end if row_id is absent
+    """
+    pending = replacement
+    for row in rows:
+        if row["id"] != row_id:
+            yield row
+        elif pending is not None:
+            yield pending
+            pending = None
+    if pending is not None:
+        yield pending
+
+
+def _count_quotes(buf: mmap.mmap, start: int, end: int) -> int:
+    """Count double quotes in buf[start:end] without copying the range.
+
+    Args:
+        buf: Memory-mapped file
+        start: First offset to scan
+        end: Offset to stop at (exclusive)
+
+    Returns:
+        Number of b'"' bytes in the range
+    """
+    count = 0
+    pos = buf.find(b'"', start, end)
+    while pos != -1:
+        count += 1
+        pos = buf.find(b'"', pos + 1, end)
+    return count
+
+
+def _copy_entry(entry: Entry) -> Entry:
+    """Copy an entry so callers can mutate it without touching cached state."""
+    return replace(entry, tags=list(entry.tags))
+
+
+def _entry_matches(
+    project: Optional[str],
+    category: Optional[str],
+    start_time: Union[str, datetime],
+    project_filter: Optional[str],
+    category_filter: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> bool:
+    """Check an entry's fields against load_entries filters.
+
+    Args:
+        project: Entry project
+        category: Entry category
+        start_time: Entry start time (ISO string from a raw row, parsed only if needed)
+        project_filter: Required project, if any
+        category_filter: Required category, if any
+        start_date: Earliest allowed start time, if any
+        end_date: Latest allowed start time, if any
+
+    Returns:
+        True if the entry passes all filters
+    """
+    if project_filter and project != project_filter:
+        return False
+    if category_filter and category != category_filter:
+        return False
+    if start_date or end_date:
+        # Compared as datetimes: ISO strings with mixed UTC offsets don't sort correctly
+        if isinstance(start_time, str):
+            start_time = datetime.fromisoformat(start_time)
+        if start_date and start_time < start_date:
+            return False
+        if end_date and start_time > end_date:
+            return False
+    return True
+
+
+class Storage(ABC):
+    """Interface shared by the storage backends (CSV and SQLite)."""
+
+    data_dir: Path
+    state_dir: Path
+    backup_dir: Path
+    fsync_policy: FsyncPolicy
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Make writes still pending in the background durable now."""
+        pass
+
+    @abstractmethod
+    def backup(self, label: Optional[str] = None) -> Path:
+        """Create backup of all data.
+
+        Args:
+            label: Optional label for backup. Defaults to timestamp
+
+        Returns:
+            Path to backup directory
+        """
+        pass
+
+    # Entry operations
+
+    @abstractmethod
+    def save_entry(self, entry: Entry) -> None:
+        """Save or update an entry.
+
+        Args:
+            entry: Entry to save
+        """
+        pass
+
+    @abstractmethod
+    def save_entries(self, entries: Iterable[Entry], replace: bool = False) -> None:
+        """Save or update many entries at once.
+
+        Args:
+            entries: Entries to save
+            replace: If True, the saved entries replace all existing ones
+        """
+        pass
+
+    @abstractmethod
+    def load_entries(
+        self,
+        limit: Optional[int] = None,
+        project: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[Entry]:
+        """Load entries, most recent first.
+
+        Args:
+            limit: Maximum number of entries to load (most recent first)
+            project: Only include entries for this project
+            category: Only include entries in this category
+            start_date: Only include entries starting at or after this time
+            end_date: Only include entries starting at or before this time
+
+        Returns:
+            List of Entry objects
+        """
+        pass
+
+    @abstractmethod
+    def delete_entry(self, entry_id: str) -> bool:
+        """Delete an entry by ID.
+
+        Args:
+            entry_id: ID of entry to delete
+
+        Returns:
+            True if entry was deleted, False if not found
+        """
+        pass
+
+    @abstractmethod
+    def get_current_entry(self) -> Optional[Entry]:
+        """Get currently running entry (if any).
+
+        Returns:
+            Current entry or None if no entry is running
+        """
+        pass
+
+    @abstractmethod
+    def get_entry(self, entry_id: str) -> Optional[Entry]:
+        """Get a specific entry by ID.
+
+        Args:
+            entry_id: ID of the entry to retrieve (string or UUID)
+
+        Returns:
+            Entry object or None if not found
+        """
+        pass
+
+    @abstractmethod
+    def update_entry(self, entry: Entry) -> None:
+        """Update an existing entry.
+
+        Args:
+            entry: Entry object with updated data
+        """
+        pass
+
+    # Project operations
+
+    @abstractmethod
+    def save_project(self, project: Project) -> None:
+        """Save or update a project.
+
+        Args:
+            project: Project to save
+        """
+        pass
+
+    @abstractmethod
+    def load_projects(self) -> list[Project]:
+        """Load all projects.
+
+        Returns:
+            List of Project objects
+        """
+        pass
+
+    @abstractmethod
+    def get_project(self, project_id: str) -> Optional[Project]:
+        """Get project by ID.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Project or None if not found
+        """
+        pass
+
+    def update_project(self, project: Project) -> None:
+        """Update an existing project.
+
+        Args:
+            project: Project object with updated data
+
+        Note:
+            This uses save_project which handles updates automatically.
+        """
+        self.save_project(project)
+
+    @abstractmethod
+    def delete_project(self, project_id: str) -> bool:
+        """Delete a project by ID.
+
+        Args:
+            project_id: ID of project to delete
+
+        Returns:
+            True if project was deleted, False if not found
+        """
+        pass
+
+    # Category operations
+
+    @abstractmethod
+    def save_category(self, category: Category) -> None:
+        """Save or update a category.
+
+        Args:
+            category: Category to save
+        """
+        pass
+
+    @abstractmethod
+    def load_categories(self) -> list[Category]:
+        """Load all categories.
+
+        Returns:
+            List of Category objects
+        """
+        pass
+
+    @abstractmethod
+    def get_category(self, category_id: str) -> Optional[Category]:
+        """Get category by ID.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Category or None if not found
+        """
+        pass
+
+    def update_category(self, category: Category) -> None:
+        """Update an existing category.
+
+        Args:
+            category: Category object with updated data
+
+        Note:
+            This uses save_category which handles updates automatically.
+        """
+        self.save_category(category)
+
+    @abstractmethod
+    def delete_category(self, category_id: str) -> bool:
+        """Delete a category by ID.
+
+        Args:
+            category_id: ID of category to delete
+
+        Returns:
+            True if category was deleted, False if not found
+        """
+        pass
+
+    # Process rule operations
+
+    @abstractmethod
+    def save_rule(self, rule: ProcessRule) -> None:
+        """Save or update a process rule.
+
+        Args:
+            rule: ProcessRule to save
+        """
+        pass
+
+    @abstractmethod
+    def save_rules(self, rules: Iterable[ProcessRule]) -> None:
+        """Save or update many process rules at once.
+
+        Args:
+            rules: ProcessRules to save
+        """
+        pass
+
+    @abstractmethod
+    def load_rules(self, enabled_only: bool = False) -> list[ProcessRule]:
+        """Load all process rules.
+
+        Args:
+            enabled_only: If True, only return enabled rules
+
+        Returns:
+            List of ProcessRule objects
+        """
+        pass
+
+    @abstractmethod
+    def get_rule(self, rule_id: str) -> Optional[ProcessRule]:
+        """Get rule by ID.
+
+        Args:
+            rule_id: Rule ID
+
+        Returns:
+            ProcessRule or None if not found
+        """
+        pass
+
+    @abstractmethod
+    def delete_rule(self, rule_id: str) -> bool:
+        """Delete a process rule.
+
+        Args:
+            rule_id: ID of rule to delete
+
+        Returns:
+            True if rule was deleted, False if not found
+        """
+        pass
+
+
+class StorageManager(Storage):
     """Manages CSV storage for time tracking data with atomic operations."""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, fsync_policy: FsyncPolicy = "group"):
         """Initialize storage manager.
 
         Args:
             data_dir: Custom data directory. Defaults to ~/.time-audit/data
+            fsync_policy: "always" to fsync every write before returning, "group"
+                to fsync in the background about once a second, or "off"
+
+        Raises:
+            ValueError: If fsync_policy is not recognized
         """
         if data_dir is None:
             data_dir = Path.home() / ".time-audit" / "data"
+        if fsync_policy not in ("always", "group", "off"):
+            raise ValueError(f"Invalid fsync policy: {fsync_policy}")
 
         self.data_dir = data_dir
+        self.fsync_policy = fsync_policy
         self.entries_file = self.data_dir / "entries.csv"
         self.projects_file = self.data_dir / "projects.csv"
         self.categories_file = self.data_dir / "categories.csv"
         self.rules_file = self.data_dir / "rules.csv"
         self.state_dir = self.data_dir.parent / "state"
         self.backup_dir = self.data_dir.parent / "backups"
+        # Id of the running entry; empty means none, missing means unknown. Only
+        # written under the entries write lock, so an empty pointer can be trusted.
+        self.current_file = self.state_dir / "current.txt"
+
+        # Raw rows per CSV file, keyed by file signature
+        self._csv_cache: dict[Path, tuple[tuple[int, int, int], list[dict[str, Any]]]] = {}
+        # Rows by id per CSV file (file order), keyed by file signature
+        self._index_cache: dict[Path, tuple[tuple[int, int, int], dict[str, dict[str, Any]]]] = {}
+        # Parsed entries keyed by entries file signature: id -> (start_time, Entry) in file order
+        self._entries_cache: Optional[tuple[tuple[int, int, int], dict[str, tuple[str, Entry]]]] = (
+            None
+        )
 
         # Ensure directories exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -87,30 +705,7 @@ class StorageManager:
     def _initialize_files(self) -> None:
         """Create CSV files with headers if they don't exist."""
         if not self.entries_file.exists():
-            self._write_csv_atomic(
-                self.entries_file,
-                [
-                    "id",
-                    "start_time",
-                    "end_time",
-                    "duration_seconds",
-                    "task_name",
-                    "project",
-                    "category",
-                    "tags",
-                    "notes",
-                    "active_process",
-                    "active_window",
-                    "idle_time_seconds",
-                    "manual_entry",
-                    "edited",
-                    "auto_tracked",
-                    "rule_id",
-                    "created_at",
-                    "updated_at",
-                ],
-                [],
-            )
+            self._write_csv_atomic(self.entries_file, ENTRY_FIELDNAMES, [])
 
         if not self.projects_file.exists():
             self._write_csv_atomic(
@@ -136,54 +731,60 @@ class StorageManager:
             )
 
         if not self.rules_file.exists():
-            self._write_csv_atomic(
-                self.rules_file,
-                [
-                    "id",
-                    "pattern",
-                    "task_name",
-                    "project",
-                    "category",
-                    "tags",
-                    "enabled",
-                    "learned",
-                    "confidence",
-                    "match_count",
-                    "created_at",
-                ],
-                [],
-            )
+            self._write_csv_atomic(self.rules_file, RULE_FIELDNAMES, [])
+
+    @contextmanager
+    def _write_lock(self, file_path: Path) -> Iterator[None]:
+        """Hold an exclusive lock for a read-modify-write of a data file.
+
+        The lock lives on a separate .lock file, since the data file itself is
+        replaced by rename and a lock on it would not outlive the write.
+
+        Args:
+            file_path: Data file about to be modified
+        """
+        with open(file_path.with_suffix(".lock"), "a") as lock:
+            _lock_file(lock, exclusive=True)
+            try:
+                yield
+            finally:
+                _unlock_file(lock)
 
     def _write_csv_atomic(
-        self, file_path: Path, fieldnames: list[str], rows: list[dict[str, Any]]
+        self, file_path: Path, fieldnames: list[str], rows: Iterable[dict[str, Any]]
     ) -> None:
         """Write CSV file atomically using temporary file and rename.
 
+        Rows are consumed one at a time, so a generator keeps peak memory at one
+        row rather than a second copy of the file.
+
         Args:
             file_path: Target file path
             fieldnames: CSV field names
-            rows: List of row dictionaries
+            rows: Row dictionaries
         """
-        temp_file = file_path.with_suffix(".tmp")
+        # Unique per writer, so concurrent writers never share a temp file
+        temp_file = file_path.with_name(
+            f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
 
         try:
             with open(temp_file, "w", newline="", encoding="utf-8") as f:
-                # Acquire exclusive lock
-                _lock_file(f, exclusive=True)
-
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(_row_values(rows, fieldnames))
 
                 # Flush to disk
                 f.flush()
-                os.fsync(f.fileno())
-
-                # Release lock
-                _unlock_file(f)
+                if self.fsync_policy == "always":
+                    os.fsync(f.fileno())
 
             # Atomic rename
             temp_file.replace(file_path)
+            self._csv_cache.pop(file_path, None)
+            self._index_cache.pop(file_path, None)
+            if self.fsync_policy == "group":
+                _group_commit.add(file_path)
 
         except Exception as e:
             # Clean up temp file on error
@@ -191,30 +792,238 @@ class StorageManager:
                 temp_file.unlink()
             raise e
 
+    def _append_csv(self, file_path: Path, fieldnames: list[str], row: dict[str, Any]) -> bool:
+        """Append a single row to a CSV file in place.
+
+        Only possible when the file's header matches fieldnames exactly; older
+        files with a different column layout need a full rewrite instead.
+
+        Args:
+            file_path: Target file path
+            fieldnames: CSV field names
+            row: Row dictionary
+
+        Returns:
+            True if the row was appended, False if the file needs a rewrite
+        """
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=fieldnames)
+        writer.writeheader()
+        header = buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow(row)
+        data = buf.getvalue().encode("utf-8")
+
+        if not file_path.exists():
+            return False
+
+        with open(file_path, "a+b") as f:
+            # Acquire exclusive lock
+            _lock_file(f, exclusive=True)
+
+            try:
+                f.seek(0)
+                if f.readline() != header:
+                    return False
+
+                # Hand-edited files may lack a trailing newline
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    data = b"\r\n" + data
+
+                f.write(data)
+                f.flush()
+                if self.fsync_policy == "always":
+                    os.fsync(f.fileno())
+            finally:
+                # Release lock
+                _unlock_file(f)
+
+        self._csv_cache.pop(file_path, None)
+        self._index_cache.pop(file_path, None)
+        if self.fsync_policy == "group":
+            _group_commit.add(file_path)
+        return True
+
     def _read_csv(self, file_path: Path) -> list[dict[str, Any]]:
         """Read CSV file with locking.
 
+        Rows are cached until the file's signature changes, so repeated reads of
+        an unchanged file skip the lock and the CSV parse.
+
         Args:
             file_path: CSV file to read
 
         Returns:
-            List of row dictionaries
+            List of row dictionaries (a new list; the row dicts must not be mutated)
         """
-        if not file_path.exists():
+        signature = _file_signature(file_path)
+        if signature is None:
+            self._csv_cache.pop(file_path, None)
+            self._index_cache.pop(file_path, None)
             return []
 
-        with open(file_path, encoding="utf-8") as f:
+        cached = self._csv_cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+
+        rows = list(self._iter_csv(file_path))
+
+        # Only cache if nothing replaced the file while it was being read
+        if signature == _file_signature(file_path):
+            self._csv_cache[file_path] = (signature, rows)
+        return list(rows)
+
+    def _iter_csv(self, file_path: Path) -> Iterator[dict[str, Any]]:
+        """Iterate CSV rows without building a list of the whole file.
+
+        Serves cached rows when they are current; otherwise streams from disk,
+        holding a shared lock until iteration finishes. Repeated values in
+        low-cardinality columns share one string object across rows.
+
+        Args:
+            file_path: CSV file to read
+
+        Yields:
+            Row dictionaries (must not be mutated)
+        """
+        cached = self._csv_cache.get(file_path)
+        if cached is not None and cached[0] == _file_signature(file_path):
+            yield from cached[1]
+            return
+        if not file_path.exists():
+            return
+
+        with open(file_path, encoding="utf-8", newline="", buffering=_READ_BUFFER_SIZE) as f:
             # Acquire shared lock
             _lock_file(f, exclusive=False)
 
             try:
-                reader = csv.DictReader(f)
-                rows = list(reader)
+                # csv.reader + zip builds each dict with less per-row work than DictReader
+                reader = csv.reader(f)
+                fieldnames = next(reader, None)
+                if fieldnames is None:
+                    return
+                width = len(fieldnames)
+                columns = [i for i, name in enumerate(fieldnames) if name in _DEDUP_COLUMNS]
+                # Per-read table (not sys.intern) so one-off values aren't kept alive
+                seen: dict[str, str] = {}
+                for values in reader:
+                    if not values:
+                        continue  # Blank line
+                    if len(values) < width:
+                        # Short (hand-edited) rows get None for missing columns
+                        values += [None] * (width - len(values))  # type: ignore[list-item]
+                    for i in columns:
+                        value = values[i]
+                        values[i] = seen.setdefault(value, value)
+                    yield dict(zip(fieldnames, values))
             finally:
                 # Release lock
                 _unlock_file(f)
 
-        return rows
+    def _read_csv_indexed(self, file_path: Path) -> dict[str, dict[str, Any]]:
+        """Read CSV rows keyed by their id column, preserving file order.
+
+        Args:
+            file_path: CSV file to read
+
+        Returns:
+            Dict of id to row dictionary (a new dict; the row dicts must not be mutated)
+        """
+        signature = _file_signature(file_path)
+        cached = self._index_cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
+        by_id = {row["id"]: row for row in self._iter_csv(file_path)}
+        if signature is not None and signature == _file_signature(file_path):
+            self._index_cache[file_path] = (signature, by_id)
+        return dict(by_id)
+
+    def _find_row(self, file_path: Path, row_id: str) -> Optional[dict[str, Any]]:
+        """Find a single row by its id column without parsing the whole file.
+
+        The id is the first column, so the row is located with a byte search for
+        the id at the start of a line on a memory map of the file. Only the
+        matching record is parsed.
+
+        Args:
+            file_path: CSV file to search
+            row_id: Value of the id column
+
+        Returns:
+            Row dictionary, or None if not found
+        """
+        if not file_path.exists():
+            return None
+
+        cached = self._index_cache.get(file_path)
+        if cached is not None and cached[0] == _file_signature(file_path):
+            cached_row = cached[1].get(row_id)
+            return dict(cached_row) if cached_row is not None else None
+
+        # Encode the id exactly as csv.writer would, so quoted ids match too
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="").writerow([row_id, ""])
+        needle = b"\n" + buf.getvalue().encode("utf-8")
+
+        with open(file_path, "rb") as f:
+            # Acquire shared lock
+            _lock_file(f, exclusive=False)
+
+            try:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # A match inside a quoted field is preceded by an odd number of
+                    # quotes; keep a running parity so each byte is scanned once
+                    pos = mm.find(needle)
+                    parity = checked = 0
+                    while pos != -1:
+                        parity ^= _count_quotes(mm, checked, pos) & 1
+                        checked = pos
+                        if not parity:
+                            break
+                        pos = mm.find(needle, pos + 1)
+                    if pos == -1:
+                        return None
+
+                    # Extend to the end of the record, which may span quoted newlines
+                    end = pos
+                    parity = 0
+                    while True:
+                        newline = mm.find(b"\n", end + 1)
+                        if newline == -1:
+                            end = len(mm)
+                            break
+                        parity ^= _count_quotes(mm, end + 1, newline) & 1
+                        end = newline
+                        if not parity:
+                            break
+
+                    header = mm[: mm.find(b"\n")].decode("utf-8")
+                    record = mm[pos + 1 : end + 1].decode("utf-8")
+            finally:
+                # Release lock
+                _unlock_file(f)
+
+        fieldnames = next(csv.reader([header]))
+        values = next(csv.reader(io.StringIO(record, newline="")))
+        row: dict[str, Any] = dict.fromkeys(fieldnames)
+        row.update(zip(fieldnames, values))
+        return row
+
+    def flush(self) -> None:
+        """Fsync writes still waiting for the background flush.
+
+        Only needed under the "group" fsync policy, where it is also run
+        automatically about once a second and at interpreter exit.
+        """
+        _group_commit.flush()
 
     def backup(self, label: Optional[str] = None) -> Path:
         """Create backup of all data files.
@@ -233,7 +1042,7 @@ class StorageManager:
 
         for file in [self.entries_file, self.projects_file, self.categories_file]:
             if file.exists():
-                shutil.copy2(file, backup_path / file.name)
+                _clone_file(file, backup_path / file.name)
 
         return backup_path
 
@@ -245,49 +1054,174 @@ class StorageManager:
         Args:
             entry: Entry to save
         """
-        entries = self._read_csv(self.entries_file)
-        entry_dict = entry.to_dict()
-
-        # Update timestamp
-        entry.updated_at = datetime.now()
-        entry_dict["updated_at"] = entry.updated_at.isoformat()
-
-        # Find and update existing entry, or append new one
-        found = False
-        for i, row in enumerate(entries):
-            if row["id"] == str(entry.id):
-                entries[i] = entry_dict
-                found = True
-                break
-
-        if not found:
-            entries.append(entry_dict)
-
-        # Write atomically
-        self._write_csv_atomic(
-            self.entries_file,
-            list(entry_dict.keys()),
-            entries,
-        )
+        with self._write_lock(self.entries_file):
+            cached = self._valid_entries_cache()
+
+            # Update timestamp
+            entry.updated_at = datetime.now()
+            entry_dict = entry.to_dict()
+
+            if cached is not None:
+                is_new = entry_dict["id"] not in cached
+            else:
+                is_new = self._find_row(self.entries_file, entry_dict["id"]) is None
+
+            # Point at a newly running entry before writing it: a reader that finds
+            # the id not yet on disk repairs the pointer, which waits for this lock
+            if entry.end_time is None:
+                self._write_current_pointer(entry_dict["id"])
+
+            # New entries are appended; updates rewrite the file atomically
+            if not (is_new and self._append_csv(self.entries_file, list(entry_dict), entry_dict)):
+                # Update existing entry in place, or append new one
+                self._write_csv_atomic(
+                    self.entries_file,
+                    list(entry_dict.keys()),
+                    _replace_row(self._iter_csv(self.entries_file), entry_dict["id"], entry_dict),
+                )
+
+            if entry.end_time is not None and self._read_current_pointer() == entry_dict["id"]:
+                self._write_current_pointer("")
+
+            # Keep the parsed cache in step instead of re-parsing the file on next load
+            if cached is not None:
+                # Cache what a fresh read would return, not the caller's unnormalized object
+                cached[entry_dict["id"]] = (entry_dict["start_time"], Entry.from_dict(entry_dict))
+                self._store_entries_cache(cached)
+
+    def save_entries(self, entries: Iterable[Entry], replace: bool = False) -> None:
+        """Save or update many entries with a single rewrite.
+
+        Args:
+            entries: Entries to save
+            replace: If True, the saved entries replace all existing ones
+        """
+        with self._write_lock(self.entries_file):
+            cached = None if replace else self._valid_entries_cache()
+            rows = {} if replace else self._read_csv_indexed(self.entries_file)
+
+            updated_at = datetime.now()
+            saved: dict[str, tuple[str, Entry]] = {}
+            for entry in entries:
+                entry.updated_at = updated_at
+                entry_dict = entry.to_dict()
+                rows[entry_dict["id"]] = entry_dict
+                saved[entry_dict["id"]] = (entry_dict["start_time"], Entry.from_dict(entry_dict))
+
+            if not saved and not replace:
+                return
+
+            self._write_csv_atomic(self.entries_file, ENTRY_FIELDNAMES, rows.values())
 
-    def load_entries(self, limit: Optional[int] = None) -> list[Entry]:
-        """Load all entries from CSV.
+            # The running entry may have changed; let the next lookup rebuild the pointer
+            self.current_file.unlink(missing_ok=True)
+
+            if replace:
+                self._store_entries_cache(saved)
+            elif cached is not None:
+                cached.update(saved)
+                self._store_entries_cache(cached)
+
+    def _valid_entries_cache(self) -> Optional[dict[str, tuple[str, Entry]]]:
+        """Get the parsed entries cache if the entries file hasn't changed since.
+
+        Returns:
+            Cached id -> (start_time, Entry) in file order, or None if stale
+        """
+        if self._entries_cache is None:
+            return None
+        signature, cached = self._entries_cache
+        if signature != _file_signature(self.entries_file):
+            self._entries_cache = None
+            return None
+        return cached
+
+    def _store_entries_cache(self, cached: dict[str, tuple[str, Entry]]) -> None:
+        """Remember parsed entries against the current entries file signature.
+
+        Args:
+            cached: id -> (start_time, Entry) in file order
+        """
+        signature = _file_signature(self.entries_file)
+        self._entries_cache = (signature, cached) if signature is not None else None
+
+    def _load_entries_cached(self) -> dict[str, tuple[str, Entry]]:
+        """Load parsed entries, re-reading the CSV only when it has changed.
+
+        Returns:
+            id -> (start_time, Entry) in file order
+        """
+        cached = self._valid_entries_cache()
+        if cached is None:
+            signature = _file_signature(self.entries_file)
+            cached = {
+                row["id"]: (row["start_time"], Entry.from_dict(row))
+                for row in self._iter_csv(self.entries_file)
+            }
+            if signature is not None and signature == _file_signature(self.entries_file):
+                self._entries_cache = (signature, cached)
+        return cached
+
+    def load_entries(
+        self,
+        limit: Optional[int] = None,
+        project: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[Entry]:
+        """Load entries from CSV, most recent first.
+
+        Filters are applied before the limit, and to the raw rows when the
+        parsed-entry cache is cold so only matching entries are constructed.
 
         Args:
             limit: Maximum number of entries to load (most recent first)
+            project: Only include entries for this project
+            category: Only include entries in this category
+            start_date: Only include entries starting at or after this time
+            end_date: Only include entries starting at or before this time
 
         Returns:
             List of Entry objects
         """
-        rows = self._read_csv(self.entries_file)
+        filters = (project, category, start_date, end_date)
+        filtered = any(filters)
+
+        cached = self._valid_entries_cache()
+        if cached is None and (limit or filtered):
+            # Stream rows so only the matches (or the top K) are ever held
+            rows: Iterable[dict[str, Any]] = self._iter_csv(self.entries_file)
+            if filtered:
+                rows = (
+                    row
+                    for row in rows
+                    if _entry_matches(row["project"], row["category"], row["start_time"], *filters)
+                )
+            if limit:
+                rows = heapq.nlargest(limit, rows, key=itemgetter("start_time"))
+            else:
+                rows = sorted(rows, key=itemgetter("start_time"), reverse=True)
+            return [Entry.from_dict(row) for row in rows]
+
+        if cached is None:
+            cached = self._load_entries_cached()
+
+        items: Any = cached.values()
+        if filtered:
+            items = [
+                item
+                for item in items
+                if _entry_matches(item[1].project, item[1].category, item[1].start_time, *filters)
+            ]
 
         # Sort by start_time descending (most recent first)
-        rows.sort(key=lambda r: r["start_time"], reverse=True)
-
         if limit:
-            rows = rows[:limit]
+            items = heapq.nlargest(limit, items, key=itemgetter(0))
+        else:
+            items = sorted(items, key=itemgetter(0), reverse=True)
 
-        return [Entry.from_dict(row) for row in rows]
+        return [_copy_entry(entry) for _, entry in items]
 
     def delete_entry(self, entry_id: str) -> bool:
         """Delete an entry by ID.
@@ -298,55 +1232,120 @@ class StorageManager:
         Returns:
             True if entry was deleted, False if not found
         """
-        entries = self._read_csv(self.entries_file)
-        original_count = len(entries)
+        with self._write_lock(self.entries_file):
+            if self._find_row(self.entries_file, entry_id) is None:
+                return False
+
+            cached = self._valid_entries_cache()
+            rows = _replace_row(self._iter_csv(self.entries_file), entry_id, None)
+
+            # Get fieldnames from first entry or use defaults
+            first = next(rows, None)
+            if first is None:
+                fieldnames = ENTRY_FIELDNAMES
+            else:
+                fieldnames = list(first.keys())
+                rows = itertools.chain((first,), rows)
+
+            self._write_csv_atomic(self.entries_file, fieldnames, rows)
+
+            if cached is not None:
+                cached.pop(entry_id, None)
+                self._store_entries_cache(cached)
+            if self._read_current_pointer() == entry_id:
+                self._write_current_pointer("")
+            return True
 
-        # Filter out entry with matching ID
-        entries = [e for e in entries if e["id"] != entry_id]
+    def get_current_entry(self) -> Optional[Entry]:
+        """Get currently running entry (if any).
 
-        if len(entries) == original_count:
-            return False
+        Returns:
+            Current entry or None if no entry is running
+        """
+        pointer = self._read_current_pointer()
+        if pointer == "":
+            return None
+        entry = self._pointed_entry(pointer)
+        if entry is not None:
+            return entry
+
+        # Pointer missing or stale: repair it under the write lock so it can't race
+        # a save, re-reading it first in case another writer already did
+        with self._write_lock(self.entries_file):
+            pointer = self._read_current_pointer()
+            if pointer == "":
+                return None
+            entry = self._pointed_entry(pointer)
+            if entry is None:
+                entry = self._scan_current_entry()
+                self._write_current_pointer(str(entry.id) if entry is not None else "")
+            return entry
+
+    def _pointed_entry(self, pointer: Optional[str]) -> Optional[Entry]:
+        """Resolve the running entry pointer.
 
-        # Get fieldnames from first entry or use defaults
-        fieldnames = (
-            list(entries[0].keys())
-            if entries
-            else [
-                "id",
-                "start_time",
-                "end_time",
-                "duration_seconds",
-                "task_name",
-                "project",
-                "category",
-                "tags",
-                "notes",
-                "active_process",
-                "active_window",
-                "idle_time_seconds",
-                "manual_entry",
-                "edited",
-                "auto_tracked",
-                "rule_id",
-                "created_at",
-                "updated_at",
-            ]
-        )
+        Args:
+            pointer: Value read from the pointer file
 
-        self._write_csv_atomic(self.entries_file, fieldnames, entries)
-        return True
+        Returns:
+            The entry it names if that entry is running, otherwise None
+        """
+        if not pointer:
+            return None
+        entry = self.get_entry(pointer)
+        return entry if entry is not None and entry.is_running else None
 
-    def get_current_entry(self) -> Optional[Entry]:
-        """Get currently running entry (if any).
+    def _scan_current_entry(self) -> Optional[Entry]:
+        """Find the running entry by scanning all entries.
 
         Returns:
-            Current entry or None if no entry is running
+            Latest-starting running entry, or None
         """
-        entries = self.load_entries()
-        for entry in entries:
-            if entry.is_running:
-                return entry
-        return None
+        cached = self._valid_entries_cache()
+        if cached is not None:
+            running = [item for item in cached.values() if item[1].is_running]
+            if not running:
+                return None
+            return _copy_entry(max(running, key=itemgetter(0))[1])
+
+        # Single pass over raw rows: compare strings, parse only the running row
+        current: Optional[dict[str, Any]] = None
+        for row in self._iter_csv(self.entries_file):
+            if not row["end_time"] and (
+                current is None or row["start_time"] > current["start_time"]
+            ):
+                current = row
+        return Entry.from_dict(current) if current is not None else None
+
+    def _read_current_pointer(self) -> Optional[str]:
+        """Read the running entry pointer.
+
+        Returns:
+            Running entry id, "" if nothing is running, or None if unknown
+        """
+        try:
+            return self.current_file.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+
+    def _write_current_pointer(self, entry_id: str) -> None:
+        """Atomically replace the running entry pointer.
+
+        Must be called with the entries write lock held. The pointer is
+        validated on every read, so it is not fsynced.
+
+        Args:
+            entry_id: Running entry id, or "" if nothing is running
+        """
+        # Unique per writer, so a concurrent writer can't rename our temp file away
+        fd, temp_name = tempfile.mkstemp(prefix=".current.", suffix=".tmp", dir=self.state_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(entry_id)
+            os.replace(temp_name, self.current_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
 
     def get_entry(self, entry_id: str) -> Optional[Entry]:
         """Get a specific entry by ID.
@@ -357,13 +1356,16 @@ class StorageManager:
         Returns:
             Entry object or None if not found
         """
-        entries = self.load_entries()
         # Convert to string for comparison since entry.id is UUID
         entry_id_str = str(entry_id)
-        for entry in entries:
-            if str(entry.id) == entry_id_str:
-                return entry
-        return None
+
+        cached = self._valid_entries_cache()
+        if cached is not None:
+            item = cached.get(entry_id_str)
+            return _copy_entry(item[1]) if item is not None else None
+
+        row = self._find_row(self.entries_file, entry_id_str)
+        return Entry.from_dict(row) if row is not None else None
 
     def update_entry(self, entry: Entry) -> None:
         """Update an existing entry.
@@ -387,25 +1389,22 @@ class StorageManager:
         Args:
             project: Project to save
         """
-        projects = self._read_csv(self.projects_file)
-        project_dict = project.to_dict()
-
-        # Find and update existing project, or append new one
-        found = False
-        for i, row in enumerate(projects):
-            if row["id"] == project.id:
-                projects[i] = project_dict
-                found = True
-                break
+        with self._write_lock(self.projects_file):
+            project_dict = project.to_dict()
+            if self._find_row(self.projects_file, project.id) is None and self._append_csv(
+                self.projects_file, list(project_dict), project_dict
+            ):
+                return
 
-        if not found:
-            projects.append(project_dict)
+            # Update existing project in place, or append new one
+            projects = self._read_csv_indexed(self.projects_file)
+            projects[project.id] = project_dict
 
-        self._write_csv_atomic(
-            self.projects_file,
-            list(project_dict.keys()),
-            projects,
-        )
+            self._write_csv_atomic(
+                self.projects_file,
+                list(project_dict.keys()),
+                projects.values(),
+            )
 
     def load_projects(self) -> list[Project]:
         """Load all projects from CSV.
@@ -425,22 +1424,8 @@ class StorageManager:
         Returns:
             Project or None if not found
         """
-        projects = self.load_projects()
-        for project in projects:
-            if project.id == project_id:
-                return project
-        return None
-
-    def update_project(self, project: Project) -> None:
-        """Update an existing project.
-
-        Args:
-            project: Project object with updated data
-
-        Note:
-            This uses save_project which handles updates automatically.
-        """
-        self.save_project(project)
+        row = self._find_row(self.projects_file, project_id)
+        return Project.from_dict(row) if row is not None else None
 
     def delete_project(self, project_id: str) -> bool:
         """Delete a project by ID.
@@ -451,24 +1436,23 @@ class StorageManager:
         Returns:
             True if project was deleted, False if not found
         """
-        projects = self._read_csv(self.projects_file)
-        original_count = len(projects)
-
-        # Filter out project with matching ID
-        projects = [p for p in projects if p["id"] != project_id]
-
-        if len(projects) == original_count:
-            return False
+        with self._write_lock(self.projects_file):
+            if self._find_row(self.projects_file, project_id) is None:
+                return False
+
+            projects = self._read_csv_indexed(self.projects_file)
+            if projects.pop(project_id, None) is None:
+                return False
+
+            # Get fieldnames from first project or use defaults
+            fieldnames = (
+                list(next(iter(projects.values())).keys())
+                if projects
+                else ["id", "name", "description", "client", "active", "created_at", "updated_at"]
+            )
 
-        # Get fieldnames from first project or use defaults
-        fieldnames = (
-            list(projects[0].keys())
-            if projects
-            else ["id", "name", "description", "client", "active", "created_at", "updated_at"]
-        )
-
-        self._write_csv_atomic(self.projects_file, fieldnames, projects)
-        return True
+            self._write_csv_atomic(self.projects_file, fieldnames, projects.values())
+            return True
 
     # Category operations
 
@@ -478,25 +1462,22 @@ class StorageManager:
         Args:
             category: Category to save
         """
-        categories = self._read_csv(self.categories_file)
-        category_dict = category.to_dict()
-
-        # Find and update existing category, or append new one
-        found = False
-        for i, row in enumerate(categories):
-            if row["id"] == category.id:
-                categories[i] = category_dict
-                found = True
-                break
+        with self._write_lock(self.categories_file):
+            category_dict = category.to_dict()
+            if self._find_row(self.categories_file, category.id) is None and self._append_csv(
+                self.categories_file, list(category_dict), category_dict
+            ):
+                return
 
-        if not found:
-            categories.append(category_dict)
+            # Update existing category in place, or append new one
+            categories = self._read_csv_indexed(self.categories_file)
+            categories[category.id] = category_dict
 
-        self._write_csv_atomic(
-            self.categories_file,
-            list(category_dict.keys()),
-            categories,
-        )
+            self._write_csv_atomic(
+                self.categories_file,
+                list(category_dict.keys()),
+                categories.values(),
+            )
 
     def load_categories(self) -> list[Category]:
         """Load all categories from CSV.
@@ -516,22 +1497,8 @@ class StorageManager:
         Returns:
             Category or None if not found
         """
-        categories = self.load_categories()
-        for category in categories:
-            if category.id == category_id:
-                return category
-        return None
-
-    def update_category(self, category: Category) -> None:
-        """Update an existing category.
-
-        Args:
-            category: Category object with updated data
-
-        Note:
-            This uses save_category which handles updates automatically.
-        """
-        self.save_category(category)
+        row = self._find_row(self.categories_file, category_id)
+        return Category.from_dict(row) if row is not None else None
 
     def delete_category(self, category_id: str) -> bool:
         """Delete a category by ID.
@@ -542,26 +1509,25 @@ class StorageManager:
         Returns:
             True if category was deleted, False if not found
         """
-        categories = self._read_csv(self.categories_file)
-        original_count = len(categories)
-
-        # Filter out category with matching ID
-        categories = [c for c in categories if c["id"] != category_id]
-
-        if len(categories) == original_count:
-            return False
-
-        # Get fieldnames from first category or use defaults
-        fieldnames = (
-            list(categories[0].keys())
-            if categories
-            else ["id", "name", "color", "created_at", "updated_at"]
-        )
+        with self._write_lock(self.categories_file):
+            if self._find_row(self.categories_file, category_id) is None:
+                return False
+
+            categories = self._read_csv_indexed(self.categories_file)
+            if categories.pop(category_id, None) is None:
+                return False
+
+            # Get fieldnames from first category or use defaults
+            fieldnames = (
+                list(next(iter(categories.values())).keys())
+                if categories
+                else ["id", "name", "color", "created_at", "updated_at"]
+            )
 
-        self._write_csv_atomic(self.categories_file, fieldnames, categories)
-        return True
+            self._write_csv_atomic(self.categories_file, fieldnames, categories.values())
+            return True
 
-    # Process Rule Management
+    # Process rule operations
 
     def save_rule(self, rule: ProcessRule) -> None:
         """Save or update a process rule.
@@ -569,34 +1535,34 @@ class StorageManager:
         Args:
             rule: ProcessRule to save
         """
-        rules = self._read_csv(self.rules_file)
-        rule_dict = rule.to_dict()
-
-        # Find and update existing rule, or append new one
-        found = False
-        for i, row in enumerate(rules):
-            if row["id"] == rule.id:
-                rules[i] = rule_dict
-                found = True
-                break
-
-        if not found:
-            rules.append(rule_dict)
-
-        fieldnames = [
-            "id",
-            "pattern",
-            "task_name",
-            "project",
-            "category",
-            "tags",
-            "enabled",
-            "learned",
-            "confidence",
-            "match_count",
-            "created_at",
-        ]
-        self._write_csv_atomic(self.rules_file, fieldnames, rules)
+        with self._write_lock(self.rules_file):
+            rule_dict = rule.to_dict()
+            fieldnames = RULE_FIELDNAMES
+            if self._find_row(self.rules_file, rule.id) is None and self._append_csv(
+                self.rules_file, fieldnames, rule_dict
+            ):
+                return
+
+            # Update existing rule in place, or append new one
+            rules = self._read_csv_indexed(self.rules_file)
+            rules[rule.id] = rule_dict
+
+            self._write_csv_atomic(self.rules_file, fieldnames, rules.values())
+
+    def save_rules(self, rules: Iterable[ProcessRule]) -> None:
+        """Save or update many process rules with a single rewrite.
+
+        Args:
+            rules: ProcessRules to save
+        """
+        with self._write_lock(self.rules_file):
+            saved = {rule.id: rule.to_dict() for rule in rules}
+            if not saved:
+                return
+
+            rows = self._read_csv_indexed(self.rules_file)
+            rows.update(saved)
+            self._write_csv_atomic(self.rules_file, RULE_FIELDNAMES, rows.values())
 
     def load_rules(self, enabled_only: bool = False) -> list[ProcessRule]:
         """Load all process rules.
@@ -624,11 +1590,8 @@ class StorageManager:
         Returns:
             ProcessRule or None if not found
         """
-        rules = self.load_rules()
-        for rule in rules:
-            if rule.id == rule_id:
-                return rule
-        return None
+        row = self._find_row(self.rules_file, rule_id)
+        return ProcessRule.from_dict(row) if row is not None else None
 
     def delete_rule(self, rule_id: str) -> bool:
         """Delete a process rule.
@@ -639,32 +1602,83 @@ class StorageManager:
         Returns:
             True if rule was deleted, False if not found
         """
-        rules = self._read_csv(self.rules_file)
-        original_count = len(rules)
+        with self._write_lock(self.rules_file):
+            if self._find_row(self.rules_file, rule_id) is None:
+                return False
 
-        # Remove rule with matching ID
-        rules = [r for r in rules if r["id"] != rule_id]
+            rules = self._read_csv_indexed(self.rules_file)
+            if rules.pop(rule_id, None) is None:
+                return False
 
-        if len(rules) == original_count:
-            return False
+            fieldnames = list(next(iter(rules.values())).keys()) if rules else RULE_FIELDNAMES
 
-        fieldnames = (
-            list(rules[0].keys())
-            if rules
-            else [
-                "id",
-                "pattern",
-                "task_name",
-                "project",
-                "category",
-                "tags",
-                "enabled",
-                "learned",
-                "confidence",
-                "match_count",
-                "created_at",
-            ]
-        )
+            self._write_csv_atomic(self.rules_file, fieldnames, rules.values())
+            return True
 
-        self._write_csv_atomic(self.rules_file, fieldnames, rules)
-        return True
+
+def open_storage(
+    data_dir: Optional[Path] = None, backend: str = "csv", fsync_policy: FsyncPolicy = "group"
+) -> Storage:
+    """Open the configured storage backend.
+
+    Selecting "sqlite" for a data directory that only has CSV data migrates it
+    on first use; the CSV files are backed up and left in place. The migration
+    only runs once: if the CSV entries change after that (e.g. while the
+    backend was switched back to "csv"), a warning is logged and the database
+    is opened as is.
+
+    Args:
+        data_dir: Custom data directory. Defaults to ~/.time-audit/data
+        backend: "csv" or "sqlite"
+        fsync_policy: Durability policy passed to the backend
+
+    Returns:
+        Storage instance
+
+    Raises:
+        ValueError: If backend is not recognized
+    """
+    if backend == "csv":
+        return StorageManager(data_dir, fsync_policy=fsync_policy)
+    if backend != "sqlite":
+        raise ValueError(f"Invalid storage backend: {backend}")
+
+    from time_audit.core.sqlite_storage import SqliteStorage, migrate_csv_to_sqlite
+
+    if data_dir is None:
+        data_dir = Path.home() / ".time-audit" / "data"
+    db_file = data_dir / "time_audit.db"
+    entries_file = data_dir / "entries.csv"
+    if entries_file.exists():
+        if not db_file.exists():
+            return migrate_csv_to_sqlite(StorageManager(data_dir, fsync_policy=fsync_policy))
+
+        # Recent writes may still be in the WAL rather than the database file
+        db_mtime = max(p.stat().st_mtime for p in (db_file, Path(f"{db_file}-wal")) if p.exists())
+        if entries_file.stat().st_mtime > db_mtime:
+            logger.warning(
+                "%s changed after %s was last written; CSV changes made since the "
+                "migration are not in the SQLite database",
+                entries_file,
+                db_file,
+            )
+    return SqliteStorage(data_dir, fsync_policy=fsync_policy)
+
+
+def open_configured_storage(
+    data_dir: Optional[Path] = None, config: Optional[ConfigManager] = None
+) -> Storage:
+    """Open the storage backend selected by advanced.storage_backend.
+
+    Args:
+        data_dir: Custom data directory. Defaults to ~/.time-audit/data
+        config: Configuration to read. Defaults to the user's config file, if
+            there is one; a missing file is not created and selects CSV
+
+    Returns:
+        Storage instance
+    """
+    if config is None:
+        config = ConfigManager.load_existing()
+    backend = config.get("advanced.storage_backend", "csv") if config else "csv"
+    return open_storage(data_dir, backend=backend)
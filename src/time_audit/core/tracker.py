@@ -1,22 +1,43 @@
 """Core time tracking engine."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 from time_audit.core.models import Entry
-from time_audit.core.storage import StorageManager
+from time_audit.core.storage import Storage, StorageManager
 
 
 class TimeTracker:
     """Core time tracking functionality."""
 
-    def __init__(self, storage: Optional[StorageManager] = None):
+    def __init__(self, storage: Optional[Storage] = None):
         """Initialize time tracker.
 
         Args:
-            storage: Storage manager instance. Creates default if None.
+            storage: Storage backend. Creates a default CSV StorageManager if None.
         """
         self.storage = storage or StorageManager()
+        self._listeners: list[Callable[[Optional[Entry]], None]] = []
+
+    def add_listener(self, callback: Callable[[Optional[Entry]], None]) -> None:
+        """Register a callback for changes to the running entry.
+
+        Only changes made through this tracker are reported; entries changed
+        by other processes are not.
+
+        Args:
+            callback: Called with the new running entry, or None when tracking stops
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, current: Optional[Entry]) -> None:
+        """Report a change of the running entry to listeners.
+
+        Args:
+            current: New running entry, or None
+        """
+        for callback in self._listeners:
+            callback(current)
 
     def start(
         self,
@@ -49,7 +70,28 @@ class TimeTracker:
                 f"Stop it first or use 'switch' command."
             )
 
-        # Create new entry
+        return self._create_entry(task_name, project, category, tags, notes)
+
+    def _create_entry(
+        self,
+        task_name: str,
+        project: Optional[str],
+        category: Optional[str],
+        tags: Optional[list[str]],
+        notes: Optional[str],
+    ) -> Entry:
+        """Create and save a new running entry without checking for a running one.
+
+        Args:
+            task_name: Name of the task
+            project: Project identifier
+            category: Category identifier
+            tags: List of tags
+            notes: Additional notes
+
+        Returns:
+            Created entry
+        """
         entry = Entry(
             task_name=task_name,
             start_time=datetime.now(),
@@ -60,6 +102,7 @@ class TimeTracker:
         )
 
         self.storage.save_entry(entry)
+        self._notify(entry)
         return entry
 
     def stop(self, notes: Optional[str] = None) -> Optional[Entry]:
@@ -78,13 +121,25 @@ class TimeTracker:
         if not current:
             raise ValueError("No entry is currently running")
 
-        # Update entry
+        return self._stop_entry(current, notes)
+
+    def _stop_entry(self, current: Entry, notes: Optional[str] = None) -> Entry:
+        """End a running entry and save it.
+
+        Args:
+            current: Running entry
+            notes: Optional notes to add to the entry
+
+        Returns:
+            Stopped entry
+        """
         current.end_time = datetime.now()
         if notes:
             current.notes = notes
-        current.updated_at = datetime.now()
 
+        # save_entry stamps updated_at
         self.storage.save_entry(current)
+        self._notify(None)
         return current
 
     def switch(
@@ -107,16 +162,12 @@ class TimeTracker:
         Returns:
             Tuple of (stopped entry, new entry)
         """
-        # Stop current entry if exists
-        stopped = None
-        try:
-            stopped = self.stop()
-        except ValueError:
-            # No entry running, that's fine
-            pass
+        # Stop current entry if exists; a single lookup serves both stop and start
+        current = self.storage.get_current_entry()
+        stopped = self._stop_entry(current) if current else None
 
         # Start new entry
-        new_entry = self.start(task_name, project, category, tags, notes)
+        new_entry = self._create_entry(task_name, project, category, tags, notes)
 
         return stopped, new_entry
 
@@ -138,7 +189,10 @@ class TimeTracker:
         if not current:
             return False
 
-        return self.storage.delete_entry(str(current.id))
+        deleted = self.storage.delete_entry(str(current.id))
+        if deleted:
+            self._notify(None)
+        return deleted
 
     def add_manual_entry(
         self,
@@ -204,28 +258,13 @@ class TimeTracker:
         Returns:
             Filtered list of entries
         """
-        entries = self.storage.load_entries(limit=limit)
-
-        # Apply filters
-        filtered = []
-        for entry in entries:
-            # Project filter
-            if project and entry.project != project:
-                continue
-
-            # Category filter
-            if category and entry.category != category:
-                continue
-
-            # Date filters
-            if start_date and entry.start_time < start_date:
-                continue
-            if end_date and entry.start_time > end_date:
-                continue
-
-            filtered.append(entry)
-
-        return filtered
+        return self.storage.load_entries(
+            limit=limit,
+            project=project,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
     def edit_entry(
         self,
@@ -257,15 +296,11 @@ class TimeTracker:
             ValueError: If entry not found
         """
         # Find entry
-        entries = self.storage.load_entries()
-        entry = None
-        for e in entries:
-            if str(e.id) == entry_id:
-                entry = e
-                break
+        entry = self.storage.get_entry(entry_id)
 
         if not entry:
             raise ValueError(f"Entry not found: {entry_id}")
+        was_running = entry.is_running
 
         # Update fields
         if task_name is not None:
@@ -287,6 +322,8 @@ class TimeTracker:
         entry.updated_at = datetime.now()
 
         self.storage.save_entry(entry)
+        if was_running or entry.is_running:
+            self._notify(entry if entry.is_running else None)
         return entry
 
     def delete_entry(self, entry_id: str) -> bool:
@@ -298,4 +335,9 @@ class TimeTracker:
         Returns:
             True if deleted, False if not found
         """
-        return self.storage.delete_entry(entry_id)
+        # Only look the entry up when someone listens for the running entry going away
+        entry = self.storage.get_entry(entry_id) if self._listeners else None
+        deleted = self.storage.delete_entry(entry_id)
+        if deleted and entry is not None and entry.is_running:
+            self._notify(None)
+        return deleted
@@ -8,8 +8,28 @@ The daemon provides:
 - IPC interface for CLI communication
 """
 
-from time_audit.daemon.daemon import TimeAuditDaemon
-from time_audit.daemon.ipc import IPCClient, IPCServer
-from time_audit.daemon.state import DaemonState
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from time_audit.daemon.daemon import TimeAuditDaemon
+    from time_audit.daemon.ipc import IPCClient, IPCServer
+    from time_audit.daemon.state import DaemonState
 
 __all__ = ["TimeAuditDaemon", "IPCServer", "IPCClient", "DaemonState"]
+
+# Exports are imported on first access: CLI commands that only talk to the daemon
+# over IPC shouldn't pay for loading the daemon, its detectors and config schema
+_EXPORTS = {
+    "TimeAuditDaemon": "time_audit.daemon.daemon",
+    "IPCServer": "time_audit.daemon.ipc",
+    "IPCClient": "time_audit.daemon.ipc",
+    "DaemonState": "time_audit.daemon.state",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import package exports lazily."""
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
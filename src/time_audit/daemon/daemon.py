@@ -2,18 +2,23 @@
 
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
 import time
 from datetime import datetime
+from itertools import count
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Optional
 
 from time_audit.automation import IdleDetector, Notifier, ProcessDetector
 from time_audit.core.config import ConfigManager
+from time_audit.core.models import Entry
+from time_audit.core.storage import open_configured_storage
 from time_audit.core.tracker import TimeTracker
-from time_audit.daemon.ipc import IPCServer
+from time_audit.daemon.ipc import IPCServer, PreEncodedResult
 from time_audit.daemon.platform import (
     get_log_file_path,
     get_pid_file_path,
@@ -23,6 +28,48 @@ from time_audit.daemon.state import PIDFileManager, StateManager
 
 logger = logging.getLogger(__name__)
 
+# Safety refresh of tracking state when no change has been signalled
+STATE_REFRESH_INTERVAL = 60.0
+
+# (epoch second, ISO string) for the most recent _now_iso() call
+_iso_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Get the current local time as an ISO string with seconds precision.
+
+    Bursts of events within the same second share one formatted string.
+
+    Returns:
+        ISO 8601 timestamp
+    """
+    global _iso_cache
+    now = int(time.time())
+    cached_at, value = _iso_cache
+    if now != cached_at:
+        value = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        _iso_cache = (now, value)
+    return value
+
+
+# Niceness added to the monitoring threads when housekeeping affinity is enabled
+HOUSEKEEPING_NICE = 10
+
+
+def _pin_housekeeping() -> None:
+    """Move the calling thread to the last allowed CPU and lower its priority.
+
+    On Linux both settings apply to the calling thread and are inherited by the
+    threads it starts, so detector threads started afterwards follow it.
+    """
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+        if hasattr(os, "nice"):
+            os.nice(HOUSEKEEPING_NICE)
+    except OSError as e:
+        logger.warning(f"Could not pin monitoring to a housekeeping CPU: {e}")
+
 
 class DaemonError(Exception):
     """Daemon-related error."""
@@ -61,11 +108,12 @@ class TimeAuditDaemon:
 
         # Initialize components
         self.config = config or ConfigManager()
-        self.data_dir = data_dir or Path(self.config.get("general.data_dir"))
+        self.data_dir = data_dir or Path(self.config.get("general.data_dir")).expanduser()
 
         # Core components
-        self.tracker = TimeTracker(data_dir=self.data_dir)  # type: ignore[call-arg]
-        self.state_manager = StateManager()
+        self.tracker = TimeTracker(open_configured_storage(self.data_dir, self.config))
+        # Bursts of detector events are written to the state file at most twice a second
+        self.state_manager = StateManager(flush_interval=0.5)
         self.pid_manager = PIDFileManager(get_pid_file_path())
         self.ipc_server = IPCServer()
 
@@ -77,10 +125,22 @@ class TimeAuditDaemon:
         # Control flags
         self.running = False
         self._shutdown_event = threading.Event()
+        # Set when tracking state may have changed; wakes the monitoring loop
+        self._tracker_dirty = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self.tracker.add_listener(self._on_tracker_change)
+
+        # Event counters mirrored into the state file (next() is atomic under the GIL)
+        self._process_checks = count(1)
+        self._idle_checks = count(1)
+        self._notifications = count(1)
 
         # Monitoring threads
         self._monitoring_thread: Optional[threading.Thread] = None
 
+        # Writes queued log records to the log handlers off the calling thread
+        self._log_listener: Optional[QueueListener] = None
+
     def start(self, foreground: bool = False) -> None:
         """Start the daemon.
 
@@ -103,6 +163,10 @@ class TimeAuditDaemon:
         if not foreground:
             self._daemonize()
 
+        # Threads don't survive fork, so the log listener starts in the final process
+        if self._log_listener:
+            self._log_listener.start()
+
         # Write PID file
         self.pid_manager.write(os.getpid())
 
@@ -124,6 +188,7 @@ class TimeAuditDaemon:
         except Exception as e:
             logger.error(f"Failed to start IPC server: {e}")
             self.cleanup()
+            self._stop_logging()
             raise DaemonError(f"Failed to start IPC server: {e}")
 
         # Start monitoring
@@ -148,6 +213,7 @@ class TimeAuditDaemon:
         logger.info("Stopping daemon...")
         self.running = False
         self._shutdown_event.set()
+        self._tracker_dirty.set()
 
         # Stop IPC server
         self.ipc_server.stop()
@@ -166,14 +232,21 @@ class TimeAuditDaemon:
         self.cleanup()
 
         logger.info("Daemon stopped")
+        self._stop_logging()
 
     def cleanup(self) -> None:
         """Clean up daemon resources."""
+        self.tracker.storage.flush()
         self.pid_manager.remove()
         self.state_manager.clear()
 
     def _setup_logging(self) -> None:
-        """Setup daemon logging."""
+        """Setup daemon logging.
+
+        Loggers only enqueue records; a QueueListener thread does the file and
+        console writes, so event handlers never block on log I/O. The listener
+        is started by start() once the process has daemonized.
+        """
         log_file = get_log_file_path()
         log_level = getattr(logging, self.config.get("advanced.log_level", "INFO"))
 
@@ -186,16 +259,35 @@ class TimeAuditDaemon:
         file_handler.setLevel(log_level)
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
 
         # Console handler (for foreground mode)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+
+    def _stop_logging(self) -> None:
+        """Flush queued log records and stop the log listener."""
+        listener, self._log_listener = self._log_listener, None
+        if listener:
+            listener.stop()
 
     def _daemonize(self) -> None:
-        """Daemonize the process (Unix double-fork)."""
+        """Daemonize the process (Unix double-fork).
+
+        Skipped when systemd started the process: it already runs detached,
+        and forking away from the main PID would make a Type=simple unit
+        consider the service exited.
+        """
+        if os.environ.get("INVOCATION_ID") or os.environ.get("NOTIFY_SOCKET"):
+            logger.info("Started by systemd, not daemonizing")
+            return
+
         try:
             # First fork
             pid = os.fork()
@@ -215,12 +307,10 @@ class TimeAuditDaemon:
             # Redirect standard file descriptors
             sys.stdout.flush()
             sys.stderr.flush()
-            with open(os.devnull) as devnull:
-                os.dup2(devnull.fileno(), sys.stdin.fileno())
-            with open(os.devnull, "a+") as devnull:
-                os.dup2(devnull.fileno(), sys.stdout.fileno())
-            with open(os.devnull, "a+") as devnull:
-                os.dup2(devnull.fileno(), sys.stderr.fileno())
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for stream in (sys.stdin, sys.stdout, sys.stderr):
+                os.dup2(devnull, stream.fileno())
+            os.close(devnull)
 
         except OSError as e:
             logger.error(f"Failed to daemonize: {e}")
@@ -272,6 +362,10 @@ class TimeAuditDaemon:
         """Main monitoring loop."""
         logger.info("Monitoring loop started")
 
+        # Keep monitoring off the CPUs the user is working on; detector threads inherit this
+        if self.config.get("advanced.housekeeping_affinity", False):
+            _pin_housekeeping()
+
         # Start monitoring threads
         threads = []
 
@@ -287,33 +381,46 @@ class TimeAuditDaemon:
             idle_thread.start()
             threads.append(idle_thread)
 
-        # Main loop - just keep daemon alive and update state periodically
+        # Main loop - refresh tracking state when signalled, with a slow safety refresh
+        self._tracker_dirty.set()
         while self.running:
             try:
-                # Update state with current tracking info
-                current_entry = self.tracker.get_current_entry()  # type: ignore[attr-defined]
-                if current_entry:
-                    self.state_manager.update(
-                        tracking=True,
-                        current_entry_id=current_entry.id,
-                        current_task_name=current_entry.task_name,
-                    )
-                else:
-                    self.state_manager.update(
-                        tracking=False,
-                        current_entry_id=None,
-                        current_task_name=None,
-                    )
-
-                # Sleep for a bit
-                time.sleep(5)
+                self._tracker_dirty.wait(timeout=STATE_REFRESH_INTERVAL)
+                self._tracker_dirty.clear()
+                if self.running:
+                    self._refresh_tracking_state()
 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(1)
+                self._shutdown_event.wait(timeout=1)
 
         logger.info("Monitoring loop stopped")
 
+    def _refresh_tracking_state(self) -> None:
+        """Copy the tracker's current entry into daemon state if it changed."""
+        # Called from both the monitoring loop and IPC handler threads
+        with self._refresh_lock:
+            current_entry = self.tracker.status()
+            tracking = {
+                "tracking": current_entry is not None,
+                "current_entry_id": str(current_entry.id) if current_entry else None,
+                "current_task_name": current_entry.task_name if current_entry else None,
+            }
+
+            # Skip the state file write when nothing changed
+            state = self.state_manager.get()
+            if state is not None and all(getattr(state, k) == v for k, v in tracking.items()):
+                return
+            self.state_manager.update(**tracking)
+
+    def _on_tracker_change(self, entry: Optional[Entry]) -> None:
+        """Handle a change of the running entry made through the daemon's tracker.
+
+        Args:
+            entry: New running entry, or None
+        """
+        self._tracker_dirty.set()
+
     def _on_process_change(self, old_process: Optional[str], new_process: str) -> None:
         """Handle process change event.
 
@@ -323,13 +430,15 @@ class TimeAuditDaemon:
         """
         logger.info(f"Process changed: {old_process} -> {new_process}")
 
-        # Update state
-        current_state = self.state_manager.get()
-        self.state_manager.update(
-            last_detected_process=new_process,
-            last_process_check=datetime.now().isoformat(),
-            process_checks_count=(current_state.process_checks_count + 1 if current_state else 1),
-        )
+        # Update state (including the notification below) with a single write
+        fields: dict[str, Any] = {
+            "last_detected_process": new_process,
+            "last_process_check": _now_iso(),
+            "process_checks_count": next(self._process_checks),
+        }
+        if self.notifier:
+            fields["notifications_sent"] = next(self._notifications)
+        self.state_manager.update(**fields)
 
         # TODO: Integrate with rule engine for automatic task switching
         # For now, just send notification
@@ -338,10 +447,6 @@ class TimeAuditDaemon:
                 title="Process Changed",
                 message=f"Detected: {new_process}",
             )
-            current_state = self.state_manager.get()
-            self.state_manager.update(
-                notifications_sent=(current_state.notifications_sent + 1 if current_state else 1),
-            )
 
     def _on_idle(self, idle_seconds: int) -> None:
         """Handle idle event.
@@ -351,32 +456,36 @@ class TimeAuditDaemon:
         """
         logger.info(f"User idle for {idle_seconds} seconds")
 
-        # Update state
-        current_state = self.state_manager.get()
-        self.state_manager.update(
-            is_idle=True,
-            idle_since=datetime.now().isoformat(),
-            idle_checks_count=(current_state.idle_checks_count + 1 if current_state else 1),
-        )
+        # The foreground process can't change meaningfully while nobody is at the machine
+        if self.process_detector:
+            self.process_detector.pause()
+
+        # Update state (including the notification below) with a single write
+        fields: dict[str, Any] = {
+            "is_idle": True,
+            "idle_since": _now_iso(),
+            "idle_checks_count": next(self._idle_checks),
+        }
+        if self.notifier:
+            fields["notifications_sent"] = next(self._notifications)
+        self.state_manager.update(**fields)
 
         # Send notification
         if self.notifier:
-            idle_seconds // 60
             self.notifier.notify_idle(idle_seconds)
-            current_state = self.state_manager.get()
-            self.state_manager.update(
-                notifications_sent=(current_state.notifications_sent + 1 if current_state else 1),
-            )
 
     def _on_active(self) -> None:
         """Handle return from idle."""
         logger.info("User returned from idle")
 
+        if self.process_detector:
+            self.process_detector.resume()
+
         # Update state
         self.state_manager.update(
             is_idle=False,
             idle_since=None,
-            last_activity_check=datetime.now().isoformat(),
+            last_activity_check=_now_iso(),
         )
 
     def _register_ipc_handlers(self) -> None:
@@ -393,11 +502,11 @@ class TimeAuditDaemon:
             params: Request parameters
 
         Returns:
-            Pong response
+            Pong response with the daemon's clock as epoch seconds
         """
-        return {"pong": True, "timestamp": datetime.now().isoformat()}
+        return {"pong": True, "timestamp": time.time()}
 
-    def _handle_status(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _handle_status(self, params: dict[str, Any]) -> PreEncodedResult:
         """Handle status request.
 
         Args:
@@ -406,11 +515,11 @@ class TimeAuditDaemon:
         Returns:
             Daemon status
         """
-        state = self.state_manager.get_dict()
-        return {
-            "running": self.running,
-            "state": state,
-        }
+        # Entries may have been started or stopped by another process since the last refresh
+        self._refresh_tracking_state()
+        state = self.state_manager.get_json_bytes()
+        running = b"true" if self.running else b"false"
+        return PreEncodedResult(b'{"running":' + running + b',"state":' + state + b"}")
 
     def _handle_stop(self, params: dict[str, Any]) -> dict[str, Any]:
         """Handle stop request.
@@ -5,15 +5,94 @@ Uses JSON-RPC 2.0 protocol over Unix domain sockets (Linux/macOS) or named pipes
 
 import json
 import logging
+import os
+import selectors
 import socket
+import struct
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, BinaryIO, Callable, Optional
 
 from time_audit.daemon.platform import Platform, get_ipc_socket_path, get_platform
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Clients are short-lived CLI calls; a small pool bounds threads if one floods the socket
+MAX_CLIENT_WORKERS = 8
+
+# Stops a stalled client from holding a worker indefinitely
+CLIENT_TIMEOUT = 5.0
+
+# How long a kept-alive client connection may sit idle between requests
+KEEPALIVE_TIMEOUT = 1.0
+
+# Upper bound on a single newline-terminated message
+MAX_MESSAGE_SIZE = 1 << 20
+
+# Named pipe instances kept listening on Windows; each is re-armed after its client leaves
+PIPE_INSTANCES = MAX_CLIENT_WORKERS
+
+
+def _dumps(obj: Any, newline: bool = False) -> bytes:
+    """Encode a JSON-RPC message, using orjson when it is installed.
+
+    Args:
+        obj: Message to encode
+        newline: Append the newline delimiter during encoding, saving a bytes copy
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if newline else None)
+    text = json.dumps(obj)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON-RPC message, using orjson when it is installed.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Decoded message
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_message(reader: BinaryIO) -> bytes:
+    """Read one newline-terminated message from a connection.
+
+    JSON encoding escapes newlines inside strings, so a bare newline always
+    ends a message. The buffered reader scans for it in C and grows its
+    buffer in amortized linear time.
+
+    Args:
+        reader: Buffered reader from socket.makefile("rb"), kept for the connection's lifetime
+
+    Returns:
+        Message bytes including the trailing newline (empty if the peer closed first)
+
+    Raises:
+        IPCError: If the message exceeds MAX_MESSAGE_SIZE
+    """
+    data = reader.readline(MAX_MESSAGE_SIZE + 1)
+    if len(data) > MAX_MESSAGE_SIZE:
+        raise IPCError("Message too large")
+    return data
+
 
 class IPCError(Exception):
     """IPC communication error."""
@@ -21,6 +100,50 @@ class IPCError(Exception):
     pass
 
 
+def _is_same_user(client_socket: socket.socket) -> bool:
+    """Check that a Unix socket peer runs as the daemon's user.
+
+    Uses SO_PEERCRED where available (Linux). Elsewhere the owner-only socket
+    file is the only access control.
+
+    Args:
+        client_socket: Accepted client socket
+
+    Returns:
+        False if the peer is known to be another user
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = client_socket.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return bool(uid == os.geteuid())
+
+
+class PreEncodedResult(bytes):
+    """Handler result that is already JSON-encoded.
+
+    Spliced into the JSON-RPC response as-is instead of being encoded again.
+    """
+
+
+def _encode_response(response: dict[str, Any], newline: bool = False) -> bytes:
+    """Encode a JSON-RPC response.
+
+    Args:
+        response: JSON-RPC response dictionary
+        newline: Terminate the message with the newline delimiter
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    result = response.get("result")
+    if isinstance(result, PreEncodedResult):
+        envelope = _dumps({"jsonrpc": "2.0", "id": response["id"]})
+        end = b"}\n" if newline else b"}"
+        return b"".join((envelope[:-1], b',"result":', result, end))
+    return _dumps(response, newline=newline)
+
+
 class IPCServer:
     """IPC server for handling client requests.
 
@@ -39,6 +162,12 @@ class IPCServer:
         self.running = False
         self.handlers: dict[str, Callable[..., Any]] = {}
         self._server_thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Self-pipe that wakes the Unix accept loop on shutdown
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        # Event handle that wakes the Windows accept loop on shutdown
+        self._wake_event: Any = None
 
     def register_handler(self, method: str, handler: Callable[..., Any]) -> None:
         """Register a handler for a JSON-RPC method.
@@ -64,10 +193,17 @@ class IPCServer:
         # Create socket
         if self.platform in (Platform.LINUX, Platform.MACOS):
             self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.socket.bind(str(self.socket_path))
-            self.socket.listen(5)
-            # Set socket permissions (owner only)
-            self.socket_path.chmod(0o600)
+            # Create the socket file owner-only, so there is no window before a chmod
+            old_umask = os.umask(0o077)
+            try:
+                self.socket.bind(str(self.socket_path))
+            finally:
+                os.umask(old_umask)
+            # Bursts of CLI calls can outpace accept(); a full backlog refuses connections
+            self.socket.listen(socket.SOMAXCONN)
+            # The accept loop waits in select(); never block in accept() itself
+            self.socket.setblocking(False)
+            self._wake_r, self._wake_w = os.pipe()
         elif self.platform == Platform.WINDOWS:
             # Windows named pipes handled differently
             self._start_windows_server()
@@ -76,6 +212,7 @@ class IPCServer:
             raise IPCError(f"Unsupported platform: {self.platform}")
 
         self.running = True
+        self._pool = self._create_pool()
         self._server_thread = threading.Thread(target=self._accept_loop, daemon=True)
         self._server_thread.start()
         logger.info(f"IPC server started on {self.socket_path}")
@@ -83,49 +220,76 @@ class IPCServer:
     def _start_windows_server(self) -> None:
         """Start Windows named pipe server."""
         try:
+            import win32event  # type: ignore[import-untyped]
             import win32file  # type: ignore[import-untyped]  # noqa: F401
             import win32pipe  # type: ignore[import-untyped]  # noqa: F401
 
+            self._wake_event = win32event.CreateEvent(None, True, False, None)
             self.running = True
+            self._pool = self._create_pool()
             self._server_thread = threading.Thread(target=self._accept_loop_windows, daemon=True)
             self._server_thread.start()
             logger.info(f"IPC server started on {self.socket_path}")
         except ImportError:
             raise IPCError("pywin32 is required for Windows daemon support")
 
+    def _create_pool(self) -> ThreadPoolExecutor:
+        """Create the worker pool that handles client connections."""
+        return ThreadPoolExecutor(max_workers=MAX_CLIENT_WORKERS, thread_name_prefix="ipc-client")
+
     def _accept_loop(self) -> None:
-        """Accept client connections (Unix)."""
-        while self.running:
-            try:
-                if self.socket is None:
-                    break
+        """Accept client connections (Unix).
 
-                self.socket.settimeout(1.0)  # Allow periodic checks of self.running
-                try:
-                    client_socket, _ = self.socket.accept()
-                except socket.timeout:
-                    continue
+        Blocks in select() until a client connects or stop() writes to the wake pipe.
+        """
+        if self.socket is None or self._wake_r is None:
+            return
 
-                # Handle client in separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client, args=(client_socket,), daemon=True
-                )
-                client_thread.start()
-            except Exception as e:
-                if self.running:  # Only log if not shutting down
-                    logger.error(f"Error in accept loop: {e}")
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.socket, selectors.EVENT_READ)
+            selector.register(self._wake_r, selectors.EVENT_READ)
+
+            while self.running:
+                try:
+                    for key, _ in selector.select():
+                        if key.fileobj == self._wake_r:
+                            return
+
+                        try:
+                            client_socket, _ = self.socket.accept()
+                        except BlockingIOError:
+                            continue  # Client went away before we got to it
+
+                        if not _is_same_user(client_socket):
+                            logger.warning("Rejected IPC connection from another user")
+                            client_socket.close()
+                            continue
+
+                        # Handle client on a pooled worker thread
+                        client_socket.settimeout(CLIENT_TIMEOUT)
+                        self._submit(self._handle_client, client_socket)
+                except Exception as e:
+                    if self.running:  # Only log if not shutting down
+                        logger.error(f"Error in accept loop: {e}")
 
     def _accept_loop_windows(self) -> None:
-        """Accept client connections (Windows named pipes)."""
+        """Accept client connections (Windows named pipes).
+
+        Keeps PIPE_INSTANCES overlapped pipe instances listening and waits on
+        their connect events. An instance is reused for the next client once
+        its worker disconnects it, so no handles are created per connection.
+        """
         import pywintypes  # type: ignore[import-untyped]
+        import win32event  # type: ignore[import-untyped]
         import win32file  # type: ignore[import-untyped]
         import win32pipe  # type: ignore[import-untyped]
 
-        while self.running:
-            try:
+        instances: list[tuple[Any, Any]] = []
+        try:
+            for _ in range(PIPE_INSTANCES):
                 pipe = win32pipe.CreateNamedPipe(
                     str(self.socket_path),
-                    win32pipe.PIPE_ACCESS_DUPLEX,
+                    win32pipe.PIPE_ACCESS_DUPLEX | win32file.FILE_FLAG_OVERLAPPED,
                     win32pipe.PIPE_TYPE_MESSAGE
                     | win32pipe.PIPE_READMODE_MESSAGE
                     | win32pipe.PIPE_WAIT,
@@ -135,98 +299,164 @@ class IPCServer:
                     0,
                     None,
                 )
+                overlapped = pywintypes.OVERLAPPED()
+                overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+                instances.append((pipe, overlapped))
+                self._arm_pipe(pipe, overlapped)
 
-                # Wait for client connection (with timeout)
+            # The wake event comes last so a connect is never lost to shutdown
+            events = [overlapped.hEvent for _, overlapped in instances]
+            events.append(self._wake_event)
+
+            while self.running:
                 try:
-                    win32pipe.ConnectNamedPipe(pipe, None)
-                    # Handle client in separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client_windows, args=(pipe,), daemon=True
-                    )
-                    client_thread.start()
-                except pywintypes.error as e:
-                    if e.args[0] != 232:  # ERROR_NO_DATA (client disconnected)
-                        logger.error(f"Error accepting connection: {e}")
-                    win32file.CloseHandle(pipe)
-            except Exception as e:
-                if self.running:
-                    logger.error(f"Error in Windows accept loop: {e}")
+                    rc = win32event.WaitForMultipleObjects(events, False, win32event.INFINITE)
+                    index = rc - win32event.WAIT_OBJECT_0
+                    if index >= len(instances):
+                        return
+
+                    pipe, overlapped = instances[index]
+                    # The worker re-arms the instance once its client is done
+                    win32event.ResetEvent(overlapped.hEvent)
+                    self._submit(self._handle_client_windows, (pipe, overlapped))
+                except Exception as e:
+                    if self.running:
+                        logger.error(f"Error in Windows accept loop: {e}")
+        except Exception as e:
+            logger.error(f"Error creating named pipes: {e}")
+        finally:
+            for pipe, overlapped in instances:
+                win32file.CloseHandle(pipe)
+                win32file.CloseHandle(overlapped.hEvent)
 
-    def _handle_client(self, client_socket: socket.socket) -> None:
-        """Handle a client connection (Unix).
+    def _arm_pipe(self, pipe: Any, overlapped: Any) -> None:
+        """Start an overlapped wait for the next client on a pipe instance.
 
         Args:
-            client_socket: Client socket
+            pipe: Named pipe handle
+            overlapped: OVERLAPPED whose event is signalled on connect
         """
-        try:
-            # Receive request
-            data = b""
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if b"\n" in chunk:  # Simple message delimiter
-                    break
+        import win32event
+        import win32pipe
+        import winerror  # type: ignore[import-untyped]
 
-            if not data:
-                return
+        if win32pipe.ConnectNamedPipe(pipe, overlapped) == winerror.ERROR_PIPE_CONNECTED:
+            # A client connected between instance creation and the call
+            win32event.SetEvent(overlapped.hEvent)
 
-            # Parse JSON-RPC request
-            try:
-                request = json.loads(data.decode("utf-8"))
-            except json.JSONDecodeError as e:
-                error_response = self._create_error_response(None, -32700, str(e))
-                client_socket.sendall(json.dumps(error_response).encode("utf-8"))
-                return
+    def _submit(self, handler: Callable[[Any], None], connection: Any) -> None:
+        """Hand a client connection to the worker pool.
 
-            # Process request
-            response = self._process_request(request)
+        Args:
+            handler: Connection handler
+            connection: Client socket or pipe handle
+        """
+        if self._pool is None:
+            raise IPCError("IPC server is not running")
+        self._pool.submit(handler, connection)
 
-            # Send response
-            response_data = json.dumps(response).encode("utf-8") + b"\n"
-            client_socket.sendall(response_data)
+    def _handle_client(self, client_socket: socket.socket) -> None:
+        """Handle a client connection (Unix).
+
+        Serves requests until the client closes the connection or leaves it idle
+        for KEEPALIVE_TIMEOUT, so one client can make several calls per connect.
+
+        Args:
+            client_socket: Client socket
+        """
+        try:
+            with client_socket.makefile("rb") as reader:
+                while self.running:
+                    # Receive request
+                    try:
+                        data = _read_message(reader)
+                    except socket.timeout:
+                        return
+
+                    if not data:
+                        return
+
+                    # Parse JSON-RPC request
+                    try:
+                        request = _loads(data)
+                    except json.JSONDecodeError as e:
+                        error_response = self._create_error_response(None, -32700, str(e))
+                        client_socket.sendall(_dumps(error_response, newline=True))
+                        return
+
+                    # Process request
+                    response = self._process_request(request)
+
+                    # Send response
+                    response_data = _encode_response(response, newline=True)
+                    client_socket.sendall(response_data)
+
+                    # Don't let an idle kept-alive client hold a pool worker for long
+                    client_socket.settimeout(KEEPALIVE_TIMEOUT)
 
         except Exception as e:
             logger.error(f"Error handling client: {e}")
         finally:
             client_socket.close()
 
-    def _handle_client_windows(self, pipe: Any) -> None:
+    def _handle_client_windows(self, instance: tuple[Any, Any]) -> None:
         """Handle a client connection (Windows named pipe).
 
         Args:
-            pipe: Named pipe handle
+            instance: Named pipe handle and its connect OVERLAPPED
         """
+        import pywintypes
+        import win32event
         import win32file
+        import win32pipe
+
+        pipe, connect_overlapped = instance
+
+        # The pipe is opened for overlapped I/O, so reads and writes need their own
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+
+        def read() -> bytes:
+            _, buffer = win32file.ReadFile(pipe, win32file.AllocateReadBuffer(65536), overlapped)
+            return bytes(buffer[: win32file.GetOverlappedResult(pipe, overlapped, True)])
+
+        def write(data: bytes) -> None:
+            win32file.WriteFile(pipe, data, overlapped)
+            win32file.GetOverlappedResult(pipe, overlapped, True)
 
         try:
             # Read request
-            result, data = win32file.ReadFile(pipe, 65536)
+            data = read()
 
             if not data:
                 return
 
             # Parse JSON-RPC request
             try:
-                request = json.loads(data.decode("utf-8"))
+                request = _loads(data)
             except json.JSONDecodeError as e:
                 error_response = self._create_error_response(None, -32700, str(e))
-                response_data = json.dumps(error_response).encode("utf-8")
-                win32file.WriteFile(pipe, response_data)
+                write(_dumps(error_response))
                 return
 
             # Process request
             response = self._process_request(request)
 
             # Send response
-            response_data = json.dumps(response).encode("utf-8")
-            win32file.WriteFile(pipe, response_data)
+            write(_encode_response(response))
 
         except Exception as e:
             logger.error(f"Error handling Windows client: {e}")
         finally:
-            win32file.CloseHandle(pipe)
+            win32file.CloseHandle(overlapped.hEvent)
+            # Recycle the instance for the next client instead of closing it
+            try:
+                win32pipe.DisconnectNamedPipe(pipe)
+                if self.running:
+                    self._arm_pipe(pipe, connect_overlapped)
+            except Exception as e:
+                if self.running:
+                    logger.error(f"Error re-arming named pipe: {e}")
 
     def _process_request(self, request: dict[str, Any]) -> dict[str, Any]:
         """Process a JSON-RPC request.
@@ -283,14 +513,36 @@ class IPCServer:
         logger.info("Stopping IPC server...")
         self.running = False
 
+        # Wake the accept loop
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
+        if self._wake_event is not None:
+            import win32event
+
+            win32event.SetEvent(self._wake_event)
+
+        # Wait for server thread
+        if self._server_thread:
+            self._server_thread.join(timeout=2.0)
+
         # Close socket
         if self.socket:
             self.socket.close()
             self.socket = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+        if self._wake_event is not None:
+            import win32file
 
-        # Wait for server thread
-        if self._server_thread:
-            self._server_thread.join(timeout=2.0)
+            win32file.CloseHandle(self._wake_event)
+            self._wake_event = None
+
+        # In-flight clients finish on their own; don't block shutdown on them
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
         # Clean up socket file
         if self.platform in (Platform.LINUX, Platform.MACOS):
@@ -318,6 +570,28 @@ class IPCClient:
         self.platform = get_platform()
         self._request_id = 0
 
+        # Unix socket connection reused across calls
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "IPCClient":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, closing the connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the daemon, if one is open."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
     def call(self, method: str, params: Optional[dict[str, Any]] = None) -> Any:
         """Call a remote method.
 
@@ -373,37 +647,61 @@ class IPCClient:
     def _send_request_unix(self, request: dict[str, Any]) -> dict[str, Any]:
         """Send request via Unix socket.
 
+        The connection is kept open for later calls. If the daemon closed a
+        reused connection in the meantime, the request is retried once on a
+        fresh one.
+
         Args:
             request: JSON-RPC request
 
         Returns:
             JSON-RPC response
         """
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(self.timeout)
+        request_data = _dumps(request, newline=True)
 
-        try:
-            sock.connect(str(self.socket_path))
+        with self._lock:
+            while True:
+                sock, reader = self._sock, self._reader
+                reused = sock is not None and reader is not None
+                try:
+                    if sock is None or reader is None:
+                        sock, reader = self._connect()
 
-            # Send request
-            request_data = json.dumps(request).encode("utf-8") + b"\n"
-            sock.sendall(request_data)
+                    # Send request
+                    sock.sendall(request_data)
 
-            # Receive response
-            response_data = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                response_data += chunk
-                if b"\n" in chunk:
-                    break
-
-            response = json.loads(response_data.decode("utf-8"))
-            return response  # type: ignore[no-any-return]
+                    # Receive response
+                    response_data = _read_message(reader)
+                    if not response_data:
+                        raise ConnectionResetError("Connection closed by daemon")
 
-        finally:
+                    response = _loads(response_data)
+                    return response  # type: ignore[no-any-return]
+
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close()
+                    if not reused:
+                        raise
+                except BaseException:
+                    self.close()
+                    raise
+
+    def _connect(self) -> tuple[socket.socket, BinaryIO]:
+        """Open a new Unix socket connection to the daemon.
+
+        Returns:
+            Tuple of (socket, buffered reader), also stored for reuse
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except BaseException:
             sock.close()
+            raise
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        return self._sock, self._reader
 
     def _send_request_windows(self, request: dict[str, Any]) -> dict[str, Any]:
         """Send request via Windows named pipe.
@@ -433,12 +731,12 @@ class IPCClient:
             )
 
             # Send request
-            request_data = json.dumps(request).encode("utf-8")
+            request_data = _dumps(request)
             win32file.WriteFile(handle, request_data)
 
             # Receive response
             result, response_data = win32file.ReadFile(handle, 65536)
-            response = json.loads(response_data.decode("utf-8"))
+            response = _loads(response_data)
 
             return response  # type: ignore[no-any-return]
 
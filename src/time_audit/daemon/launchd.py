@@ -1,9 +1,12 @@
 """Launchd integration for macOS."""
 
 import logging
+import os
 import subprocess
 from pathlib import Path
 
+from time_audit.daemon.platform import read_tail, write_atomic
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +34,8 @@ class LaunchdService:
         <key>SuccessfulExit</key>
         <false/>
     </dict>
+    <key>ProcessType</key>
+    <string>Adaptive</string>
     <key>StandardOutPath</key>
     <string>{log_dir}/daemon-stdout.log</string>
     <key>StandardErrorPath</key>
@@ -72,9 +77,8 @@ class LaunchdService:
                 home_dir=home_dir,
             )
 
-            # Write plist file
-            with open(self.plist_file, "w") as f:
-                f.write(plist_content)
+            # Write plist file (atomically, so launchd never loads a partial plist)
+            write_atomic(self.plist_file, plist_content.encode())
 
             logger.info(f"Launchd plist created: {self.plist_file}")
 
@@ -202,12 +206,21 @@ class LaunchdService:
         Returns:
             Tuple of (success, message)
         """
-        # Launchd doesn't have a restart command, so we stop and start
-        success, message = self.stop()
-        if not success:
-            return success, message
+        try:
+            # kickstart -k kills the running instance and starts it again in one call
+            result = subprocess.run(
+                ["launchctl", "kickstart", "-k", f"gui/{os.getuid()}/{self.SERVICE_NAME}"],
+                capture_output=True,
+                text=True,
+            )
 
-        return self.start()
+            if result.returncode != 0:
+                return False, f"Failed to restart service: {result.stderr}"
+
+            return True, "Service restarted successfully"
+
+        except Exception as e:
+            return False, str(e)
 
     def status(self) -> tuple[bool, str]:
         """Get service status.
@@ -249,20 +262,10 @@ class LaunchdService:
             logs = ""
 
             if stdout_log.exists():
-                result = subprocess.run(
-                    ["tail", "-n", str(lines), str(stdout_log)],
-                    capture_output=True,
-                    text=True,
-                )
-                logs += "=== STDOUT ===\n" + result.stdout + "\n"
+                logs += "=== STDOUT ===\n" + read_tail(stdout_log, lines) + "\n"
 
             if stderr_log.exists():
-                result = subprocess.run(
-                    ["tail", "-n", str(lines), str(stderr_log)],
-                    capture_output=True,
-                    text=True,
-                )
-                logs += "=== STDERR ===\n" + result.stdout + "\n"
+                logs += "=== STDERR ===\n" + read_tail(stderr_log, lines) + "\n"
 
             return logs if logs else "No logs available"
 
@@ -4,7 +4,9 @@ import os
 import platform
 import tempfile
 from enum import Enum
+from functools import cache
 from pathlib import Path
+from typing import Optional
 
 
 class Platform(Enum):
@@ -16,6 +18,7 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
+@cache
 def get_platform() -> Platform:
     """Detect the current platform.
 
@@ -33,6 +36,26 @@ def get_platform() -> Platform:
         return Platform.UNKNOWN
 
 
+@cache
+def _socket_dir(xdg_runtime: Optional[str]) -> Path:
+    """Compute the Unix socket directory, once per XDG_RUNTIME_DIR value.
+
+    Args:
+        xdg_runtime: Value of XDG_RUNTIME_DIR, if set
+
+    Returns:
+        Directory holding the IPC socket
+    """
+    # Use XDG_RUNTIME_DIR if available, otherwise fall back to temp directory
+    # This ensures short paths and proper permissions
+    if xdg_runtime:
+        return Path(xdg_runtime) / "time-audit"
+    # Use system temp directory to avoid permission issues
+    return Path(tempfile.gettempdir()) / "time-audit" / f"user-{os.getuid()}"
+
+
+# The directories below are created on every call, not cached: runtime and temp
+# directories may be cleaned up while a long-lived daemon is running
 def get_ipc_socket_path() -> Path:
     """Get the IPC socket path for the current platform.
 
@@ -45,14 +68,7 @@ def get_ipc_socket_path() -> Path:
     plat = get_platform()
 
     if plat in (Platform.LINUX, Platform.MACOS):
-        # Use XDG_RUNTIME_DIR if available, otherwise fall back to temp directory
-        # This ensures short paths and proper permissions
-        xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
-        if xdg_runtime:
-            runtime_dir = Path(xdg_runtime) / "time-audit"
-        else:
-            # Use system temp directory to avoid permission issues
-            runtime_dir = Path(tempfile.gettempdir()) / "time-audit" / f"user-{os.getuid()}"
+        runtime_dir = _socket_dir(os.environ.get("XDG_RUNTIME_DIR"))
         runtime_dir.mkdir(parents=True, exist_ok=True)
         return runtime_dir / "daemon.sock"
     elif plat == Platform.WINDOWS:
@@ -70,11 +86,7 @@ def get_pid_file_path() -> Path:
     """
     plat = get_platform()
 
-    if plat in (Platform.LINUX, Platform.MACOS):
-        runtime_dir = Path.home() / ".time-audit" / "runtime"
-        runtime_dir.mkdir(parents=True, exist_ok=True)
-        return runtime_dir / "daemon.pid"
-    elif plat == Platform.WINDOWS:
+    if plat in (Platform.LINUX, Platform.MACOS, Platform.WINDOWS):
         runtime_dir = Path.home() / ".time-audit" / "runtime"
         runtime_dir.mkdir(parents=True, exist_ok=True)
         return runtime_dir / "daemon.pid"
@@ -93,6 +105,57 @@ def get_log_file_path() -> Path:
     return log_dir / "daemon.log"
 
 
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that it is never seen half-written.
+
+    The data is written and synced to a temporary file next to the target,
+    which then replaces the target.
+
+    Args:
+        path: File to write
+        data: New file content
+    """
+    temp_file = path.with_name(path.name + ".tmp")
+    with open(temp_file, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, path)
+
+
+def read_tail(path: Path, lines: int, block_size: int = 8192) -> str:
+    """Read the last lines of a file, like ``tail -n``.
+
+    Reads backwards from the end in blocks, so only the tail of a large log is read.
+
+    Args:
+        path: File to read
+        lines: Number of lines to return
+        block_size: Bytes read per step
+
+    Returns:
+        The last lines of the file, newline-terminated
+    """
+    if lines <= 0:
+        return ""
+
+    blocks: list[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # One newline more than needed guarantees the first kept line is complete
+        while pos > 0 and newlines <= lines:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            newlines += block.count(b"\n")
+            blocks.append(block)
+
+    tail = b"".join(reversed(blocks)).splitlines()[-lines:]
+    return "".join(line.decode(errors="replace") + "\n" for line in tail)
+
+
 def is_daemon_supported() -> tuple[bool, str]:
     """Check if daemon is supported on this platform.
 
@@ -2,16 +2,26 @@
 
 import json
 import logging
+import os
+import sys
 import threading
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+_DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DaemonState:
     """Daemon state information."""
 
@@ -50,7 +60,8 @@ class DaemonState:
         Returns:
             State as dictionary
         """
-        return asdict(self)
+        # All fields are flat, so the recursive copy asdict() makes isn't needed
+        return {name: getattr(self, name) for name in _STATE_FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DaemonState":
@@ -65,14 +76,19 @@ class DaemonState:
         return cls(**data)
 
 
+_STATE_FIELDS = tuple(field.name for field in fields(DaemonState))
+
+
 class StateManager:
     """Manages daemon state persistence."""
 
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(self, state_file: Optional[Path] = None, flush_interval: float = 0.0):
         """Initialize state manager.
 
         Args:
             state_file: Path to state file (default: ~/.time-audit/state/daemon.json)
+            flush_interval: If positive, update() writes the file at most once per this
+                many seconds, coalescing bursts of updates; 0 writes on every update
         """
         if state_file is None:
             state_dir = Path.home() / ".time-audit" / "state"
@@ -82,6 +98,12 @@ class StateManager:
         self.state_file = state_file
         self._state: Optional[DaemonState] = None
         self._lock = threading.Lock()
+        # Bumped on every state change; keys the cached JSON encoding
+        self._version = 0
+        self._json_cache: tuple[int, bytes] = (-1, b"")
+        self.flush_interval = flush_interval
+        # Pending write for coalesced updates (None when the file is current)
+        self._flush_timer: Optional[threading.Timer] = None
 
     def initialize(self, pid: int) -> DaemonState:
         """Initialize daemon state.
@@ -97,6 +119,7 @@ class StateManager:
                 started_at=datetime.now().isoformat(),
                 pid=pid,
             )
+            self._version += 1
             self._save()
             logger.info("Daemon state initialized")
             return self._state
@@ -111,9 +134,10 @@ class StateManager:
             return None
 
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
+            raw = self.state_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             self._state = DaemonState.from_dict(data)
+            self._version += 1
             logger.info("Daemon state loaded")
             return self._state
         except Exception as e:
@@ -125,16 +149,24 @@ class StateManager:
         with self._lock:
             self._save()
 
+    def flush(self) -> None:
+        """Write any coalesced updates to the state file now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._save()
+
     def _save(self) -> None:
         """Internal save method (assumes lock is held)."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
         if self._state is None:
             return
 
         try:
             # Atomic write: write to temp file, then rename
             temp_file = self.state_file.with_suffix(".tmp")
-            with open(temp_file, "w") as f:
-                json.dump(self._state.to_dict(), f, indent=2)
+            temp_file.write_bytes(self._encode())
             temp_file.replace(self.state_file)
             logger.debug("Daemon state saved")
         except Exception as e:
@@ -143,6 +175,8 @@ class StateManager:
     def update(self, **kwargs: Any) -> None:
         """Update state fields.
 
+        Updates that don't change any value leave the state file untouched.
+
         Args:
             **kwargs: Fields to update
         """
@@ -151,13 +185,25 @@ class StateManager:
                 logger.warning("Cannot update uninitialized state")
                 return
 
+            changed = False
             for key, value in kwargs.items():
-                if hasattr(self._state, key):
-                    setattr(self._state, key, value)
-                else:
+                if not hasattr(self._state, key):
                     logger.warning(f"Unknown state field: {key}")
+                elif getattr(self._state, key) != value:
+                    setattr(self._state, key, value)
+                    changed = True
 
-            self._save()
+            if not changed:
+                return
+
+            self._version += 1
+            if self.flush_interval <= 0:
+                self._save()
+            elif self._flush_timer is None:
+                # Later updates within the interval ride along with this write
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
     def get(self) -> Optional[DaemonState]:
         """Get current state.
@@ -179,10 +225,45 @@ class StateManager:
                 return {}
             return self._state.to_dict()
 
+    def get_json_bytes(self) -> bytes:
+        """Get current state as compact UTF-8 JSON.
+
+        The encoding is cached until the state next changes, so repeated status
+        requests against unchanged state skip serialization.
+
+        Returns:
+            JSON object bytes ("{}" if uninitialized)
+        """
+        with self._lock:
+            return self._encode()
+
+    def _encode(self) -> bytes:
+        """Encode the current state as compact JSON (assumes lock is held).
+
+        Shared by status requests and the state file, so each state change is
+        serialized at most once.
+
+        Returns:
+            JSON object bytes ("{}" if uninitialized)
+        """
+        version, data = self._json_cache
+        if version != self._version:
+            state = self._state.to_dict() if self._state is not None else {}
+            if orjson is not None:
+                data = orjson.dumps(state)
+            else:
+                data = json.dumps(state, separators=(",", ":")).encode("utf-8")
+            self._json_cache = (self._version, data)
+        return data
+
     def clear(self) -> None:
         """Clear state and delete state file."""
         with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
             self._state = None
+            self._version += 1
             if self.state_file.exists():
                 self.state_file.unlink()
             logger.info("Daemon state cleared")
@@ -249,14 +330,22 @@ class PIDFileManager:
         if pid is None:
             return False
 
+        if os.name == "posix":
+            # Signal 0 checks for existence without importing psutil
+            try:
+                os.kill(pid, 0)
+            except PermissionError:
+                return True  # Exists, but owned by another user
+            except OSError:
+                return False
+            return True
+
         try:
             import psutil  # type: ignore[import-untyped]
 
             return bool(psutil.pid_exists(pid))
         except ImportError:
             # Fallback: try to send signal 0
-            import os
-
             try:
                 os.kill(pid, 0)
                 return True
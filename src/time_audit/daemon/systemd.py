@@ -4,6 +4,8 @@ import logging
 import subprocess
 from pathlib import Path
 
+from time_audit.daemon.platform import write_atomic
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,9 +53,8 @@ WantedBy=default.target
             # Generate unit file
             unit_content = self.UNIT_FILE_TEMPLATE.format(python_path=python_path)
 
-            # Write unit file
-            with open(self.unit_file, "w") as f:
-                f.write(unit_content)
+            # Write unit file (atomically, so daemon-reload never sees a partial unit)
+            write_atomic(self.unit_file, unit_content.encode())
 
             logger.info(f"Systemd unit file created: {self.unit_file}")
 
@@ -80,9 +81,12 @@ WantedBy=default.target
             Tuple of (success, message)
         """
         try:
-            # Stop and disable service first
-            self.stop()
-            self.disable()
+            # Stop and disable service first (--now does both in one call)
+            subprocess.run(
+                ["systemctl", "--user", "disable", "--now", self.SERVICE_NAME],
+                capture_output=True,
+                text=True,
+            )
 
             # Remove unit file
             if self.unit_file.exists():
@@ -1,13 +1,51 @@
 """Windows Service integration."""
 
 import logging
+import xml.etree.ElementTree as ET
+from datetime import timedelta
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Service states reported by QueryServiceStatus (win32service.SERVICE_STOPPED, ...)
+_SERVICE_RUNNING = 4
+_SERVICE_STATES = {
+    1: "stopped",
+    2: "starting",
+    3: "stopping",
+    _SERVICE_RUNNING: "running",
+    5: "continuing",
+    6: "pausing",
+    7: "paused",
+}
+
+# Namespace of rendered Windows event XML
+_EVENT_NS = {"e": "http://schemas.microsoft.com/win/2004/08/events/event"}
+
+
+def _format_event_xml(xml: str) -> str:
+    """Format a rendered event as a log line.
+
+    Args:
+        xml: Event rendered with EvtRenderEventXml
+
+    Returns:
+        "<time created>: <first event data string>"
+    """
+    root = ET.fromstring(xml)
+    created = root.find("e:System/e:TimeCreated", _EVENT_NS)
+    timestamp = created.get("SystemTime", "") if created is not None else ""
+    data = root.find("e:EventData/e:Data", _EVENT_NS)
+    message = (data.text or "") if data is not None else ""
+    return f"{timestamp}: {message}"
+
 
 class WindowsService:
     """Manage daemon as Windows Service.
 
+    Service control manager handles are cached per instance; call ``close()``
+    or use the instance as a context manager to release them.
+
     Note: This requires pywin32 package.
     """
 
@@ -18,6 +56,8 @@ class WindowsService:
     def __init__(self) -> None:
         """Initialize Windows service manager."""
         self._check_pywin32()
+        self._scm: Any = None
+        self._services: dict[int, Any] = {}
 
     def _check_pywin32(self) -> None:
         """Check if pywin32 is available.
@@ -32,6 +72,57 @@ class WindowsService:
                 "Windows service support requires pywin32. " "Install with: pip install pywin32"
             )
 
+    def _open_service(self, access: int) -> Any:
+        """Open the service handle for the given access rights.
+
+        The service control manager is opened once per instance and service
+        handles are cached per access mask, so a command that queries, stops
+        and deletes the service makes a single OpenSCManager call.
+
+        Args:
+            access: Service access rights (e.g. SERVICE_QUERY_STATUS)
+
+        Returns:
+            Service handle
+        """
+        handle = self._services.get(access)
+        if handle is None:
+            import win32service  # type: ignore[import-untyped]
+
+            if self._scm is None:
+                self._scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+            handle = win32service.OpenService(self._scm, self.SERVICE_NAME, access)
+            self._services[access] = handle
+        return handle
+
+    def _close_services(self) -> None:
+        """Release the cached service handles, keeping the SCM handle open."""
+        if not self._services:
+            return
+
+        import win32service  # type: ignore[import-untyped]
+
+        for handle in self._services.values():
+            win32service.CloseServiceHandle(handle)
+        self._services.clear()
+
+    def close(self) -> None:
+        """Release the cached service and service control manager handles."""
+        self._close_services()
+        if self._scm is not None:
+            import win32service  # type: ignore[import-untyped]
+
+            win32service.CloseServiceHandle(self._scm)
+            self._scm = None
+
+    def __enter__(self) -> "WindowsService":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, releasing the cached handles."""
+        self.close()
+
     def install(self) -> tuple[bool, str]:
         """Install Windows service.
 
@@ -70,13 +161,15 @@ class WindowsService:
             Tuple of (success, message)
         """
         try:
-            import win32serviceutil  # type: ignore[import-untyped]
+            import win32con  # type: ignore[import-untyped]
+            import win32service  # type: ignore[import-untyped]
 
             # Stop service first
             self.stop()
 
-            # Remove service
-            win32serviceutil.RemoveService(self.SERVICE_NAME)
+            # Remove service; the cached handles refer to it, so release them
+            win32service.DeleteService(self._open_service(win32con.DELETE))
+            self._close_services()
 
             logger.info(f"Windows service uninstalled: {self.SERVICE_NAME}")
             return True, "Service uninstalled successfully"
@@ -92,9 +185,9 @@ class WindowsService:
             Tuple of (success, message)
         """
         try:
-            import win32serviceutil  # type: ignore[import-untyped]
+            import win32service  # type: ignore[import-untyped]
 
-            win32serviceutil.StartService(self.SERVICE_NAME)
+            win32service.StartService(self._open_service(win32service.SERVICE_START), None)
 
             return True, "Service started successfully"
 
@@ -108,9 +201,11 @@ class WindowsService:
             Tuple of (success, message)
         """
         try:
-            import win32serviceutil  # type: ignore[import-untyped]
+            import win32service  # type: ignore[import-untyped]
 
-            win32serviceutil.StopService(self.SERVICE_NAME)
+            win32service.ControlService(
+                self._open_service(win32service.SERVICE_STOP), win32service.SERVICE_CONTROL_STOP
+            )
 
             return True, "Service stopped successfully"
 
@@ -144,33 +239,22 @@ class WindowsService:
         """
         try:
             import win32service  # type: ignore[import-untyped]
-            import win32serviceutil  # type: ignore[import-untyped]
 
-            status = win32serviceutil.QueryServiceStatus(self.SERVICE_NAME)[1]
+            status = win32service.QueryServiceStatus(
+                self._open_service(win32service.SERVICE_QUERY_STATUS)
+            )[1]
 
-            status_map = {
-                win32service.SERVICE_STOPPED: "stopped",
-                win32service.SERVICE_START_PENDING: "starting",
-                win32service.SERVICE_STOP_PENDING: "stopping",
-                win32service.SERVICE_RUNNING: "running",
-                win32service.SERVICE_CONTINUE_PENDING: "continuing",
-                win32service.SERVICE_PAUSE_PENDING: "pausing",
-                win32service.SERVICE_PAUSED: "paused",
-            }
-
-            status_str = status_map.get(status, "unknown")
-            is_running = status == win32service.SERVICE_RUNNING
-
-            return is_running, status_str
+            return status == _SERVICE_RUNNING, _SERVICE_STATES.get(status, "unknown")
 
         except Exception as e:
             return False, str(e)
 
-    def get_logs(self, lines: int = 50) -> str:
+    def get_logs(self, lines: int = 50, since: timedelta = timedelta(days=7)) -> str:
         """Get service logs from Windows Event Log.
 
         Args:
             lines: Number of log lines to retrieve
+            since: Only look at events this recent, bounding the scan of large logs
 
         Returns:
             Log output
@@ -178,31 +262,24 @@ class WindowsService:
         try:
             import win32evtlog  # type: ignore[import-untyped]
 
-            # Open event log
-            hand = win32evtlog.OpenEventLog(None, "Application")
-
-            # Read events
-            flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
-            events: list[object] = []
+            # Let the event log service filter by provider and age instead of reading every event
+            max_age_ms = int(since.total_seconds() * 1000)
+            query = win32evtlog.EvtQuery(
+                "Application",
+                win32evtlog.EvtQueryChannelPath | win32evtlog.EvtQueryReverseDirection,
+                f"*[System[Provider[@Name='{self.SERVICE_NAME}']"
+                f" and TimeCreated[timediff(@SystemTime) <= {max_age_ms}]]]",
+            )
 
-            while len(events) < lines:
-                event_batch = win32evtlog.ReadEventLog(hand, flags, 0)
+            log_lines: list[str] = []
+            while len(log_lines) < lines:
+                event_batch = win32evtlog.EvtNext(query, lines - len(log_lines))
                 if not event_batch:
                     break
 
                 for event in event_batch:
-                    # Filter events from our service
-                    if event.SourceName == self.SERVICE_NAME:
-                        events.append(event)
-                        if len(events) >= lines:
-                            break
-
-            # Format events
-            log_lines = []
-            for event in events:
-                timestamp = event.TimeGenerated.Format()  # type: ignore[attr-defined]
-                message = event.StringInserts[0] if event.StringInserts else ""  # type: ignore[attr-defined]
-                log_lines.append(f"{timestamp}: {message}")
+                    xml = win32evtlog.EvtRender(event, win32evtlog.EvtRenderEventXml)
+                    log_lines.append(_format_event_xml(xml))
 
             return "\n".join(log_lines) if log_lines else "No logs available"
 
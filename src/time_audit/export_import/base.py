@@ -66,15 +66,16 @@ class Exporter(ABC):
         Returns:
             Filtered list of entries
         """
-        filtered = entries
-
-        if start_date:
-            filtered = [e for e in filtered if e.start_time >= start_date]
-
-        if end_date:
-            filtered = [e for e in filtered if e.start_time <= end_date]
-
-        return filtered
+        if not start_date and not end_date:
+            return entries
+
+        # Check both bounds in one pass rather than filtering twice
+        return [
+            e
+            for e in entries
+            if (not start_date or e.start_time >= start_date)
+            and (not end_date or e.start_time <= end_date)
+        ]
 
 
 class Importer(ABC):
@@ -62,12 +62,8 @@ class ExcelExporter(Exporter):
                 "openpyxl is required for Excel export. " "Install with: pip install openpyxl"
             )
 
-        # Create workbook
-        wb = openpyxl.Workbook()
-
-        # Remove default sheet
-        if wb.active:
-            wb.remove(wb.active)
+        # Write-only workbooks stream rows to disk instead of keeping a Cell object per value
+        wb = openpyxl.Workbook(write_only=True)
 
         # Create entries sheet
         self._create_entries_sheet(wb, filtered_entries)
@@ -83,10 +79,11 @@ class ExcelExporter(Exporter):
         """Create detailed entries sheet.
 
         Args:
-            wb: Workbook object
+            wb: Write-only workbook object
             entries: List of entries
         """
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell  # type: ignore[import-untyped]
         from openpyxl.styles import Alignment, Font, PatternFill
 
         ws = wb.create_sheet("Entries")
@@ -105,49 +102,43 @@ class ExcelExporter(Exporter):
             "Notes",
         ]
 
+        # Column widths must be set before the first row is written
+        for col in range(1, len(headers) + 1):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
+
         # Write headers with formatting
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
         header_font = Font(bold=True, color="FFFFFF")
+        header_alignment = Alignment(horizontal="center", vertical="center")
 
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.fill = header_fill
             cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
 
         # Write entry data
-        for row, entry in enumerate(entries, start=2):
-            ws.cell(row, 1, entry.task_name)
-            ws.cell(row, 2, entry.start_time.strftime("%Y-%m-%d %H:%M:%S"))
-
-            if entry.end_time:
-                ws.cell(row, 3, entry.end_time.strftime("%Y-%m-%d %H:%M:%S"))
-            else:
-                ws.cell(row, 3, "Running")
-
-            if entry.duration_seconds:
-                ws.cell(row, 4, round(entry.duration_seconds / 3600, 2))
-            else:
-                ws.cell(row, 4, "-")
-
-            if entry.active_duration_seconds:
-                ws.cell(row, 5, round(entry.active_duration_seconds / 3600, 2))
-            else:
-                ws.cell(row, 5, "-")
-
-            if entry.idle_percentage is not None:
-                ws.cell(row, 6, round(entry.idle_percentage, 1))
-            else:
-                ws.cell(row, 6, "-")
-
-            ws.cell(row, 7, entry.project or "")
-            ws.cell(row, 8, entry.category or "")
-            ws.cell(row, 9, ", ".join(entry.tags) if entry.tags else "")
-            ws.cell(row, 10, entry.notes or "")
-
-        # Auto-size columns
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
+        for entry in entries:
+            duration = entry.duration_seconds
+            active = entry.active_duration_seconds
+            idle_percentage = entry.idle_percentage
+            ws.append(
+                [
+                    entry.task_name,
+                    entry.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    (entry.end_time.strftime("%Y-%m-%d %H:%M:%S") if entry.end_time else "Running"),
+                    round(duration / 3600, 2) if duration else "-",
+                    round(active / 3600, 2) if active else "-",
+                    round(idle_percentage, 1) if idle_percentage is not None else "-",
+                    entry.project or "",
+                    entry.category or "",
+                    ", ".join(entry.tags) if entry.tags else "",
+                    entry.notes or "",
+                ]
+            )
 
     def _create_summary_sheet(
         self, wb: Any, entries: list[Entry], include_charts: bool = True
@@ -155,101 +146,86 @@ class ExcelExporter(Exporter):
         """Create summary sheet with aggregated data and charts.
 
         Args:
-            wb: Workbook object
+            wb: Write-only workbook object
             entries: List of entries
             include_charts: Whether to include charts
         """
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.chart import PieChart, Reference
         from openpyxl.styles import Font
 
         ws = wb.create_sheet("Summary", 0)  # Insert as first sheet
 
-        # Calculate summary statistics
-        total_duration = sum(e.duration_seconds for e in entries if e.duration_seconds)
-        total_active = sum(e.active_duration_seconds for e in entries if e.active_duration_seconds)
-
-        # Time by task
+        # Calculate summary statistics and per-task/project/category hours in one pass
+        total_duration = 0
+        total_active = 0
         task_time: dict[str, float] = defaultdict(float)
-        for entry in entries:
-            if entry.duration_seconds:
-                task_time[entry.task_name] += entry.duration_seconds / 3600
-
-        # Time by project
         project_time: dict[str, float] = defaultdict(float)
-        for entry in entries:
-            if entry.duration_seconds:
-                project = entry.project or "No Project"
-                project_time[project] += entry.duration_seconds / 3600
-
-        # Time by category
         category_time: dict[str, float] = defaultdict(float)
         for entry in entries:
-            if entry.duration_seconds:
-                category = entry.category or "Uncategorized"
-                category_time[category] += entry.duration_seconds / 3600
+            duration = entry.duration_seconds
+            if not duration:
+                continue
 
-        # Write overall statistics
-        header_font = Font(bold=True, size=14)
-        ws["A1"] = "Time Tracking Summary"
-        ws["A1"].font = header_font
+            total_duration += duration
+            total_active += entry.active_duration_seconds or 0
 
-        ws["A3"] = "Total Time Tracked:"
-        ws["B3"] = f"{total_duration / 3600:.2f} hours"
+            hours = duration / 3600
+            task_time[entry.task_name] += hours
+            project_time[entry.project or "No Project"] += hours
+            category_time[entry.category or "Uncategorized"] += hours
 
-        ws["A4"] = "Total Active Time:"
-        ws["B4"] = f"{total_active / 3600:.2f} hours"
+        # Column widths must be set before the first row is written
+        ws.column_dimensions["A"].width = 25
+        ws.column_dimensions["B"].width = 15
 
-        ws["A5"] = "Total Entries:"
-        ws["B5"] = len(entries)
+        row = 0
 
-        # Time by Task
-        row = 7
-        ws[f"A{row}"] = "Time by Task"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
+        def append(*values: Any) -> int:
+            nonlocal row
+            ws.append(list(values))
+            row += 1
+            return row
 
-        ws[f"A{row}"] = "Task"
-        ws[f"B{row}"] = "Hours"
-        ws[f"A{row}"].font = Font(bold=True)
-        ws[f"B{row}"].font = Font(bold=True)
-        row += 1
+        def styled(value: Any, font: Any) -> Any:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = font
+            return cell
+
+        title_font = Font(bold=True, size=14)
+        section_font = Font(bold=True, size=12)
+        bold_font = Font(bold=True)
+
+        # Write overall statistics
+        append(styled("Time Tracking Summary", title_font))
+        append()
+        append("Total Time Tracked:", f"{total_duration / 3600:.2f} hours")
+        append("Total Active Time:", f"{total_active / 3600:.2f} hours")
+        append("Total Entries:", len(entries))
 
+        # Time by Task
+        append()
+        append(styled("Time by Task", section_font))
+        append(styled("Task", bold_font), styled("Hours", bold_font))
         for task, hours in sorted(task_time.items(), key=lambda x: x[1], reverse=True):
-            ws[f"A{row}"] = task
-            ws[f"B{row}"] = round(hours, 2)
-            row += 1
+            append(task, round(hours, 2))
 
         # Time by Project
-        row += 1
-        ws[f"A{row}"] = "Time by Project"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        ws[f"A{row}"] = "Project"
-        ws[f"B{row}"] = "Hours"
-        ws[f"A{row}"].font = Font(bold=True)
-        ws[f"B{row}"].font = Font(bold=True)
-        row += 1
-
-        project_start_row = row
+        append()
+        append(styled("Time by Project", section_font))
+        project_header_row = append(styled("Project", bold_font), styled("Hours", bold_font))
         for project, hours in sorted(project_time.items(), key=lambda x: x[1], reverse=True):
-            ws[f"A{row}"] = project
-            ws[f"B{row}"] = round(hours, 2)
-            row += 1
+            append(project, round(hours, 2))
 
         # Add charts if requested and data available
         if include_charts and task_time:
             # Project pie chart
             chart = PieChart()
             chart.title = "Time by Project"
-            data = Reference(ws, min_col=2, min_row=project_start_row - 1, max_row=row - 1)
-            labels = Reference(ws, min_col=1, min_row=project_start_row, max_row=row - 1)
+            data = Reference(ws, min_col=2, min_row=project_header_row, max_row=row)
+            labels = Reference(ws, min_col=1, min_row=project_header_row + 1, max_row=row)
             chart.add_data(data, titles_from_data=True)
             chart.set_categories(labels)
             chart.height = 10
             chart.width = 15
             ws.add_chart(chart, "D3")
-
-        # Auto-size columns
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 15
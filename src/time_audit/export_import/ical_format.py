@@ -1,11 +1,39 @@
 """iCalendar (iCal) export and import functionality."""
 
+import re
+import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any, Optional
 
 from time_audit.core.models import Entry
 from time_audit.export_import.base import Exporter, Importer
 
+# Text value escaping (RFC 5545 3.3.11), applied in a single pass each way
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", ",": "\\,", ";": "\\;", "\n": "\\n"})
+_UNESCAPE_RE = re.compile(r"\\([\\;,nN])")
+_UNESCAPES = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
+# "NAME[;PARAM=...]:value" content lines
+_FIELD_RE = re.compile(r"([A-Za-z0-9-]+)(?:;[^:]*)?:(.*)")
+
+# Metadata line prefixes the exporter writes into DESCRIPTION, in order
+_DESCRIPTION_KEYS = ("Project: ", "Category: ", "Tags: ", "Duration: ", "Active Time: ", "Notes: ")
+
+
+def _format_datetime(dt: datetime) -> str:
+    """Format a datetime as an iCal UTC timestamp (YYYYMMDDTHHMMSSZ).
+
+    Equivalent to ``dt.strftime("%Y%m%dT%H%M%SZ")`` without parsing a format per call.
+
+    Args:
+        dt: Datetime to format
+
+    Returns:
+        iCal timestamp
+    """
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
+
 
 class ICalExporter(Exporter):
     """Export time tracking data to iCalendar format."""
@@ -43,8 +71,8 @@ class ICalExporter(Exporter):
         calendar_name = kwargs.get("calendar_name", "Time Audit")
         ical_content = self._create_ical_content(filtered_entries, calendar_name)
 
-        # Write to file
-        with open(self.output_path, "w", encoding="utf-8") as f:
+        # Write to file; lines already end in CRLF, so disable newline translation
+        with open(self.output_path, "w", encoding="utf-8", newline="") as f:
             f.write(ical_content)
 
     def _create_ical_content(self, entries: list[Entry], calendar_name: str) -> str:
@@ -67,59 +95,60 @@ class ICalExporter(Exporter):
             "METHOD:PUBLISH",
         ]
 
+        # One timestamp for the whole export, also used as the end of running entries
+        now = _format_datetime(datetime.now())
+
         for entry in entries:
-            event_lines = self._create_event(entry)
-            lines.extend(event_lines)
+            self._create_event(entry, now, lines)
 
         lines.append("END:VCALENDAR")
 
         return "\r\n".join(lines) + "\r\n"
 
-    def _create_event(self, entry: Entry) -> list[str]:
+    def _create_event(self, entry: Entry, now: str, lines: list[str]) -> None:
         """Create iCal event for an entry.
 
         Args:
             entry: Time entry
-
-        Returns:
-            List of iCal lines for the event
+            now: Formatted export time, used for DTSTAMP and running entries
+            lines: Calendar lines to append the event's lines to
         """
-        lines = ["BEGIN:VEVENT"]
+        lines.append("BEGIN:VEVENT")
 
         # UID - unique identifier
         lines.append(f"UID:{entry.id}@timeaudit")
 
         # DTSTAMP - when event was created
-        dtstamp = datetime.now().strftime("%Y%m%dT%H%M%SZ")
-        lines.append(f"DTSTAMP:{dtstamp}")
+        lines.append(f"DTSTAMP:{now}")
 
         # DTSTART - start time
-        dtstart = entry.start_time.strftime("%Y%m%dT%H%M%SZ")
+        dtstart = _format_datetime(entry.start_time)
         lines.append(f"DTSTART:{dtstart}")
 
         # DTEND - end time
         if entry.end_time:
-            dtend = entry.end_time.strftime("%Y%m%dT%H%M%SZ")
+            dtend = _format_datetime(entry.end_time)
         else:
             # Use current time if still running
-            dtend = datetime.now().strftime("%Y%m%dT%H%M%SZ")
+            dtend = now
         lines.append(f"DTEND:{dtend}")
 
         # SUMMARY - task name
         summary = self._escape_text(entry.task_name)
         lines.append(f"SUMMARY:{summary}")
 
-        # DESCRIPTION - build from metadata
+        # DESCRIPTION - build from metadata, escaping only the user-supplied values
+        esc = self._escape_text
         description_parts = []
 
         if entry.project:
-            description_parts.append(f"Project: {entry.project}")
+            description_parts.append(f"Project: {esc(entry.project)}")
 
         if entry.category:
-            description_parts.append(f"Category: {entry.category}")
+            description_parts.append(f"Category: {esc(entry.category)}")
 
         if entry.tags:
-            description_parts.append(f"Tags: {', '.join(entry.tags)}")
+            description_parts.append(f"Tags: {esc(', '.join(entry.tags))}")
 
         if entry.duration_seconds:
             hours = entry.duration_seconds / 3600
@@ -130,15 +159,16 @@ class ICalExporter(Exporter):
             description_parts.append(f"Active Time: {active_hours:.2f} hours")
 
         if entry.notes:
-            description_parts.append(f"Notes: {entry.notes}")
+            description_parts.append(f"Notes: {esc(entry.notes)}")
 
         if description_parts:
-            description = self._escape_text("\\n".join(description_parts))
+            # The parts are already escaped, so join them with an escaped newline
+            description = "\\n".join(description_parts)
             lines.append(f"DESCRIPTION:{description}")
 
         # CATEGORIES
         if entry.category:
-            lines.append(f"CATEGORIES:{self._escape_text(entry.category)}")
+            lines.append(f"CATEGORIES:{esc(entry.category)}")
 
         # STATUS
         status = "TENTATIVE" if entry.end_time is None else "CONFIRMED"
@@ -146,8 +176,6 @@ class ICalExporter(Exporter):
 
         lines.append("END:VEVENT")
 
-        return lines
-
     def _escape_text(self, text: str) -> str:
         """Escape text for iCal format.
 
@@ -157,12 +185,7 @@ class ICalExporter(Exporter):
         Returns:
             Escaped text
         """
-        # Escape special characters
-        text = text.replace("\\", "\\\\")
-        text = text.replace(",", "\\,")
-        text = text.replace(";", "\\;")
-        text = text.replace("\n", "\\n")
-        return text
+        return text.translate(_ESCAPE_TABLE)
 
 
 class ICalImporter(Importer):
@@ -190,64 +213,87 @@ class ICalImporter(Importer):
             FileNotFoundError: If input file doesn't exist
             ValueError: If iCal file is malformed
         """
-        self.validate_input_path()
+        return list(self.iter_entries(**kwargs))
 
-        # Read iCal file
-        with open(self.input_path, encoding="utf-8") as f:
-            content = f.read()
+    def iter_entries(self, **kwargs: Any) -> Iterator[Entry]:
+        """Import entries from iCal file one at a time.
 
-        # Parse events
-        entries = []
-        skip_invalid = kwargs.get("skip_invalid", True)
+        Events are parsed as the iterator advances, so callers that insert
+        entries as they go never hold the whole import in memory.
+
+        Args:
+            **kwargs: Same options as import_entries
+
+        Yields:
+            Imported entries
+
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            ValueError: If iCal file is malformed
+        """
+        self.validate_input_path()
 
-        # Split into events
-        events = self._parse_events(content)
+        skip_invalid = kwargs.get("skip_invalid", True)
 
-        for event_data in events:
-            try:
-                entry = self._parse_event(event_data)
+        # Read the file line by line; only the event being parsed is held at a time
+        with open(self.input_path, encoding="utf-8") as f:
+            for event_data in self._parse_events(f):
+                try:
+                    entry = self._parse_event(event_data)
+                except Exception as e:
+                    if not skip_invalid:
+                        raise ValueError(f"Invalid event: {e}")
+                    # Skip this event
+                    continue
                 if entry:
-                    entries.append(entry)
-            except Exception as e:
-                if not skip_invalid:
-                    raise ValueError(f"Invalid event: {e}")
-                # Skip this event
-                continue
+                    yield entry
 
-        return entries
+    def _unfold_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Join folded physical lines into content lines.
 
-    def _parse_events(self, content: str) -> list[dict[str, str]]:
-        """Parse iCal content into event dictionaries.
+        A line starting with a space or tab continues the previous line
+        (RFC 5545 3.1); calendar apps wrap anything over 75 octets.
 
         Args:
-            content: iCal file content
+            lines: Physical lines, with or without line endings
 
-        Returns:
-            List of event data dictionaries
+        Yields:
+            Unfolded content lines without line endings
         """
-        events = []
-        current_event: Optional[dict[str, str]] = None
-        in_event = False
+        parts: list[str] = []
+        for raw in lines:
+            line = raw.rstrip("\r\n")
+            if parts and line[:1] in (" ", "\t"):
+                parts.append(line[1:])
+                continue
+            if parts:
+                yield "".join(parts)
+            parts = [line]
+        if parts:
+            yield "".join(parts)
 
-        for line in content.split("\n"):
-            line = line.strip("\r\n ")
+    def _parse_events(self, lines: Iterable[str]) -> Iterator[dict[str, str]]:
+        """Parse iCal lines into event dictionaries.
 
-            if line == "BEGIN:VEVENT":
-                in_event = True
-                current_event = {}
+        Args:
+            lines: iCal file lines
 
+        Yields:
+            Event data dictionaries
+        """
+        event: Optional[dict[str, str]] = None
+        for line in self._unfold_lines(lines):
+            if line == "BEGIN:VEVENT":
+                event = {}
             elif line == "END:VEVENT":
-                if current_event:
-                    events.append(current_event)
-                current_event = None
-                in_event = False
-
-            elif in_event and current_event is not None:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    current_event[key] = value
-
-        return events
+                if event is not None:
+                    yield event
+                event = None
+            elif event is not None:
+                # Property parameters (e.g. DTSTART;TZID=...) are dropped from the keys
+                match = _FIELD_RE.match(line)
+                if match:
+                    event[match.group(1)] = match.group(2)
 
     def _parse_event(self, event_data: dict[str, str]) -> Optional[Entry]:
         """Parse event data into Entry.
@@ -279,39 +325,62 @@ class ICalImporter(Importer):
         description = event_data.get("DESCRIPTION", "")
         description = self._unescape_text(description)
 
-        project = None
-        category = None
-        tags: list[str] = []
-        notes = None
-
-        # Extract metadata from description
-        for line in description.split("\\n"):
-            if line.startswith("Project: "):
-                project = line[9:]
-            elif line.startswith("Category: "):
-                category = line[10:]
-            elif line.startswith("Tags: "):
-                tags = [t.strip() for t in line[6:].split(",")]
-            elif line.startswith("Notes: "):
-                notes = line[7:]
+        metadata = self._parse_description(description)
+
+        project = metadata.get("Project")
+        category = metadata.get("Category")
+        tags = [t.strip() for t in metadata["Tags"].split(",")] if "Tags" in metadata else []
+        notes = metadata.get("Notes")
 
         # Also check CATEGORIES field
         if not category and "CATEGORIES" in event_data:
             category = self._unescape_text(event_data["CATEGORIES"])
 
-        # Create entry
+        # Create entry, sharing one string object per distinct project/category/tag
         entry = Entry(
             task_name=task_name,
             start_time=start_time,
             end_time=end_time,
-            project=project,
-            category=category,
-            tags=tags,
+            project=sys.intern(project) if project else None,
+            category=sys.intern(category) if category else None,
+            tags=[sys.intern(t) for t in tags],
             notes=notes,
         )
 
         return entry
 
+    def _parse_description(self, description: str) -> dict[str, str]:
+        """Extract "Key: value" metadata lines from an unescaped description.
+
+        Values may themselves contain newlines, so a line without a known key
+        continues the previous value, and everything after "Notes: " (always the
+        last line written) belongs to the notes.
+
+        Args:
+            description: Unescaped DESCRIPTION value
+
+        Returns:
+            Dictionary of metadata values by key
+        """
+        lines = description.split("\n")
+        if len(lines) == 1:
+            # Older exports escaped the line separators twice, leaving a literal "\\n"
+            # between lines once unescaped; only trust it if every piece is a known key
+            legacy = description.split("\\n")
+            if len(legacy) > 1 and all(line.startswith(_DESCRIPTION_KEYS) for line in legacy):
+                lines = legacy
+
+        metadata: dict[str, str] = {}
+        key = None
+        for line in lines:
+            if key != "Notes" and line.startswith(_DESCRIPTION_KEYS):
+                key, _, value = line.partition(": ")
+                metadata[key] = value
+            elif key is not None:
+                metadata[key] += "\n" + line
+
+        return metadata
+
     def _parse_datetime(self, dt_str: str) -> Optional[datetime]:
         """Parse iCal datetime string.
 
@@ -321,18 +390,26 @@ class ICalImporter(Importer):
         Returns:
             Datetime object or None if invalid
         """
-        try:
-            # Remove timezone indicator if present
-            dt_str = dt_str.replace("Z", "").replace(":", "")
-
-            # Parse datetime
-            if "T" in dt_str:
-                return datetime.strptime(dt_str, "%Y%m%dT%H%M%S")
-            else:
-                return datetime.strptime(dt_str, "%Y%m%d")
+        # Remove timezone indicator if present
+        dt_str = dt_str.replace("Z", "").replace(":", "")
 
+        # Slice the fixed-width fields directly; strptime is far slower per call
+        try:
+            if len(dt_str) == 15 and dt_str[8] == "T":
+                return datetime(
+                    int(dt_str[0:4]),
+                    int(dt_str[4:6]),
+                    int(dt_str[6:8]),
+                    int(dt_str[9:11]),
+                    int(dt_str[11:13]),
+                    int(dt_str[13:15]),
+                )
+            if len(dt_str) == 8:
+                return datetime(int(dt_str[0:4]), int(dt_str[4:6]), int(dt_str[6:8]))
         except ValueError:
-            return None
+            pass
+
+        return None
 
     def _unescape_text(self, text: str) -> str:
         """Unescape iCal text.
@@ -343,8 +420,4 @@ class ICalImporter(Importer):
         Returns:
             Unescaped text
         """
-        text = text.replace("\\n", "\n")
-        text = text.replace("\\;", ";")
-        text = text.replace("\\,", ",")
-        text = text.replace("\\\\", "\\")
-        return text
+        return _UNESCAPE_RE.sub(lambda m: _UNESCAPES[m.group(1)], text)
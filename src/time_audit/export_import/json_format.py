@@ -7,6 +7,11 @@ from typing import Any, Optional
 from time_audit.core.models import Entry
 from time_audit.export_import.base import Exporter, Importer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 class JSONExporter(Exporter):
     """Export time tracking data to JSON format."""
@@ -58,10 +63,16 @@ class JSONExporter(Exporter):
                 "format_version": "1.0",
             }
 
-        # Write to file
+        # Encode the whole document, then write it in one call; json.dump would
+        # issue a write per token. orjson only supports compact or two-space indents.
         indent = kwargs.get("indent", 2)
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=indent, ensure_ascii=False)
+        if orjson is not None and indent in (None, 2):
+            payload = orjson.dumps(export_data, option=orjson.OPT_INDENT_2 if indent else None)
+        else:
+            payload = json.dumps(export_data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+        with open(self.output_path, "wb") as f:
+            f.write(payload)
 
 
 class JSONImporter(Importer):
@@ -91,10 +102,11 @@ class JSONImporter(Importer):
         """
         self.validate_input_path()
 
-        # Read and parse JSON
+        # Read and parse JSON (orjson's decode error subclasses json.JSONDecodeError)
+        with open(self.input_path, "rb") as f:
+            raw = f.read()
         try:
-            with open(self.input_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON file: {e}")
 
@@ -77,7 +77,8 @@ class MarkdownExporter(Exporter):
         Returns:
             Markdown formatted string
         """
-        lines = []
+        # Helpers append into this one list rather than returning lists to extend it with
+        lines: list[str] = []
 
         # Title
         lines.append(f"# {title}\n")
@@ -104,33 +105,31 @@ class MarkdownExporter(Exporter):
         # Summary section
         if include_summary:
             lines.append("---\n")
-            lines.extend(self._generate_summary(entries))
+            self._generate_summary(entries, lines)
             lines.append("---\n")
 
         # Entries section
         lines.append("## Entries\n")
 
         if group_by == "day":
-            lines.extend(self._group_by_day(entries))
+            self._group_by_day(entries, lines)
         elif group_by == "project":
-            lines.extend(self._group_by_project(entries))
+            self._group_by_project(entries, lines)
         elif group_by == "category":
-            lines.extend(self._group_by_category(entries))
+            self._group_by_category(entries, lines)
         else:
-            lines.extend(self._list_entries(entries))
+            self._list_entries(entries, lines)
 
         return "\n".join(lines)
 
-    def _generate_summary(self, entries: list[Entry]) -> list[str]:
+    def _generate_summary(self, entries: list[Entry], lines: list[str]) -> None:
         """Generate summary section.
 
         Args:
             entries: List of entries
-
-        Returns:
-            List of markdown lines
+            lines: Markdown lines to append to
         """
-        lines = ["## Summary\n"]
+        lines.append("## Summary\n")
 
         # Calculate totals
         total_duration = sum(e.duration_seconds for e in entries if e.duration_seconds)
@@ -178,19 +177,13 @@ class MarkdownExporter(Exporter):
                 lines.append(f"- **{task}:** {hours:.2f} hours")
             lines.append("")
 
-        return lines
-
-    def _group_by_day(self, entries: list[Entry]) -> list[str]:
+    def _group_by_day(self, entries: list[Entry], lines: list[str]) -> None:
         """Group entries by day.
 
         Args:
             entries: List of entries
-
-        Returns:
-            List of markdown lines
+            lines: Markdown lines to append to
         """
-        lines = []
-
         # Group by date
         by_day: dict[str, list[Entry]] = defaultdict(list)
         for entry in entries:
@@ -211,22 +204,16 @@ class MarkdownExporter(Exporter):
             lines.append(f"**Total:** {day_duration / 3600:.2f} hours\n")
 
             # Entries
-            lines.extend(self._list_entries(day_entries, indent=""))
+            self._list_entries(day_entries, lines, indent="")
             lines.append("")
 
-        return lines
-
-    def _group_by_project(self, entries: list[Entry]) -> list[str]:
+    def _group_by_project(self, entries: list[Entry], lines: list[str]) -> None:
         """Group entries by project.
 
         Args:
             entries: List of entries
-
-        Returns:
-            List of markdown lines
+            lines: Markdown lines to append to
         """
-        lines = []
-
         # Group by project
         by_project: dict[str, list[Entry]] = defaultdict(list)
         for entry in entries:
@@ -252,22 +239,16 @@ class MarkdownExporter(Exporter):
             lines.append(f"**Entries:** {len(project_entries)}\n")
 
             # Entries
-            lines.extend(self._list_entries(project_entries, indent=""))
+            self._list_entries(project_entries, lines, indent="")
             lines.append("")
 
-        return lines
-
-    def _group_by_category(self, entries: list[Entry]) -> list[str]:
+    def _group_by_category(self, entries: list[Entry], lines: list[str]) -> None:
         """Group entries by category.
 
         Args:
             entries: List of entries
-
-        Returns:
-            List of markdown lines
+            lines: Markdown lines to append to
         """
-        lines = []
-
         # Group by category
         by_category: dict[str, list[Entry]] = defaultdict(list)
         for entry in entries:
@@ -293,23 +274,17 @@ class MarkdownExporter(Exporter):
             lines.append(f"**Entries:** {len(category_entries)}\n")
 
             # Entries
-            lines.extend(self._list_entries(category_entries, indent=""))
+            self._list_entries(category_entries, lines, indent="")
             lines.append("")
 
-        return lines
-
-    def _list_entries(self, entries: list[Entry], indent: str = "") -> list[str]:
+    def _list_entries(self, entries: list[Entry], lines: list[str], indent: str = "") -> None:
         """List entries in a table format.
 
         Args:
             entries: List of entries
+            lines: Markdown lines to append to
             indent: Indentation prefix
-
-        Returns:
-            List of markdown lines
         """
-        lines = []
-
         # Table header
         lines.append(f"{indent}| Task | Start | End | Duration | Notes |")
         lines.append(f"{indent}|------|-------|-----|----------|-------|")
@@ -344,5 +319,3 @@ class MarkdownExporter(Exporter):
             )
 
             lines.append(f"{indent}| {task} | {start} | {end} | {duration} | {notes} |")
-
-        return lines
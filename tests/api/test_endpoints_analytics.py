@@ -71,9 +71,8 @@ def productivity_entries(temp_data_dir: Path):
         task_name="Task with idle",
         start_time=now.replace(hour=14, minute=0, second=0, microsecond=0),
         end_time=now.replace(hour=15, minute=0, second=0, microsecond=0),
+        idle_time_seconds=600,  # 10 minutes idle (normally set by tracker)
     )
-    # Manually set idle time (normally set by tracker)
-    entry_with_idle._idle_time_seconds = 600  # 10 minutes idle
     storage.save_entry(entry_with_idle)
     entries.append(entry_with_idle)
 
@@ -0,0 +1,49 @@
+"""Tests for the daemon's tracking state."""
+
+import json
+from functools import partial
+from pathlib import Path
+
+import pytest  # type: ignore[import-not-found]
+
+from time_audit.core.config import ConfigManager
+from time_audit.daemon import daemon as daemon_module
+from time_audit.daemon.daemon import TimeAuditDaemon
+from time_audit.daemon.state import StateManager
+
+
+@pytest.fixture  # type: ignore[misc]
+def daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TimeAuditDaemon:
+    """Create a daemon whose config, data and state files live in a temp directory."""
+    monkeypatch.setattr(daemon_module, "get_pid_file_path", lambda: tmp_path / "daemon.pid")
+    monkeypatch.setattr(daemon_module, "StateManager", partial(StateManager, tmp_path / "d.json"))
+    instance = TimeAuditDaemon(ConfigManager(tmp_path / "config.yml"), data_dir=tmp_path / "data")
+    instance.state_manager.initialize(12345)
+    return instance
+
+
+class TestTrackingState:
+    """Test mirroring the running entry into daemon state."""
+
+    def test_status_reports_running_entry(self, daemon: TimeAuditDaemon) -> None:
+        """Test that the status handler reflects entries started and stopped."""
+        entry = daemon.tracker.start("Write tests")
+
+        state = json.loads(daemon._handle_status({}))["state"]
+        assert state["tracking"] is True
+        assert state["current_entry_id"] == str(entry.id)
+        assert state["current_task_name"] == "Write tests"
+
+        daemon.tracker.stop()
+        state = json.loads(daemon._handle_status({}))["state"]
+        assert state["tracking"] is False
+        assert state["current_entry_id"] is None
+
+    def test_deleting_running_entry_marks_state_dirty(self, daemon: TimeAuditDaemon) -> None:
+        """Test that deleting the running entry wakes the monitoring loop."""
+        entry = daemon.tracker.start("Write tests")
+        daemon._tracker_dirty.clear()
+
+        daemon.tracker.delete_entry(str(entry.id))
+
+        assert daemon._tracker_dirty.is_set()
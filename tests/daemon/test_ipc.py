@@ -2,10 +2,12 @@
 
 import json
 import socket
+import threading
 import time
 
 import pytest  # type: ignore[import-not-found]
 
+from time_audit.daemon import ipc
 from time_audit.daemon.ipc import IPCClient, IPCError, IPCServer
 from time_audit.daemon.platform import Platform, get_platform
 
@@ -197,6 +199,78 @@ class TestIPCClient:
 
         assert "RPC error" in str(exc_info.value)
 
+    def test_client_call_large_message(self, socket_path, running_server) -> None:
+        """Test that messages spanning many socket reads arrive intact."""
+        client = IPCClient(socket_path)
+        message = "line\n" * 50000
+
+        result = client.call("echo", {"message": message})
+
+        assert result["echo"] == message
+
+    def test_pre_encoded_result_is_spliced(self, socket_path, running_server) -> None:
+        """Test that handlers can return already-encoded JSON results."""
+        running_server.register_handler(
+            "raw", lambda params: ipc.PreEncodedResult(b'{"running":true,"state":{}}')
+        )
+
+        result = IPCClient(socket_path).call("raw")
+
+        assert result == {"running": True, "state": {}}
+
+    def test_client_reuses_connection(self, socket_path, running_server) -> None:
+        """Test that consecutive calls share one connection."""
+        with IPCClient(socket_path) as client:
+            client.call("ping")
+            sock = client._sock
+            client.call("echo", {"message": "again"})
+
+            assert sock is not None
+            assert client._sock is sock
+
+        assert client._sock is None
+
+    def test_client_reconnects_after_idle_close(
+        self, socket_path, running_server, monkeypatch
+    ) -> None:
+        """Test that a connection closed by the daemon is replaced transparently."""
+        monkeypatch.setattr(ipc, "KEEPALIVE_TIMEOUT", 0.05)
+
+        with IPCClient(socket_path) as client:
+            client.call("ping")
+            stale = client._sock
+            time.sleep(0.3)  # Server drops the idle connection
+
+            assert client.call("echo", {"message": "back"}) == {"echo": "back"}
+            assert client._sock is not stale
+
+    def test_concurrent_clients_share_worker_pool(self, socket_path, running_server) -> None:
+        """Test that more concurrent clients than pool workers are all served."""
+        results = []
+
+        def call() -> None:
+            results.append(IPCClient(socket_path).call("echo", {"message": "hi"}))
+
+        threads = [threading.Thread(target=call) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == [{"echo": "hi"}] * 20
+
+    def test_socket_file_is_owner_only(self, socket_path, running_server) -> None:
+        """Test that the socket file is created without group/other access."""
+        assert socket_path.stat().st_mode & 0o077 == 0
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_PEERCRED"), reason="requires SO_PEERCRED")
+    def test_rejects_other_users(self, socket_path, running_server, monkeypatch) -> None:
+        """Test that connections from another uid are closed unanswered."""
+        monkeypatch.setattr(ipc.os, "geteuid", lambda: -1)
+
+        with pytest.raises(IPCError):
+            IPCClient(socket_path, timeout=1.0).call("ping")
+
     def test_client_call_connection_refused(self, socket_path) -> None:
         """Test client call when server not running."""
         client = IPCClient(socket_path, timeout=1.0)
@@ -271,3 +345,20 @@ class TestIPCProtocol:
         assert "result" not in response
         assert response["error"]["code"] == -32600
         assert response["error"]["message"] == "Invalid Request"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_message_encoding_with_and_without_orjson(self, monkeypatch, use_orjson) -> None:
+        """Test that messages roundtrip with orjson and with the stdlib fallback."""
+        if not use_orjson:
+            monkeypatch.setattr(ipc, "orjson", None)
+        elif ipc.orjson is None:
+            pytest.skip("orjson not installed")
+
+        message = {"jsonrpc": "2.0", "id": 1, "result": {"task": "café\nbar"}}
+        data = ipc._dumps(message)
+
+        assert b"\n" not in data
+        assert ipc._loads(data) == message
+        assert ipc._dumps(message, newline=True) == data + b"\n"
+        with pytest.raises(json.JSONDecodeError):
+            ipc._loads(b"{not json")
@@ -3,6 +3,8 @@
 import platform
 from pathlib import Path
 
+import pytest  # type: ignore[import-not-found]
+
 from time_audit.daemon.platform import (
     Platform,
     get_ipc_socket_path,
@@ -10,6 +12,8 @@ from time_audit.daemon.platform import (
     get_pid_file_path,
     get_platform,
     is_daemon_supported,
+    read_tail,
+    write_atomic,
 )
 
 
@@ -69,6 +73,71 @@ class TestPaths:
         assert path.suffix == ".log"
         assert "time-audit" in str(path)
 
+    @pytest.mark.skipif(  # type: ignore[misc]
+        get_platform() not in (Platform.LINUX, Platform.MACOS), reason="Unix sockets only"
+    )
+    def test_socket_dir_follows_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the socket directory tracks XDG_RUNTIME_DIR and is recreated."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+        path = get_ipc_socket_path()
+        assert path == tmp_path / "run" / "time-audit" / "daemon.sock"
+
+        path.parent.rmdir()
+        assert get_ipc_socket_path() == path
+        assert path.parent.is_dir()
+
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "other"))
+        assert get_ipc_socket_path().parent == tmp_path / "other" / "time-audit"
+
+    def test_home_paths_follow_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that PID and log paths track HOME and recreate their directories."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+        assert get_pid_file_path() == tmp_path / ".time-audit" / "runtime" / "daemon.pid"
+        assert get_log_file_path() == tmp_path / ".time-audit" / "logs" / "daemon.log"
+
+        (tmp_path / ".time-audit" / "logs").rmdir()
+        get_log_file_path()
+        assert (tmp_path / ".time-audit" / "logs").is_dir()
+
+    def test_write_atomic_replaces_file(self, tmp_path) -> None:
+        """Test that write_atomic replaces content and leaves no temp file."""
+        path = tmp_path / "time-audit-daemon.service"
+        path.write_text("old")
+
+        write_atomic(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+class TestReadTail:
+    """Test reading the end of log files."""
+
+    @pytest.mark.parametrize("block_size", [3, 8192])
+    def test_read_tail_matches_last_lines(self, tmp_path, block_size) -> None:
+        """Test that read_tail returns the same lines as tail -n."""
+        log = tmp_path / "daemon.log"
+        log.write_text("".join(f"line {i}\n" for i in range(100)))
+
+        assert read_tail(log, 3, block_size) == "line 97\nline 98\nline 99\n"
+        assert read_tail(log, 500, block_size) == log.read_text()
+        assert read_tail(log, 0, block_size) == ""
+
+    def test_read_tail_short_and_empty_files(self, tmp_path) -> None:
+        """Test files without a trailing newline and empty files."""
+        log = tmp_path / "daemon.log"
+        log.write_text("first\nlast")
+        assert read_tail(log, 1) == "last\n"
+
+        log.write_text("")
+        assert read_tail(log, 10) == ""
+
 
 class TestDaemonSupport:
     """Test daemon support detection."""
@@ -1,5 +1,11 @@
 """Tests for daemon state management."""
 
+import json
+import sys
+
+import pytest  # type: ignore[import-not-found]
+
+from time_audit.daemon import state as state_module
 from time_audit.daemon.state import DaemonState, PIDFileManager, StateManager
 
 
@@ -59,6 +65,15 @@ class TestDaemonState:
         assert state.pid == 12345
         assert state.process_monitoring_enabled is True
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots require Python 3.10+")
+    def test_daemon_state_has_no_instance_dict(self) -> None:
+        """Test that daemon state is slotted and rejects unknown attributes."""
+        state = DaemonState(started_at="2025-11-16T10:00:00", pid=12345)
+
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown_field = 1  # type: ignore[attr-defined]
+
 
 class TestStateManager:
     """Test StateManager."""
@@ -122,6 +137,67 @@ class TestStateManager:
         assert isinstance(state_dict, dict)
         assert state_dict["pid"] == 12345
 
+    def test_get_json_bytes_tracks_updates(self, tmp_path) -> None:
+        """Test that the cached JSON encoding is refreshed when state changes."""
+        manager = StateManager(tmp_path / "daemon.json")
+        assert manager.get_json_bytes() == b"{}"
+
+        manager.initialize(12345)
+        first = manager.get_json_bytes()
+        assert manager.get_json_bytes() is first
+        assert json.loads(first) == manager.get_dict()
+
+        manager.update(current_task_name="Test Task")
+        assert json.loads(manager.get_json_bytes())["current_task_name"] == "Test Task"
+
+    def test_coalesced_updates(self, tmp_path) -> None:
+        """Test that updates are batched into one delayed write when flush_interval is set."""
+        state_file = tmp_path / "daemon.json"
+        manager = StateManager(state_file, flush_interval=60)
+        manager.initialize(12345)
+
+        manager.update(process_checks_count=1)
+        manager.update(process_checks_count=2)
+
+        # Readers of the manager see the update at once; the file catches up on flush
+        assert manager.get_dict()["process_checks_count"] == 2
+        assert json.loads(state_file.read_text())["process_checks_count"] == 0
+
+        manager.flush()
+        assert json.loads(state_file.read_text())["process_checks_count"] == 2
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_state_file_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson) -> None:
+        """Test that the state file roundtrips with orjson and with the stdlib fallback."""
+        if not use_orjson:
+            monkeypatch.setattr(state_module, "orjson", None)
+        elif state_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        state_file = tmp_path / "daemon.json"
+        manager = StateManager(state_file)
+        manager.initialize(12345)
+        manager.update(current_task_name="café")
+
+        assert state_file.read_bytes() == manager.get_json_bytes()
+        loaded = StateManager(state_file).load()
+        assert loaded is not None
+        assert loaded.to_dict() == manager.get_dict()
+
+    def test_unchanged_update_skips_write(self, tmp_path) -> None:
+        """Test that an update repeating current values does not rewrite the file."""
+        state_file = tmp_path / "daemon.json"
+        manager = StateManager(state_file)
+        manager.initialize(12345)
+        manager.update(last_detected_process="code")
+        encoded = manager.get_json_bytes()
+        state_file.unlink()
+
+        manager.update(last_detected_process="code")
+
+        assert not state_file.exists()
+        assert manager.get_json_bytes() is encoded
+
     def test_clear_state(self, tmp_path) -> None:
         """Test clearing state."""
         state_file = tmp_path / "daemon.json"
@@ -230,3 +306,17 @@ class TestPIDFileManager:
         manager = PIDFileManager(pid_file)
 
         assert manager.is_running() is False
+
+    def test_is_running_with_exited_process(self, tmp_path) -> None:
+        """Test is_running with the PID of a process that has exited."""
+        import subprocess
+        import sys
+
+        pid_file = tmp_path / "daemon.pid"
+        manager = PIDFileManager(pid_file)
+
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        manager.write(process.pid)
+
+        assert manager.is_running() is False
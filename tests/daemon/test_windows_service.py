@@ -0,0 +1,78 @@
+"""Tests for Windows service helpers."""
+
+import sys
+from unittest.mock import Mock, patch
+
+from time_audit.daemon.windows_service import WindowsService, _format_event_xml
+
+EVENT_XML = """<Event xmlns="http://schemas.microsoft.com/win/2004/08/events/event">
+  <System>
+    <Provider Name="TimeAuditDaemon"/>
+    <TimeCreated SystemTime="2025-11-16T10:00:00.000000Z"/>
+  </System>
+  <EventData>
+    <Data>Daemon started</Data>
+  </EventData>
+</Event>"""
+
+
+class TestFormatEventXml:
+    """Test formatting rendered event log XML."""
+
+    def test_format_event_xml(self) -> None:
+        """Test that the creation time and first data string are extracted."""
+        assert _format_event_xml(EVENT_XML) == "2025-11-16T10:00:00.000000Z: Daemon started"
+
+    def test_format_event_xml_without_data(self) -> None:
+        """Test events that carry no event data."""
+        xml = EVENT_XML.replace("<Data>Daemon started</Data>", "")
+
+        assert _format_event_xml(xml) == "2025-11-16T10:00:00.000000Z: "
+
+
+class TestWindowsServiceHandles:
+    """Test service control manager handle reuse."""
+
+    def test_handles_are_reused(self) -> None:
+        """Test that one SCM handle serves every call on the instance."""
+        win32service = Mock()
+        win32service.QueryServiceStatus.return_value = (16, 4)  # own process, running
+        modules = {"win32service": win32service, "win32serviceutil": Mock(), "win32con": Mock()}
+
+        with patch.dict(sys.modules, modules):
+            service = WindowsService()
+            assert service.status() == (True, "running")
+            assert service.status() == (True, "running")
+            assert service.stop() == (True, "Service stopped successfully")
+
+        win32service.OpenSCManager.assert_called_once()
+        assert win32service.OpenService.call_count == 2
+
+    def test_close_releases_handles(self) -> None:
+        """Test that close() releases the service and SCM handles."""
+        win32service = Mock()
+        win32service.QueryServiceStatus.return_value = (16, 4)
+        modules = {"win32service": win32service, "win32serviceutil": Mock(), "win32con": Mock()}
+
+        with patch.dict(sys.modules, modules):
+            with WindowsService() as service:
+                service.status()
+                service.stop()
+            service.close()
+
+        closed = [c.args[0] for c in win32service.CloseServiceHandle.call_args_list]
+        assert len(closed) == 3
+        assert closed[-1] is win32service.OpenSCManager.return_value
+
+    def test_uninstall_releases_service_handles(self) -> None:
+        """Test that uninstall closes the handles to the deleted service."""
+        win32service = Mock()
+        modules = {"win32service": win32service, "win32serviceutil": Mock(), "win32con": Mock()}
+
+        with patch.dict(sys.modules, modules):
+            service = WindowsService()
+            assert service.uninstall() == (True, "Service uninstalled successfully")
+            assert win32service.CloseServiceHandle.call_count == 2  # stop + delete handles
+
+            service.close()
+            assert win32service.CloseServiceHandle.call_count == 3
@@ -325,3 +325,56 @@ class TestCLICommands:
         )
 
         assert result.exit_code == 0
+
+    def test_export_filters_by_project(self, runner: CliRunner, temp_dir: Path) -> None:
+        """Test that export only includes entries for the requested project."""
+        for task, project in (("Kept", "project-a"), ("Dropped", "project-b")):
+            runner.invoke(
+                cli,
+                ["--data-dir", str(temp_dir), "add", task, "-p", project]
+                + ["--start", "09:00", "--end", "10:00"],
+            )
+        export_file = temp_dir / "export.json"
+
+        result = runner.invoke(
+            cli,
+            ["--data-dir", str(temp_dir), "export-import", "export", str(export_file)]
+            + ["-p", "project-a"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Kept" in export_file.read_text()
+        assert "Dropped" not in export_file.read_text()
+
+    def test_export_import_use_configured_backend(
+        self, runner: CliRunner, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that import and export go through the configured SQLite backend."""
+        from time_audit.core.sqlite_storage import SqliteStorage
+
+        monkeypatch.setenv("HOME", str(temp_dir))
+        config_file = temp_dir / ".time-audit" / "config.yml"
+        config_file.parent.mkdir()
+        config_file.write_text("advanced:\n  storage_backend: sqlite\n")
+        data_dir = temp_dir / "data"
+
+        runner.invoke(
+            cli, ["--data-dir", str(data_dir), "add", "Seed", "--start", "09:00", "--end", "10:00"]
+        )
+        export_file = temp_dir / "export.json"
+        result = runner.invoke(
+            cli, ["--data-dir", str(data_dir), "export-import", "export", str(export_file)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Seed" in export_file.read_text()
+
+        result = runner.invoke(
+            cli,
+            ["--data-dir", str(data_dir), "export-import", "import", str(export_file), "--merge"],
+        )
+        assert result.exit_code == 0, result.output
+
+        storage = SqliteStorage(data_dir)
+        assert [e.task_name for e in storage.load_entries()] == ["Seed"]
+        storage.close()
+        assert not (data_dir / "entries.csv").exists()
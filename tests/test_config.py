@@ -31,6 +31,17 @@ class TestConfigManager:
         assert config.get("process_detection.enabled") is False
         assert config.get("idle_detection.enabled") is False
 
+    def test_load_existing_does_not_create_config(self, temp_config_path: Path) -> None:
+        """Test that load_existing only reads a config file that is already there."""
+        assert ConfigManager.load_existing(temp_config_path) is None
+        assert not temp_config_path.exists()
+
+        ConfigManager(temp_config_path).set("advanced.storage_backend", "sqlite")
+
+        config = ConfigManager.load_existing(temp_config_path)
+        assert config is not None
+        assert config.get("advanced.storage_backend") == "sqlite"
+
     def test_load_existing_config(self, temp_config_path: Path) -> None:
         """Test loading existing configuration."""
         # Create a config file
@@ -0,0 +1,82 @@
+"""Tests for Excel export."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest  # type: ignore[import-not-found]
+
+from time_audit.core.models import Entry
+from time_audit.export_import import ExcelExporter
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def _entries() -> list[Entry]:
+    """Build a small set of entries spanning two projects."""
+    return [
+        Entry(
+            task_name="Coding",
+            start_time=datetime(2025, 1, 1, 9, 0),
+            end_time=datetime(2025, 1, 1, 11, 0),
+            project="Alpha",
+            idle_time_seconds=1800,
+            tags=["backend", "api"],
+        ),
+        Entry(
+            task_name="Review",
+            start_time=datetime(2025, 1, 1, 11, 0),
+            end_time=datetime(2025, 1, 1, 12, 0),
+            project="Beta",
+            category="Meetings",
+        ),
+        Entry(task_name="Running", start_time=datetime(2025, 1, 1, 13, 0)),
+    ]
+
+
+class TestExcelExporter:
+    """Test ExcelExporter."""
+
+    def test_get_file_extension(self) -> None:
+        """Test file extension is .xlsx."""
+        assert ExcelExporter(Path("test.xlsx")).get_file_extension() == ".xlsx"
+
+    def test_entries_sheet(self, tmp_path: Path) -> None:
+        """Test that every entry becomes one row under the header."""
+        output_file = tmp_path / "export.xlsx"
+        ExcelExporter(output_file).export_entries(_entries())
+
+        ws = openpyxl.load_workbook(output_file)["Entries"]
+        rows = list(ws.iter_rows(values_only=True))
+
+        assert rows[0][:4] == ("Task", "Start Time", "End Time", "Duration (hrs)")
+        assert rows[1] == (
+            "Coding",
+            "2025-01-01 09:00:00",
+            "2025-01-01 11:00:00",
+            2,
+            1.5,
+            25,
+            "Alpha",
+            None,
+            "backend, api",
+            None,
+        )
+        assert rows[3][:4] == ("Running", "2025-01-01 13:00:00", "Running", "-")
+
+    def test_summary_sheet(self, tmp_path: Path) -> None:
+        """Test summary totals and per-task/project breakdowns."""
+        output_file = tmp_path / "export.xlsx"
+        ExcelExporter(output_file).export_entries(_entries())
+
+        wb = openpyxl.load_workbook(output_file)
+        assert wb.sheetnames == ["Summary", "Entries"]
+        ws = wb["Summary"]
+        values = [row for row in ws.iter_rows(values_only=True) if any(row)]
+
+        assert ("Total Time Tracked:", "3.00 hours") in values
+        assert ("Total Active Time:", "2.50 hours") in values
+        assert ("Total Entries:", 3) in values
+        assert values.index(("Coding", 2)) < values.index(("Review", 1))
+        assert ("Alpha", 2) in values
+        assert ("Beta", 1) in values
+        assert len(ws._charts) == 1
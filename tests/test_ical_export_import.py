@@ -0,0 +1,259 @@
+"""Tests for iCal export and import."""
+
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+from time_audit.core.models import Entry
+from time_audit.export_import import ICalExporter, ICalImporter
+from time_audit.export_import.ical_format import _format_datetime
+
+
+class TestICalExporter:
+    """Test ICalExporter."""
+
+    def test_format_datetime(self) -> None:
+        """Test that timestamps match the strftime format they replace."""
+        dt = datetime(2025, 1, 2, 3, 4, 5)
+        assert _format_datetime(dt) == dt.strftime("%Y%m%dT%H%M%SZ") == "20250102T030405Z"
+
+    def test_export_entries(self, tmp_path: Path) -> None:
+        """Test that each entry becomes one VEVENT."""
+        output_file = tmp_path / "export.ics"
+        entries = [
+            Entry(
+                task_name="Task 1",
+                start_time=datetime(2025, 1, 1, 10, 0),
+                end_time=datetime(2025, 1, 1, 11, 0),
+            ),
+            Entry(task_name="Running", start_time=datetime(2025, 1, 2, 9, 0)),
+        ]
+
+        ICalExporter(output_file).export_entries(entries)
+
+        content = output_file.read_bytes().decode("utf-8")
+        lines = content.split("\r\n")
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert content.endswith("END:VCALENDAR\r\n")
+        assert lines.count("BEGIN:VEVENT") == 2
+        assert "DTSTART:20250101T100000Z" in lines
+        assert "DTEND:20250101T110000Z" in lines
+        assert "STATUS:TENTATIVE" in lines
+
+        # Running entries end at the export time, which is also the DTSTAMP
+        stamps = [line for line in lines if line.startswith("DTSTAMP:")]
+        assert len(set(stamps)) == 1
+        assert stamps[0].replace("DTSTAMP:", "DTEND:") in lines
+
+    def test_escape_text_roundtrip(self) -> None:
+        """Test that escaping and unescaping are inverse, including backslashes."""
+        exporter = ICalExporter(Path("test.ics"))
+        importer = ICalImporter(Path("test.ics"))
+
+        for text in ["a,b;c", "line 1\nline 2", "C:\\new\\dir", "plain"]:
+            escaped = exporter._escape_text(text)
+            assert "\n" not in escaped
+            assert importer._unescape_text(escaped) == text
+
+        assert exporter._escape_text("a,b;c\\\n") == "a\\,b\\;c\\\\\\n"
+
+
+class TestICalImporter:
+    """Test ICalImporter."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test that exported entries import with the same times and names."""
+        output_file = tmp_path / "export.ics"
+        original = Entry(
+            task_name="Write report; draft, v2",
+            start_time=datetime(2025, 1, 1, 10, 0),
+            end_time=datetime(2025, 1, 1, 11, 30),
+        )
+        ICalExporter(output_file).export_entries([original])
+
+        imported = ICalImporter(output_file).import_entries()
+
+        assert len(imported) == 1
+        assert imported[0].task_name == original.task_name
+        assert imported[0].start_time == original.start_time
+        assert imported[0].end_time == original.end_time
+
+    def test_roundtrip_metadata(self, tmp_path: Path) -> None:
+        """Test that description metadata with special characters survives a roundtrip."""
+        output_file = tmp_path / "export.ics"
+        original = Entry(
+            task_name="Review",
+            start_time=datetime(2025, 1, 1, 10, 0),
+            end_time=datetime(2025, 1, 1, 11, 0),
+            project="client\\web",
+            category="dev; ops",
+            tags=["backend", "api"],
+            notes="Fixed C:\\new, finally",
+        )
+        ICalExporter(output_file).export_entries([original])
+
+        imported = ICalImporter(output_file).import_entries()[0]
+
+        assert imported.project == original.project
+        assert imported.category == original.category
+        assert imported.tags == original.tags
+        assert imported.notes == original.notes
+
+    def test_roundtrip_multiline_values(self, tmp_path: Path) -> None:
+        """Test that values containing newlines are not truncated."""
+        output_file = tmp_path / "export.ics"
+        original = Entry(
+            task_name="Review",
+            start_time=datetime(2025, 1, 1, 10, 0),
+            end_time=datetime(2025, 1, 1, 11, 0),
+            project="multi\nline",
+            notes="line1\nline2\nProject: not a key",
+        )
+        ICalExporter(output_file).export_entries([original])
+
+        imported = ICalImporter(output_file).import_entries()[0]
+
+        assert imported.project == original.project
+        assert imported.notes == original.notes
+
+    def test_roundtrip_single_backslash_n_field(self, tmp_path: Path) -> None:
+        """Test that a lone field containing a literal backslash-n is kept whole."""
+        notes_file = tmp_path / "notes.ics"
+        ICalExporter(notes_file).export_entries(
+            [Entry(task_name="Paths", start_time=datetime(2025, 1, 1, 10), notes="C:\\new\\temp")]
+        )
+        project_file = tmp_path / "project.ics"
+        ICalExporter(project_file).export_entries(
+            [Entry(task_name="Paths", start_time=datetime(2025, 1, 1, 10), project="x\\ny")]
+        )
+
+        assert ICalImporter(notes_file).import_entries()[0].notes == "C:\\new\\temp"
+        assert ICalImporter(project_file).import_entries()[0].project == "x\\ny"
+
+    def test_import_legacy_description_separators(self, tmp_path: Path) -> None:
+        """Test that descriptions with doubly escaped separators still import."""
+        input_file = tmp_path / "calendar.ics"
+        input_file.write_text(
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "DTSTART:20250101T100000Z\r\n"
+            "SUMMARY:Standup\r\n"
+            "DESCRIPTION:Project: web\\\\nTags: a\\, b\\\\nNotes: done\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n",
+            newline="",
+        )
+
+        imported = ICalImporter(input_file).import_entries()[0]
+
+        assert imported.project == "web"
+        assert imported.tags == ["a", "b"]
+        assert imported.notes == "done"
+
+    def test_import_property_parameters(self, tmp_path: Path) -> None:
+        """Test that properties with parameters are recognized."""
+        input_file = tmp_path / "calendar.ics"
+        input_file.write_text(
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "DTSTART;TZID=Europe/Berlin:20250101T100000\r\n"
+            "DTEND;TZID=Europe/Berlin:20250101T110000\r\n"
+            "SUMMARY;LANGUAGE=en:Standup\r\n"
+            "END:VEVENT\r\n"
+            "BEGIN:VEVENT\r\n"
+            "SUMMARY:No start time\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n",
+            newline="",
+        )
+
+        imported = ICalImporter(input_file).import_entries()
+
+        assert len(imported) == 1
+        assert imported[0].task_name == "Standup"
+        assert imported[0].start_time == datetime(2025, 1, 1, 10, 0)
+        assert imported[0].end_time == datetime(2025, 1, 1, 11, 0)
+
+    def test_import_interns_repeated_strings(self, tmp_path: Path) -> None:
+        """Test that repeated values share a single string object."""
+        output_file = tmp_path / "export.ics"
+        ICalExporter(output_file).export_entries(
+            [
+                Entry(
+                    task_name="Task",
+                    start_time=datetime(2025, 1, 1, hour),
+                    project="test-project",
+                    category="development",
+                    tags=["backend"],
+                )
+                for hour in (9, 10)
+            ]
+        )
+
+        first, second = ICalImporter(output_file).import_entries()
+
+        assert first.project is second.project
+        assert first.category is second.category
+        assert first.tags[0] is second.tags[0]
+
+    def test_iter_entries(self, tmp_path: Path) -> None:
+        """Test that entries can be consumed lazily."""
+        output_file = tmp_path / "export.ics"
+        ICalExporter(output_file).export_entries(
+            [Entry(task_name=f"Task {i}", start_time=datetime(2025, 1, 1, 9 + i)) for i in range(3)]
+        )
+
+        entries = ICalImporter(output_file).iter_entries()
+
+        assert next(entries).task_name == "Task 0"
+        assert [e.task_name for e in entries] == ["Task 1", "Task 2"]
+
+    def test_parse_events_streams_lines(self, tmp_path: Path) -> None:
+        """Test that events are yielded without reading ahead of the current one."""
+
+        def lines() -> Iterator[str]:
+            yield "BEGIN:VCALENDAR\r\n"
+            yield "BEGIN:VEVENT\r\n"
+            yield "DTSTART:20250101T100000Z\r\n"
+            yield "SUMMARY:First \r\n"
+            yield " event\r\n"
+            yield "END:VEVENT\r\n"
+            yield "BEGIN:VEVENT\r\n"  # one line of lookahead to rule out a fold
+            raise AssertionError("read past the first event")
+
+        events = ICalImporter(tmp_path / "unused.ics")._parse_events(lines())
+
+        assert next(events) == {"DTSTART": "20250101T100000Z", "SUMMARY": "First event"}
+
+    def test_parse_datetime(self, tmp_path: Path) -> None:
+        """Test parsing date-time, date-only and malformed values."""
+        importer = ICalImporter(tmp_path / "calendar.ics")
+
+        assert importer._parse_datetime("20250101T103045Z") == datetime(2025, 1, 1, 10, 30, 45)
+        assert importer._parse_datetime("20250101T103045") == datetime(2025, 1, 1, 10, 30, 45)
+        assert importer._parse_datetime("20250101") == datetime(2025, 1, 1)
+        assert importer._parse_datetime("20251301T103045Z") is None
+        assert importer._parse_datetime("2025-01-01") is None
+        assert importer._parse_datetime("") is None
+
+    def test_import_folded_lines(self, tmp_path: Path) -> None:
+        """Test that folded (wrapped) content lines are joined back together."""
+        input_file = tmp_path / "calendar.ics"
+        input_file.write_text(
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "DTSTART:20250101T100000Z\r\n"
+            "SUMMARY:A very long meeting title that a calendar application has wr\r\n"
+            " apped onto\r\n"
+            "\ta second and third line\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n",
+            newline="",
+        )
+
+        imported = ICalImporter(input_file).import_entries()
+
+        assert imported[0].task_name == (
+            "A very long meeting title that a calendar application has "
+            "wrapped ontoa second and third line"
+        )
@@ -143,3 +143,13 @@ class TestIdleDetector:
         idle_time = detector._get_idle_time_fallback()
 
         assert idle_time == 0
+
+    def test_next_check_delay(self) -> None:
+        """Test that active users are rechecked when the threshold could first be crossed."""
+        detector = IdleDetector(threshold=300)
+
+        assert detector._next_check_delay(idle_time=100, check_interval=5) == 200
+        assert detector._next_check_delay(idle_time=298, check_interval=5) == 5
+
+        detector._is_idle = True
+        assert detector._next_check_delay(idle_time=600, check_interval=5) == 5
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest  # type: ignore[import-not-found]
 
 from time_audit.core.models import Entry
-from time_audit.export_import import JSONExporter, JSONImporter
+from time_audit.export_import import JSONExporter, JSONImporter, json_format
 
 
 class TestJSONExporter:
@@ -360,3 +360,24 @@ class TestJSONImporter:
             assert imported.category == original.category
             assert imported.tags == original.tags
             assert imported.notes == original.notes
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_roundtrip_with_and_without_orjson(
+        self, tmp_path, monkeypatch, use_orjson, indent
+    ) -> None:
+        """Test that every indent roundtrips with orjson and with the stdlib fallback."""
+        if not use_orjson:
+            monkeypatch.setattr(json_format, "orjson", None)
+        elif json_format.orjson is None:
+            pytest.skip("orjson not installed")
+
+        export_file = tmp_path / "roundtrip.json"
+        original = Entry(task_name="Café ☕", start_time=datetime(2025, 1, 1, 10, 0))
+        JSONExporter(export_file).export_entries([original], indent=indent)
+
+        if indent:
+            assert f'\n{" " * indent}"entries"' in export_file.read_text(encoding="utf-8")
+        assert "Café ☕" in export_file.read_text(encoding="utf-8")
+        imported = JSONImporter(export_file).import_entries()
+        assert [e.task_name for e in imported] == [original.task_name]
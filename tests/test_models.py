@@ -1,9 +1,12 @@
 """Tests for core data models."""
 
+import sys
 from datetime import datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
 
+import pytest  # type: ignore[import-not-found]
+
 from time_audit.core.models import Category, Entry, Project
 
 
@@ -170,6 +173,52 @@ class TestEntry:
         assert restored.tags == original.tags
         assert restored.notes == original.notes
 
+    def test_from_dict_interns_repeated_strings(self) -> None:
+        """Test that repeated values share a single string object."""
+        original = Entry(
+            task_name="Test",
+            start_time=datetime(2025, 11, 16, 10, 0, 0),
+            project="test-project",
+            category="development",
+            tags=["backend"],
+            active_process="firefox",
+        )
+        data = original.to_dict()
+
+        # Build each row from fresh string copies, as the CSV reader would
+        first = Entry.from_dict(
+            {k: "".join(v) if isinstance(v, str) else v for k, v in data.items()}
+        )
+        second = Entry.from_dict(
+            {k: "".join(v) if isinstance(v, str) else v for k, v in data.items()}
+        )
+
+        assert first.project is second.project
+        assert first.category is second.category
+        assert first.tags[0] is second.tags[0]
+        assert first.active_process is second.active_process
+
+    def test_from_dict_missing_timestamps_default_to_now(self) -> None:
+        """Test that missing or empty created_at/updated_at fall back to now."""
+        data = Entry(task_name="Test", start_time=datetime(2025, 11, 16, 10, 0, 0)).to_dict()
+        del data["created_at"]
+        data["updated_at"] = ""
+
+        before = datetime.now()
+        entry = Entry.from_dict(data)
+
+        assert entry.created_at >= before
+        assert entry.updated_at >= before
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots require Python 3.10+")
+    def test_entry_has_no_instance_dict(self) -> None:
+        """Test that entries are slotted and reject unknown attributes."""
+        entry = Entry(task_name="Test", start_time=datetime(2025, 11, 16, 10, 0, 0))
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unknown_field = 1  # type: ignore[attr-defined]
+
 
 class TestProject:
     """Test Project model."""
@@ -1,5 +1,7 @@
 """Tests for process detection."""
 
+import threading
+import time
 from unittest.mock import Mock, patch
 
 from time_audit.automation.process_detector import ProcessDetector
@@ -151,6 +153,29 @@ class TestProcessDetector:
 
         assert not detector._running
 
+    def test_pause_and_resume(self) -> None:
+        """Test that a paused detector skips checks until resumed."""
+        on_change = Mock()
+        detector = ProcessDetector(interval=3600, on_process_change=on_change)
+        detector.pause()
+
+        with patch.object(detector, "get_active_process", return_value="vim"):
+            thread = threading.Thread(target=detector.start_monitoring)
+            thread.start()
+            try:
+                assert not on_change.called
+                detector.resume()
+                for _ in range(100):
+                    if on_change.called:
+                        break
+                    time.sleep(0.01)
+            finally:
+                detector.stop_monitoring()
+                thread.join(timeout=1)
+
+        on_change.assert_called_once_with(None, "vim")
+        assert not thread.is_alive()
+
     def test_current_process_property(self) -> None:
         """Test current_process property."""
         detector = ProcessDetector()
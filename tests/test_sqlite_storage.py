@@ -0,0 +1,181 @@
+"""Tests for SQLite storage backend."""
+
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest  # type: ignore[import-not-found]
+
+from time_audit.core.config import ConfigManager
+from time_audit.core.models import Category, Entry, ProcessRule, Project
+from time_audit.core.sqlite_storage import SqliteStorage
+from time_audit.core.storage import StorageManager, open_configured_storage, open_storage
+
+
+@pytest.fixture  # type: ignore[misc]
+def temp_storage() -> Iterator[SqliteStorage]:
+    """Create temporary SQLite storage for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteStorage(Path(tmpdir))
+        yield storage
+        storage.close()
+
+
+class TestSqliteStorage:
+    """Test SqliteStorage class."""
+
+    def test_entry_roundtrip(self, temp_storage: SqliteStorage) -> None:
+        """Test saving, updating and loading entries."""
+        entry = Entry(
+            task_name="Test",
+            start_time=datetime(2025, 11, 16, 10),
+            project="proj",
+            tags=["a", "b"],
+            manual_entry=True,
+        )
+        temp_storage.save_entry(entry)
+        assert temp_storage.get_current_entry() is not None
+
+        entry.end_time = datetime(2025, 11, 16, 11)
+        temp_storage.update_entry(entry)
+
+        loaded = temp_storage.get_entry(str(entry.id))
+        assert loaded is not None
+        assert loaded.task_name == "Test"
+        assert loaded.tags == ["a", "b"]
+        assert loaded.manual_entry is True
+        assert loaded.duration_seconds == 3600
+        assert temp_storage.get_current_entry() is None
+
+        assert temp_storage.delete_entry(str(entry.id)) is True
+        assert temp_storage.delete_entry(str(entry.id)) is False
+
+    def test_load_entries_filters_and_limit(self, temp_storage: SqliteStorage) -> None:
+        """Test that entries come back newest first, filtered before the limit."""
+        temp_storage.save_entries(
+            Entry(
+                task_name=f"h{hour}",
+                start_time=datetime(2025, 11, 16, hour),
+                project="even" if hour % 2 == 0 else "odd",
+            )
+            for hour in range(9, 15)
+        )
+
+        assert [e.task_name for e in temp_storage.load_entries(limit=2)] == ["h14", "h13"]
+        filtered = temp_storage.load_entries(
+            limit=2,
+            project="even",
+            start_date=datetime(2025, 11, 16, 10),
+            end_date=datetime(2025, 11, 16, 13),
+        )
+        assert [e.task_name for e in filtered] == ["h12", "h10"]
+
+    def test_projects_categories_rules(self, temp_storage: SqliteStorage) -> None:
+        """Test CRUD for projects, categories and rules."""
+        temp_storage.save_project(Project(id="p", name="P", hourly_rate=Decimal("150.00")))
+        temp_storage.save_project(Project(id="q", name="Q"))
+        temp_storage.update_project(Project(id="p", name="Renamed"))
+        assert [p.name for p in temp_storage.load_projects()] == ["Renamed", "Q"]
+        assert temp_storage.delete_project("q") is True
+
+        temp_storage.save_category(Category(id="dev", name="Dev", billable=False))
+        category = temp_storage.get_category("dev")
+        assert category is not None and category.billable is False
+
+        rule = ProcessRule(pattern="code", task_name="Coding", enabled=False)
+        temp_storage.save_rule(rule)
+        assert temp_storage.load_rules(enabled_only=True) == []
+        assert temp_storage.get_rule(rule.id) is not None
+        assert temp_storage.delete_rule(rule.id) is True
+
+    def test_backup(self, temp_storage: SqliteStorage) -> None:
+        """Test that backups contain the database."""
+        temp_storage.save_entry(Entry(task_name="Test", start_time=datetime(2025, 11, 16, 10)))
+
+        backup_path = temp_storage.backup(label="test-backup")
+
+        restored = SqliteStorage(backup_path)
+        assert len(restored.load_entries()) == 1
+        restored.close()
+
+
+def test_open_storage_migrates_csv_data() -> None:
+    """Test that selecting the SQLite backend migrates existing CSV data."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir) / "data"
+        csv_storage = StorageManager(data_dir)
+        csv_storage.save_entry(Entry(task_name="Old", start_time=datetime(2025, 11, 16, 9)))
+        csv_storage.save_project(Project(id="p", name="P"))
+
+        storage = open_storage(data_dir, backend="sqlite")
+
+        assert isinstance(storage, SqliteStorage)
+        assert [e.task_name for e in storage.load_entries()] == ["Old"]
+        assert storage.get_project("p") is not None
+        storage.close()
+
+
+def test_open_storage_warns_about_csv_changes_after_migration(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that CSV entries written after the migration are reported."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir) / "data"
+        StorageManager(data_dir).save_entry(
+            Entry(task_name="Old", start_time=datetime(2025, 11, 16, 9))
+        )
+        open_storage(data_dir, backend="sqlite").close()
+
+        with caplog.at_level(logging.WARNING, logger="time_audit.core.storage"):
+            open_storage(data_dir, backend="sqlite").close()
+            assert caplog.records == []
+
+            # Written while the backend was switched back to CSV
+            StorageManager(data_dir).save_entry(
+                Entry(task_name="New", start_time=datetime(2025, 11, 17, 9))
+            )
+            db_mtime = (data_dir / "time_audit.db").stat().st_mtime
+            os.utime(data_dir / "entries.csv", (db_mtime + 1, db_mtime + 1))
+            open_storage(data_dir, backend="sqlite").close()
+
+        assert "not in the SQLite database" in caplog.text
+
+
+def test_open_configured_storage_selects_backend() -> None:
+    """Test that the backend comes from advanced.storage_backend."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = ConfigManager(Path(tmpdir) / "config.yml")
+
+        assert isinstance(open_configured_storage(Path(tmpdir) / "csv", config), StorageManager)
+
+        config.set("advanced.storage_backend", "sqlite")
+        storage = open_configured_storage(Path(tmpdir) / "sqlite", config)
+
+        assert isinstance(storage, SqliteStorage)
+        storage.close()
+
+
+def test_failed_migration_leaves_no_database() -> None:
+    """Test that a failed migration is retried instead of opening an empty database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir) / "data"
+        StorageManager(data_dir).save_entry(
+            Entry(task_name="Old", start_time=datetime(2025, 11, 16, 9))
+        )
+
+        with patch("time_audit.core.sqlite_storage._entry_row", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                open_storage(data_dir, backend="sqlite")
+
+        assert list(data_dir.glob("time_audit.db*")) == []
+
+        storage = open_storage(data_dir, backend="sqlite")
+
+        assert [e.task_name for e in storage.load_entries()] == ["Old"]
+        assert not (data_dir / "time_audit.db.migrating").exists()
+        storage.close()
@@ -1,12 +1,14 @@
 """Tests for storage manager."""
 
+import csv
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 
 import pytest  # type: ignore[import-not-found]
 
-from time_audit.core.models import Category, Entry, Project
+from time_audit.core.models import Category, Entry, ProcessRule, Project
 from time_audit.core.storage import StorageManager
 
 
@@ -221,6 +223,16 @@ class TestStorageManager:
         assert backup_path.exists()
         assert (backup_path / "entries.csv").exists()
 
+    def test_backup_is_independent_of_later_appends(self, temp_storage: StorageManager) -> None:
+        """Test that appending to a data file doesn't change an earlier backup."""
+        temp_storage.save_entry(Entry(task_name="First", start_time=datetime(2025, 11, 16, 9)))
+        backup_path = temp_storage.backup(label="before-append")
+        snapshot = temp_storage.entries_file.read_bytes()
+
+        temp_storage.save_entry(Entry(task_name="Second", start_time=datetime(2025, 11, 16, 10)))
+
+        assert (backup_path / "entries.csv").read_bytes() == snapshot
+
     def test_concurrent_access_safety(self, temp_storage: StorageManager) -> None:
         """Test that concurrent writes don't corrupt data."""
         # This is a basic test - full concurrency testing would require
@@ -249,3 +261,387 @@ class TestStorageManager:
         assert loaded.category is None
         assert loaded.notes is None
         assert loaded.tags == []
+
+    def test_load_entries_sees_writes_from_other_instances(
+        self, temp_storage: StorageManager
+    ) -> None:
+        """Test that cached entries are refreshed when another writer changes the file."""
+        temp_storage.save_entry(Entry(task_name="First", start_time=datetime(2025, 11, 16, 9)))
+        assert len(temp_storage.load_entries()) == 1
+
+        other = StorageManager(temp_storage.data_dir)
+        other.save_entry(Entry(task_name="Second", start_time=datetime(2025, 11, 16, 10)))
+
+        entries = temp_storage.load_entries()
+        assert [e.task_name for e in entries] == ["Second", "First"]
+
+    def test_loaded_entries_are_independent_copies(self, temp_storage: StorageManager) -> None:
+        """Test that mutating a loaded entry doesn't leak into later loads."""
+        temp_storage.save_entry(Entry(task_name="Original", start_time=datetime.now()))
+
+        loaded = temp_storage.load_entries()[0]
+        loaded.task_name = "Changed"
+        loaded.tags.append("leaked")
+
+        reloaded = temp_storage.load_entries()[0]
+        assert reloaded.task_name == "Original"
+        assert reloaded.tags == []
+
+    def test_boolean_fields_roundtrip(self, temp_storage: StorageManager) -> None:
+        """Test that False flags stay False after a CSV round-trip."""
+        temp_storage.save_entry(Entry(task_name="Tracked", start_time=datetime.now()))
+
+        fresh = StorageManager(temp_storage.data_dir)
+        loaded = fresh.load_entries()[0]
+
+        assert loaded.manual_entry is False
+        assert loaded.edited is False
+        assert loaded.auto_tracked is False
+
+    def test_get_current_entry_cold_and_cached(self, temp_storage: StorageManager) -> None:
+        """Test that the running entry is found both from disk and from the cache."""
+        temp_storage.save_entry(
+            Entry(
+                task_name="Stopped",
+                start_time=datetime(2025, 11, 16, 9),
+                end_time=datetime(2025, 11, 16, 10),
+            )
+        )
+        temp_storage.save_entry(Entry(task_name="Running", start_time=datetime(2025, 11, 16, 10)))
+
+        cold = StorageManager(temp_storage.data_dir).get_current_entry()
+        assert cold is not None
+        assert cold.task_name == "Running"
+
+        temp_storage.load_entries()  # Warm the cache
+        cached = temp_storage.get_current_entry()
+        assert cached is not None
+        assert cached.id == cold.id
+
+    def test_cached_entries_match_disk(self, temp_storage: StorageManager) -> None:
+        """Test that saved entries come back from the cache as a fresh read would."""
+        temp_storage.load_entries()  # Warm the cache
+        temp_storage.save_entry(
+            Entry(
+                task_name="One",
+                start_time=datetime(2025, 11, 16, 9),
+                project="",
+                tags=[" a ", "b,c"],
+                notes="",
+            )
+        )
+        temp_storage.save_entries(
+            [Entry(task_name="Two", start_time=datetime(2025, 11, 16, 10), tags=[" x"])]
+        )
+
+        def fields(storage: StorageManager) -> list[tuple]:
+            return [(e.project, e.tags, e.notes) for e in storage.load_entries()]
+
+        assert fields(temp_storage) == fields(StorageManager(temp_storage.data_dir))
+        assert fields(temp_storage) == [(None, ["x"], None), (None, ["a", "b", "c"], None)]
+
+    def test_current_pointer_tracks_running_entry(self, temp_storage: StorageManager) -> None:
+        """Test that the running entry pointer is set on start and cleared on stop/delete."""
+        entry = Entry(task_name="Running", start_time=datetime(2025, 11, 16, 10))
+        temp_storage.save_entry(entry)
+        assert temp_storage.current_file.read_text() == str(entry.id)
+
+        entry.end_time = datetime(2025, 11, 16, 11)
+        temp_storage.save_entry(entry)
+        assert temp_storage.current_file.read_text() == ""
+        assert temp_storage.get_current_entry() is None
+
+        other = Entry(task_name="Other", start_time=datetime(2025, 11, 16, 12))
+        temp_storage.save_entry(other)
+        temp_storage.delete_entry(str(other.id))
+        assert temp_storage.current_file.read_text() == ""
+
+    def test_current_pointer_repair_races_saves(self, temp_storage: StorageManager) -> None:
+        """Test that pointer repairs running alongside saves never fail or lose the entry."""
+        errors: list[BaseException] = []
+        done = threading.Event()
+
+        def writer() -> None:
+            storage = StorageManager(temp_storage.data_dir)
+            try:
+                for hour in range(20):
+                    entry = Entry(task_name="Race", start_time=datetime(2025, 11, 16, hour))
+                    storage.save_entry(entry)
+                    entry.end_time = datetime(2025, 11, 16, hour, 30)
+                    storage.save_entry(entry)
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                done.set()
+
+        def repairer() -> None:
+            storage = StorageManager(temp_storage.data_dir)
+            try:
+                while not done.is_set():
+                    storage.current_file.unlink(missing_ok=True)
+                    storage.get_current_entry()
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer), threading.Thread(target=repairer)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        running = Entry(task_name="Running", start_time=datetime(2025, 11, 17, 9))
+        temp_storage.save_entry(running)
+        current = StorageManager(temp_storage.data_dir).get_current_entry()
+        assert current is not None and current.id == running.id
+        assert not list(temp_storage.state_dir.glob("*.tmp"))
+
+    def test_missing_current_pointer_is_rebuilt(self, temp_storage: StorageManager) -> None:
+        """Test that data written without a pointer file still finds the running entry."""
+        entry = Entry(task_name="Running", start_time=datetime(2025, 11, 16, 10))
+        temp_storage.save_entry(entry)
+        temp_storage.current_file.unlink()
+
+        current = StorageManager(temp_storage.data_dir).get_current_entry()
+        assert current is not None
+        assert current.id == entry.id
+        assert temp_storage.current_file.read_text() == str(entry.id)
+
+    def test_find_row_ignores_matches_inside_quoted_fields(
+        self, temp_storage: StorageManager
+    ) -> None:
+        """Test id lookups skip look-alike text in multi-line fields."""
+        temp_storage.save_project(
+            Project(id="decoy", name="Decoy", description="line one\nwork,not a row")
+        )
+        temp_storage.save_project(Project(id="work", name="Work", description="a\nb"))
+        temp_storage.save_project(Project(id="a,b", name="Quoted"))
+
+        work = temp_storage.get_project("work")
+        assert work is not None
+        assert work.name == "Work"
+        assert work.description == "a\nb"
+
+        quoted = temp_storage.get_project("a,b")
+        assert quoted is not None
+        assert quoted.name == "Quoted"
+
+        assert temp_storage.get_project("missing") is None
+        assert temp_storage.delete_project("missing") is False
+
+    def test_group_fsync_policy_defers_flush(self, temp_storage: StorageManager) -> None:
+        """Test that group commit queues written files until flushed."""
+        from time_audit.core.storage import _group_commit
+
+        assert temp_storage.fsync_policy == "group"
+        temp_storage.save_entry(Entry(task_name="Test", start_time=datetime(2025, 11, 16, 10)))
+        temp_storage.flush()
+
+        assert temp_storage.entries_file not in _group_commit._pending
+        assert not _group_commit._wake.is_set()  # Flusher sleeps until the next write
+        assert len(temp_storage.load_entries()) == 1
+
+        temp_storage.save_entry(Entry(task_name="Next", start_time=datetime(2025, 11, 16, 11)))
+        assert _group_commit._wake.is_set()
+
+    def test_invalid_fsync_policy(self, temp_storage: StorageManager) -> None:
+        """Test that unknown fsync policies are rejected."""
+        with pytest.raises(ValueError):
+            StorageManager(temp_storage.data_dir, fsync_policy="sometimes")  # type: ignore[arg-type]
+
+    def test_new_entries_are_appended(self, temp_storage: StorageManager) -> None:
+        """Test that saving a new entry appends without touching existing rows."""
+        first = Entry(task_name="First", start_time=datetime(2025, 11, 16, 9))
+        temp_storage.save_entry(first)
+        before = temp_storage.entries_file.read_bytes()
+        # Strip the trailing newline, as a hand edit might
+        temp_storage.entries_file.write_bytes(before.rstrip(b"\r\n"))
+
+        temp_storage.save_entry(Entry(task_name="Second", start_time=datetime(2025, 11, 16, 10)))
+
+        assert temp_storage.entries_file.read_bytes().startswith(before)
+        assert [e.task_name for e in temp_storage.load_entries()] == ["Second", "First"]
+
+    def test_save_entry_upgrades_legacy_header(self, temp_storage: StorageManager) -> None:
+        """Test that files with an older column layout are rewritten, not appended to."""
+        temp_storage.entries_file.write_text(
+            "id,start_time,end_time,duration_seconds,task_name,project,category,tags,notes,"
+            "active_process,active_window,idle_time_seconds,manual_entry,edited,"
+            "created_at,updated_at\n",
+            encoding="utf-8",
+        )
+
+        temp_storage.save_entry(Entry(task_name="Test", start_time=datetime(2025, 11, 16, 10)))
+
+        header = temp_storage.entries_file.read_text(encoding="utf-8").splitlines()[0]
+        assert "rule_id" in header
+        assert len(temp_storage.load_entries()) == 1
+
+    def test_read_csv_cache_tracks_file_changes(self, temp_storage: StorageManager) -> None:
+        """Test that cached rows are reused until another writer changes the file."""
+        temp_storage.save_project(Project(id="one", name="One"))
+        first = temp_storage._read_csv(temp_storage.projects_file)
+        second = temp_storage._read_csv(temp_storage.projects_file)
+        assert first == second
+        assert first is not second
+
+        StorageManager(temp_storage.data_dir).save_project(Project(id="two", name="Two"))
+
+        assert [p.id for p in temp_storage.load_projects()] == ["one", "two"]
+        assert temp_storage.get_project("two") is not None
+
+    def test_update_keeps_row_order(self, temp_storage: StorageManager) -> None:
+        """Test that updating a row rewrites it in place rather than moving it."""
+        for project_id in ("a", "b", "c"):
+            temp_storage.save_project(Project(id=project_id, name=project_id.upper()))
+
+        temp_storage.update_project(Project(id="b", name="Renamed"))
+        assert temp_storage.delete_project("c") is True
+
+        projects = temp_storage.load_projects()
+        assert [(p.id, p.name) for p in projects] == [("a", "A"), ("b", "Renamed")]
+
+    def test_entry_rewrites_stream_from_disk(self, temp_storage: StorageManager) -> None:
+        """Test that entry updates and deletes on a cold cache keep file order."""
+        entries = [
+            Entry(task_name=name, start_time=datetime(2025, 11, 16, hour))
+            for hour, name in enumerate(("a", "b", "c"), start=9)
+        ]
+        temp_storage.save_entries(entries)
+
+        cold = StorageManager(temp_storage.data_dir)
+        entries[1].task_name = "renamed"
+        cold.update_entry(entries[1])
+        assert StorageManager(temp_storage.data_dir).delete_entry(str(entries[2].id)) is True
+
+        with open(temp_storage.entries_file, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["task_name"] for row in rows] == ["a", "renamed"]
+
+    def test_load_entries_limit_cold_and_cached(self, temp_storage: StorageManager) -> None:
+        """Test that limited loads return the most recent entries with or without the cache."""
+        for hour in (11, 9, 13, 10, 12):
+            temp_storage.save_entry(
+                Entry(task_name=f"h{hour}", start_time=datetime(2025, 11, 16, hour))
+            )
+
+        cold = StorageManager(temp_storage.data_dir).load_entries(limit=3)
+        temp_storage.load_entries()  # Warm the cache
+        cached = temp_storage.load_entries(limit=3)
+
+        assert [e.task_name for e in cold] == ["h13", "h12", "h11"]
+        assert [e.task_name for e in cached] == ["h13", "h12", "h11"]
+
+    def test_load_entries_filters_before_limit(self, temp_storage: StorageManager) -> None:
+        """Test that filters apply before the limit, with and without the cache."""
+        for hour in range(9, 15):
+            temp_storage.save_entry(
+                Entry(
+                    task_name=f"h{hour}",
+                    start_time=datetime(2025, 11, 16, hour),
+                    project="even" if hour % 2 == 0 else "odd",
+                )
+            )
+
+        kwargs: dict = {
+            "limit": 2,
+            "project": "even",
+            "start_date": datetime(2025, 11, 16, 10),
+            "end_date": datetime(2025, 11, 16, 13),
+        }
+        cold = StorageManager(temp_storage.data_dir).load_entries(**kwargs)
+        temp_storage.load_entries()  # Warm the cache
+        cached = temp_storage.load_entries(**kwargs)
+
+        assert [e.task_name for e in cold] == ["h12", "h10"]
+        assert [e.task_name for e in cached] == ["h12", "h10"]
+
+    def test_save_entries_merges_and_replaces(self, temp_storage: StorageManager) -> None:
+        """Test bulk saves update existing entries, add new ones, or replace all."""
+        existing = Entry(task_name="Existing", start_time=datetime(2025, 11, 16, 9))
+        temp_storage.save_entry(existing)
+        temp_storage.load_entries()  # Warm the cache
+
+        existing.task_name = "Updated"
+        running = Entry(task_name="Running", start_time=datetime(2025, 11, 16, 10))
+        temp_storage.save_entries([existing, running])
+
+        assert [e.task_name for e in temp_storage.load_entries()] == ["Running", "Updated"]
+        current = StorageManager(temp_storage.data_dir).get_current_entry()
+        assert current is not None and current.id == running.id
+
+        temp_storage.save_entries(
+            [
+                Entry(
+                    task_name="Imported",
+                    start_time=datetime(2025, 11, 16, 11),
+                    end_time=datetime(2025, 11, 16, 12),
+                )
+            ],
+            replace=True,
+        )
+        assert [e.task_name for e in temp_storage.load_entries()] == ["Imported"]
+        assert temp_storage.get_current_entry() is None
+
+    def test_save_rules(self, temp_storage: StorageManager) -> None:
+        """Test bulk saving of process rules."""
+        rules = [ProcessRule(pattern=f"proc{i}", task_name=f"Task {i}") for i in range(3)]
+        temp_storage.save_rules(rules)
+
+        rules[0].match_count = 5
+        temp_storage.save_rules([rules[0]])
+
+        loaded = temp_storage.load_rules()
+        assert [r.pattern for r in loaded] == ["proc0", "proc1", "proc2"]
+        assert loaded[0].match_count == 5
+
+    def test_concurrent_writers_do_not_lose_updates(self, temp_storage: StorageManager) -> None:
+        """Test that read-modify-write cycles from separate instances are serialized."""
+
+        def worker(n: int) -> None:
+            storage = StorageManager(temp_storage.data_dir)
+            for i in range(5):
+                entry = Entry(task_name=f"w{n}-{i}", start_time=datetime(2025, 11, 16, 9))
+                storage.save_entry(entry)
+                entry.end_time = datetime(2025, 11, 16, 10)
+                storage.save_entry(entry)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        entries = StorageManager(temp_storage.data_dir).load_entries()
+        assert len(entries) == 20
+        assert all(e.end_time is not None for e in entries)
+
+    def test_read_shares_repeated_column_values(self, temp_storage: StorageManager) -> None:
+        """Test that repeated values in low-cardinality columns share one string."""
+        for hour in (9, 10):
+            temp_storage.save_entry(
+                Entry(
+                    task_name="Same task",
+                    start_time=datetime(2025, 11, 16, hour),
+                    active_window="Editor",
+                )
+            )
+
+        first, second = StorageManager(temp_storage.data_dir)._read_csv(temp_storage.entries_file)
+        assert first["task_name"] is second["task_name"]
+        assert first["active_window"] is second["active_window"]
+
+    def test_read_csv_handles_short_rows_and_multiline_fields(
+        self, temp_storage: StorageManager
+    ) -> None:
+        """Test parsing of hand-edited rows and quoted line breaks."""
+        temp_storage.save_project(Project(id="multi", name="Multi", description="a\r\nb"))
+        with open(temp_storage.projects_file, "a", encoding="utf-8", newline="") as f:
+            f.write("short,Short\r\n\r\n")
+
+        rows = StorageManager(temp_storage.data_dir)._read_csv(temp_storage.projects_file)
+
+        assert rows[0]["description"] == "a\r\nb"
+        assert rows[1]["name"] == "Short"
+        assert rows[1]["client"] is None
+        assert len(rows) == 2
@@ -3,6 +3,7 @@
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import pytest  # type: ignore[import-not-found]
 
@@ -112,6 +113,35 @@ class TestTimeTracker:
 
         assert result is True
         assert tracker.status() is None
+        assert tracker.storage.current_file.read_text() == ""
+
+    def test_listeners_see_running_entry_changes(self, tracker: TimeTracker) -> None:
+        """Test that listeners are told about each change of the running entry."""
+        seen: list[Optional[str]] = []
+        tracker.add_listener(lambda entry: seen.append(entry.task_name if entry else None))
+
+        tracker.start("First")
+        tracker.switch("Second")
+        tracker.stop()
+        tracker.start("Third")
+        tracker.cancel_current()
+
+        assert seen == ["First", None, "Second", None, "Third", None]
+
+    def test_listeners_see_running_entry_deleted(self, tracker: TimeTracker) -> None:
+        """Test that deleting the running entry is reported, and other deletes are not."""
+        seen: list[Optional[str]] = []
+        tracker.add_listener(lambda entry: seen.append(entry.task_name if entry else None))
+
+        stopped = tracker.start("Stopped")
+        tracker.stop()
+        running = tracker.start("Running")
+        seen.clear()
+
+        assert tracker.delete_entry(str(stopped.id)) is True
+        assert seen == []
+        assert tracker.delete_entry(str(running.id)) is True
+        assert seen == [None]
 
     def test_cancel_when_not_running(self, tracker: TimeTracker) -> None:
         """Test cancel when nothing is running."""